@@ -0,0 +1,591 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmarks for the game's hot paths.
+
+Usage:
+    python benchmark.py            # run every benchmark
+    python benchmark.py worldgen   # run only the named benchmarks
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "src"))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+benchmarks = {}
+
+def benchmark(name):
+    """Register a benchmark function under a name"""
+    def register(function):
+        benchmarks[name] = function
+        return function
+    return register
+
+def measure(function, repeat=200):
+    """Return the average time of one call in milliseconds"""
+    function()  # Warm up caches
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - start) / repeat * 1000
+
+def report(label, milliseconds, baseline=None):
+    line = f"  {label:<40} {milliseconds:10.4f} ms"
+    if baseline:
+        line += f"   ({baseline / milliseconds:6.1f}x)"
+    print(line)
+
+@benchmark("worldgen")
+def bench_worldgen():
+    import random
+    import numpy as np
+    from block import BLOCK_IDS
+    from constants import CHUNK_HEIGHT, CHUNK_WIDTH
+    from worldgen import generate_chunk_types, noise_ranges
+
+    def per_cell_chunk():
+        # Previous generator: one random.uniform and a linear range scan per cell
+        types = np.empty((CHUNK_HEIGHT, CHUNK_WIDTH), dtype=np.uint8)
+        for y in range(CHUNK_HEIGHT):
+            for x in range(CHUNK_WIDTH):
+                if x == 0 or x == CHUNK_WIDTH - 1:
+                    types[y, x] = BLOCK_IDS["bedrock"]
+                    continue
+                noise_value = random.uniform(-1, 1)
+                block = "stone"
+                for name, min_val, max_val in noise_ranges:
+                    if min_val <= noise_value < max_val:
+                        block = name
+                        break
+                types[y, x] = BLOCK_IDS[block]
+        return types
+
+    chunk_ys = iter(range(1, 10 ** 9))
+    baseline = measure(per_cell_chunk)
+    report("per-cell random (per chunk)", baseline)
+    report("vectorized noise (per chunk)", measure(lambda: generate_chunk_types(next(chunk_ys))), baseline)
+    report("vectorized noise, batch of 16 (per chunk)", measure(lambda: generate_chunk_types(next(chunk_ys), 16), 50) / 16, baseline)
+
+@benchmark("prefetch")
+def bench_prefetch():
+    import chunk as world
+    from worldgen import generate_chunk_types
+
+    chunk_ys = iter(range(1, 10 ** 9))
+
+    def on_the_spot():
+        # Crossing a chunk boundary used to build the new chunk inside the draw loop
+        world.get_chunk(0, next(chunk_ys), None, None)
+
+    rows = {}
+    def commit_prefetched():
+        # With the prefetcher the main thread only wraps finished arrays
+        chunk_y = next(chunk_ys)
+        world.add_chunk_row(chunk_y, rows[chunk_y], None, None)
+
+    baseline = measure(on_the_spot)
+    first = next(chunk_ys)
+    for chunk_y, types in enumerate(generate_chunk_types(first, 300), first):
+        rows[chunk_y] = types
+    chunk_ys = iter(range(first, 10 ** 9))
+    report("generate row on the main thread", baseline)
+    report("commit prefetched row", measure(commit_prefetched), baseline)
+    world.chunks.clear()
+
+@benchmark("explosion")
+def bench_explosion():
+    import math
+    import random
+    import chunk as world
+    from constants import BLOCK_SIZE, CHUNK_HEIGHT
+    from damage import ExplosionDamage
+    from spatial import blocks_in_radius
+
+    world.chunks.clear()
+    for chunk_y in range(0, 6):
+        world.get_chunk(0, chunk_y, None, None)
+
+    radius = 3 * BLOCK_SIZE
+    positions = [(random.uniform(0, 9 * BLOCK_SIZE), random.uniform(2, 4) * CHUNK_HEIGHT * BLOCK_SIZE) for _ in range(20)]
+
+    def full_scan(count):
+        # Original Tnt.explode: every block of every loaded chunk
+        for x, y in positions[:count]:
+            for chunk in world.chunks.values():
+                for block in chunk.iter_blocks():
+                    distance = math.hypot(block.position[0] - x, block.position[1] - y)
+                    if distance <= radius:
+                        block.hp -= int(100 * (1 - (distance / radius)))
+
+    def radius_loop(count):
+        # Per-block loop over the spatial index
+        for x, y in positions[:count]:
+            for block, distance in blocks_in_radius(x, y, radius):
+                block.hp -= int(100 * (1 - (distance / radius)))
+
+    def kernel(count):
+        damage = ExplosionDamage()
+        for x, y in positions[:count]:
+            damage.add(x, y, radius, 100)
+        damage.apply()
+
+    for count in (1, 20):
+        baseline = measure(lambda: full_scan(count), 10)
+        report(f"{count} TNT, full scan loop", baseline)
+        report(f"{count} TNT, radius query loop", measure(lambda: radius_loop(count), 50), baseline)
+        report(f"{count} TNT, damage kernel", measure(lambda: kernel(count)), baseline)
+    world.chunks.clear()
+
+def load_game_atlas():
+    """Texture atlas scaled to block size, as the game loads it"""
+    import pygame
+    from asset_registry import asset_registry
+    from constants import INTERNAL_HEIGHT, INTERNAL_WIDTH
+
+    pygame.init()
+    pygame.display.set_mode((INTERNAL_WIDTH // 2, INTERNAL_HEIGHT // 2))
+    return asset_registry.atlas()
+
+@benchmark("assets")
+def bench_assets():
+    import pygame
+    from asset_registry import ASSETS_DIR, AssetRegistry
+    from atlas import create_texture_atlas
+    from constants import BLOCK_SCALE_FACTOR
+
+    load_game_atlas()
+
+    def scaled_atlas():
+        texture_atlas, atlas_items = create_texture_atlas(ASSETS_DIR)
+        return pygame.transform.scale(texture_atlas, (texture_atlas.get_width() * BLOCK_SCALE_FACTOR,
+                                                      texture_atlas.get_height() * BLOCK_SCALE_FACTOR)), atlas_items
+
+    def separate_loads():
+        # Previous startup: main and the right panel each build and scale the atlas, icons scaled per use
+        for _ in range(2):
+            texture_atlas, atlas_items = scaled_atlas()
+        for name in ("tnt", "mega_tnt"):
+            rect = [value * BLOCK_SCALE_FACTOR for value in atlas_items["block"][name]]
+            pygame.transform.scale(texture_atlas.subsurface(rect), (24, 24))
+
+    def registry():
+        assets = AssetRegistry()
+        assets.atlas()
+        for name in ("tnt", "mega_tnt"):
+            assets.texture("block", name, "panel")
+        assets.texture("block", "mega_tnt", "mega")
+
+    baseline = measure(separate_loads, 5)
+    report("atlas built twice + icons", baseline)
+    report("asset registry, loaded once", measure(registry, 5), baseline)
+
+@benchmark("atlas")
+def bench_atlas():
+    import tempfile
+    from asset_registry import ASSETS_DIR
+    from atlas import create_texture_atlas, load_texture_atlas, scale_texture_atlas
+    from constants import BLOCK_SCALE_FACTOR
+
+    load_game_atlas()
+    cache_dir = tempfile.mkdtemp()
+
+    def cold_start():
+        scale_texture_atlas(*create_texture_atlas(ASSETS_DIR), BLOCK_SCALE_FACTOR)
+
+    baseline = measure(cold_start, 20)
+    report("decode, pack and scale", baseline)
+    report("prebaked atlas from the cache", measure(lambda: load_texture_atlas(ASSETS_DIR, BLOCK_SCALE_FACTOR, cache_dir), 20), baseline)
+    scaled_atlas = load_texture_atlas(ASSETS_DIR, BLOCK_SCALE_FACTOR, cache_dir)[2]
+    print(f"  scaled atlas: {scaled_atlas.get_width()}x{scaled_atlas.get_height()}, "
+          f"{scaled_atlas.get_width() * scaled_atlas.get_height() * 4 / 2**20:.1f} MiB")
+
+@benchmark("chunk_draw")
+def bench_chunk_draw():
+    import random
+    import numpy as np
+    import pygame
+    import chunk as world
+    from camera import Camera
+    from constants import BLOCK_SIZE, CHUNK_HEIGHT, INTERNAL_HEIGHT, INTERNAL_WIDTH
+
+    texture_atlas, atlas_items = load_game_atlas()
+    screen = pygame.Surface((INTERNAL_WIDTH, INTERNAL_HEIGHT))
+    camera = Camera()
+    camera.offset_y = 3.5 * CHUNK_HEIGHT * BLOCK_SIZE  # Two chunk rows on screen
+    world.chunks.clear()
+    visible = [world.get_chunk(0, chunk_y, texture_atlas, atlas_items) for chunk_y in range(2, 6)]
+
+    def per_block():
+        # Previous Chunk.draw: one blit per block plus one per damage overlay
+        block_textures, destroy_stages = world.get_block_textures(texture_atlas, atlas_items)
+        for chunk in visible:
+            stages = chunk.stages()
+            for y, x in zip(*np.nonzero(stages > -2)):
+                position = (x * BLOCK_SIZE - camera.offset_x, (chunk.chunk_y * CHUNK_HEIGHT + y) * BLOCK_SIZE - camera.offset_y)
+                screen.blit(block_textures[chunk.types[y, x]], position)
+                if stages[y, x] >= 0:
+                    screen.blit(destroy_stages[stages[y, x]], position)
+
+    def cached():
+        # A few blocks get hit every frame
+        chunk = random.choice(visible[1:3])
+        chunk.hp[random.randrange(CHUNK_HEIGHT), random.randrange(1, 8)] -= 1
+        for chunk in visible:
+            chunk.draw(screen, camera)
+
+    baseline = measure(per_block, 50)
+    report("per-block blits", baseline)
+    report("cached chunk surfaces", measure(cached, 200), baseline)
+
+    # TNT storm: every block of a chunk changes destroy stage at once
+    block_textures, destroy_stages = world.get_block_textures(texture_atlas, atlas_items)
+    cells = [(x, y, random.randrange(1, len(block_textures)), random.randrange(10)) for y in range(CHUNK_HEIGHT) for x in range(9)]
+    target = pygame.Surface((9 * BLOCK_SIZE, CHUNK_HEIGHT * BLOCK_SIZE))
+
+    def two_blits():
+        for x, y, block_type, stage in cells:
+            target.blit(block_textures[block_type], (x * BLOCK_SIZE, y * BLOCK_SIZE))
+            target.blit(destroy_stages[stage], (x * BLOCK_SIZE, y * BLOCK_SIZE))
+
+    def composited():
+        for x, y, block_type, stage in cells:
+            target.blit(world.damaged_textures.get(texture_atlas, atlas_items, block_type, stage), (x * BLOCK_SIZE, y * BLOCK_SIZE))
+
+    baseline = measure(two_blits, 50)
+    report("redraw 144 damaged cells, 2 blits each", baseline)
+    report("redraw 144 damaged cells, composited", measure(composited, 50), baseline)
+    print(f"  damaged texture cache: {world.damaged_textures.stats()}")
+    world.chunks.clear()
+
+@benchmark("tnt_draw")
+def bench_tnt_draw():
+    import math
+    import random
+    import pygame
+    import pymunk
+    from camera import Camera
+    from constants import INTERNAL_HEIGHT, INTERNAL_WIDTH
+    from tnt import Tnt
+
+    class SilentSound:
+        def play_sound(self, name):
+            pass
+
+    texture_atlas, atlas_items = load_game_atlas()
+    screen = pygame.Surface((INTERNAL_WIDTH, INTERNAL_HEIGHT))
+    camera = Camera()
+    space = pymunk.Space()
+    tnts = [Tnt(space, random.uniform(100, INTERNAL_WIDTH - 100), random.uniform(100, INTERNAL_HEIGHT - 100),
+                texture_atlas, atlas_items, SilentSound(), rotation=random.uniform(-10, 10)) for _ in range(40)]
+
+    def per_frame_surfaces():
+        # Previous Tnt.draw: rotate the texture and a freshly built white overlay every frame
+        for tnt in tnts:
+            tnt.body.angle += random.choice([0.01, -0.01])
+            rotated_image = pygame.transform.rotate(tnt.texture, -math.degrees(tnt.body.angle))
+            screen.blit(rotated_image, rotated_image.get_rect(center=tnt.body.position))
+            white_overlay = pygame.Surface(tnt.texture.get_size(), pygame.SRCALPHA)
+            white_overlay.fill((255, 255, 255, 100))
+            rotated_overlay = pygame.transform.rotate(white_overlay, -math.degrees(tnt.body.angle))
+            screen.blit(rotated_overlay, rotated_overlay.get_rect(center=tnt.body.position))
+
+    def cached_sprites():
+        for tnt in tnts:
+            tnt.body.angle += random.choice([0.01, -0.01])
+            tnt.draw(screen, camera)
+
+    baseline = measure(per_frame_surfaces, 50)
+    report("40 TNT, per-frame rotate + overlay", baseline)
+    report("40 TNT, cached rotated blink frames", measure(cached_sprites, 200), baseline)
+
+@benchmark("world_frame")
+def bench_world_frame():
+    import pygame
+    import chunk as world
+    from camera import Camera
+    from constants import BLOCK_SIZE, CHUNK_HEIGHT, CHUNK_WIDTH, INTERNAL_HEIGHT, INTERNAL_WIDTH
+
+    texture_atlas, atlas_items = load_game_atlas()
+    screen = pygame.Surface((INTERNAL_WIDTH, INTERNAL_HEIGHT))
+    chunk_pixels = CHUNK_HEIGHT * BLOCK_SIZE
+    frames = 400
+    speed = 40  # Camera scroll in px per frame, through fresh chunks
+
+    def chunk_rows(camera):
+        # Rows the main loop draws: from above the pickaxe to below the screen, as in the old loop
+        pickaxe_y = camera.offset_y + INTERNAL_HEIGHT // 2
+        return range(int(pickaxe_y // chunk_pixels - 1) - 1, int(pickaxe_y + INTERNAL_HEIGHT) // chunk_pixels + 1)
+
+    def scroll(draw_chunk):
+        world.chunks.clear()
+        camera = Camera()
+        camera.offset_y = 2 * chunk_pixels
+        start = time.perf_counter()
+        for _ in range(frames):
+            camera.offset_y += speed
+            for chunk_y in chunk_rows(camera):
+                for chunk_x in range(-1, 2):
+                    chunk = world.get_chunk(chunk_x, chunk_y, texture_atlas, atlas_items)
+                    if chunk is not None:
+                        draw_chunk(chunk, camera)
+        return (time.perf_counter() - start) / frames * 1000
+
+    def per_block(chunk, camera):
+        # Original loop: one blit per block of every chunk row, on screen or not
+        block_textures, _ = world.get_block_textures(texture_atlas, atlas_items)
+        for y in range(CHUNK_HEIGHT):
+            for x in range(CHUNK_WIDTH):
+                if chunk.is_solid(x, y):
+                    screen.blit(block_textures[chunk.types[y, x]],
+                                ((chunk.chunk_x * CHUNK_WIDTH + x) * BLOCK_SIZE - camera.offset_x,
+                                 (chunk.chunk_y * CHUNK_HEIGHT + y) * BLOCK_SIZE - camera.offset_y))
+
+    def whole_chunk(chunk, camera):
+        # Cached surfaces without row culling: every chunk is rendered and blitted whole
+        if chunk.chunk_x != 0:
+            return
+        chunk.render()
+        screen.blit(chunk.surface, (0, chunk.chunk_y * chunk_pixels - camera.offset_y))
+
+    def row_culled(chunk, camera):
+        chunk.draw(screen, camera)
+
+    baseline = scroll(per_block)
+    report("per-block blits (per frame)", baseline)
+    report("whole cached chunks (per frame)", scroll(whole_chunk), baseline)
+    report("row-culled cached chunks (per frame)", scroll(row_culled), baseline)
+    world.chunks.clear()
+
+@benchmark("present")
+def bench_present():
+    import pygame
+    import chunk as world
+    from camera import Camera
+    from constants import BLOCK_SIZE, CHUNK_HEIGHT, INTERNAL_HEIGHT, INTERNAL_WIDTH
+    from present import Presenter, RendererPresenter
+    from render_queue import RenderQueue
+    from sprite_cache import rotation_cache
+
+    pygame.init()
+    window_size = (INTERNAL_WIDTH // 2, INTERNAL_HEIGHT // 2)
+    screen = pygame.display.set_mode(window_size)
+    texture_atlas, atlas_items = load_game_atlas()
+    background = pygame.Surface((INTERNAL_WIDTH, INTERNAL_HEIGHT)).convert()
+    background.fill((40, 60, 90))
+    camera = Camera()
+    camera.offset_y = 3.5 * CHUNK_HEIGHT * BLOCK_SIZE  # Two chunk rows on screen
+    world.chunks.clear()
+    visible = [world.get_chunk(0, chunk_y, texture_atlas, atlas_items) for chunk_y in (3, 4)]
+    tnt = texture_atlas.subsurface(atlas_items["block"]["tnt"])
+    sprites = [rotation_cache.get(("benchmark", angle), tnt, angle) for angle in range(0, 360, 12)]
+
+    def draw_frame(render_queue, frame):
+        # Background, chunks and 30 rotated sprites through the world layer
+        layer = render_queue["world"]
+        layer.blit_texture("background", background, (0, 0))
+        for chunk in visible:
+            chunk.draw(layer, camera)
+        for i, sprite in enumerate(sprites):
+            layer.blit_texture(("benchmark", i), sprite, (i * 37 % INTERNAL_WIDTH, i * 61 % INTERNAL_HEIGHT))
+        render_queue.flush("world", frame)
+
+    render_queue = RenderQueue((INTERNAL_WIDTH, INTERNAL_HEIGHT))
+    frame = pygame.Surface((INTERNAL_WIDTH, INTERNAL_HEIGHT))
+
+    def full_resolution():
+        # Previous frame: drawn at the internal resolution, then a new smoothscaled surface every frame
+        draw_frame(render_queue, frame)
+        screen.blit(pygame.transform.smoothscale(frame, window_size), (0, 0))
+
+    baseline = measure(full_resolution, 50)
+    report("draw at 1.0, smoothscale to window", baseline)
+    for render_scale, present_filter in ((1.0, "smoothscale"), (0.75, "smoothscale"), (0.75, "nearest"), (0.5, "smoothscale")):
+        render_queue.set_scale(render_scale)
+        frame = pygame.Surface(render_queue.frame_size())
+        presenter = Presenter(present_filter)
+
+        def scaled_frame():
+            draw_frame(render_queue, frame)
+            presenter.present(frame, screen, window_size)
+
+        report(f"draw at {render_scale}, {present_filter}", measure(scaled_frame, 50), baseline)
+
+    # SDL2 renderer: texture upload, scaling and letterboxing in SDL (software renderer)
+    frame = pygame.Surface((INTERNAL_WIDTH, INTERNAL_HEIGHT))
+    presenter = RendererPresenter(window_size, (INTERNAL_WIDTH, INTERNAL_HEIGHT))
+    report("SDL2 software renderer, present only", measure(lambda: presenter.flip(frame), 100))
+    world.chunks.clear()
+
+@benchmark("text")
+def bench_text():
+    import pygame
+    import hud
+    from minecraft_font import minecraft_font
+    from text_cache import text_cache
+
+    pygame.init()
+    font = pygame.font.Font(None, 48)
+    labels = [f"{amount}" for amount in range(20)] + ["Y: 1234", "Fast", "Combo x5"]
+
+    def uncached():
+        for label in labels:
+            hud._render_text_with_outline(label, font, (255, 255, 255), (0, 0, 0), 2)
+            minecraft_font._render_with_shadow(label, (255, 255, 0), (0, 0, 0), "small")
+
+    def cached():
+        for label in labels:
+            hud.render_text_with_outline(label, font, (255, 255, 255), (0, 0, 0), 2)
+            minecraft_font.render_with_shadow(label, (255, 255, 0), (0, 0, 0), "small")
+
+    baseline = measure(uncached, 50)
+    report(f"{len(labels)} outlined + shadowed labels", baseline)
+    report(f"{len(labels)} labels from the text cache", measure(cached, 200), baseline)
+    print(f"  {text_cache.stats()}")
+
+@benchmark("hud")
+def bench_hud():
+    import pygame
+    import hud
+    from constants import BLOCK_SIZE, INTERNAL_HEIGHT, INTERNAL_WIDTH
+
+    texture_atlas, atlas_items = load_game_atlas()
+    screen = pygame.Surface((INTERNAL_WIDTH, INTERNAL_HEIGHT))
+    game_hud = hud.Hud(texture_atlas, atlas_items)
+    frames = {"n": 0}
+
+    def per_frame():
+        # Previous Hud.draw: scale every icon and render every outlined label each frame
+        x, y = game_hud.position
+        for ore, amount in game_hud.amounts.items():
+            icon = pygame.transform.scale(texture_atlas.subsurface(pygame.Rect(atlas_items["item"][ore])), game_hud.icon_size)
+            screen.blit(icon, (x, y))
+            screen.blit(hud._render_text_with_outline(str(amount), game_hud.font, (255, 255, 255), (0, 0, 0), 2), (x + 80, y))
+            y += game_hud.icon_size[1] + game_hud.spacing
+        for text in ("Y: 12", "Fast"):
+            screen.blit(hud._render_text_with_outline(text, game_hud.font, (255, 255, 255), (0, 0, 0), 2), (x, y))
+
+    def retained():
+        # A new depth bucket every 10 frames, as when falling at 12 blocks per second
+        frames["n"] += 1
+        game_hud.draw(screen, frames["n"] // 10 * BLOCK_SIZE, False, "Fast")
+
+    baseline = measure(per_frame, 50)
+    report("HUD rendered every frame", baseline)
+    report("retained HUD surface", measure(retained, 500), baseline)
+    print(f"  rebuilds: {game_hud.rebuilds}")
+
+@benchmark("right_panel")
+def bench_right_panel():
+    import pygame
+    import notifications
+    from constants import INTERNAL_HEIGHT, INTERNAL_WIDTH
+
+    load_game_atlas()
+    screen = pygame.Surface((INTERNAL_WIDTH, INTERNAL_HEIGHT))
+    panel = notifications.RightPanel()
+    for username in ("alice", "bob", "bob", "carol", "dave", "erin", "erin"):
+        panel.add_player_activity(username)
+
+    def gradient_lines():
+        # Previous background: one 1-pixel-tall surface per line of the 33%-45% fade every frame
+        panel_x = INTERNAL_WIDTH - panel.width
+        fade_start, fade_end = int(INTERNAL_HEIGHT * 0.33), int(INTERNAL_HEIGHT * 0.45)
+        top = pygame.Surface((panel.width, fade_start))
+        top.fill((64, 64, 64))
+        top.set_alpha(180)
+        screen.blit(top, (panel_x, 0))
+        for i in range(fade_end - fade_start):
+            line_surface = pygame.Surface((panel.width, 1))
+            line_surface.fill((64, 64, 64))
+            line_surface.set_alpha(int(180 * (1.0 - i / (fade_end - fade_start))))
+            screen.blit(line_surface, (panel_x, fade_start + i))
+        panel.content_state = None  # Labels rendered every frame as well
+        panel.draw(screen, INTERNAL_WIDTH, INTERNAL_HEIGHT)
+
+    baseline = measure(gradient_lines, 100)
+    report("panel drawn line by line every frame", baseline)
+    report("cached background and text", measure(lambda: panel.draw(screen, INTERNAL_WIDTH, INTERNAL_HEIGHT), 500), baseline)
+
+@benchmark("particles")
+def bench_particles():
+    import random
+    import numpy as np
+    import pygame
+    from constants import INTERNAL_HEIGHT, INTERNAL_WIDTH
+    from particles import ParticleEngine
+
+    pygame.init()
+    screen = pygame.Surface((INTERNAL_WIDTH, INTERNAL_HEIGHT))
+    glow = []
+
+    def dict_particles():
+        # Previous shield glow: dict list rebuilt every frame, a new Surface per particle per frame
+        for _ in range(3):
+            glow.append({'pos': (random.uniform(400, 600), random.uniform(400, 600)), 'life': 20,
+                         'size': random.uniform(4, 8)})
+        glow[:] = [g for g in glow if g['life'] > 0]
+        for g in glow:
+            g['life'] -= 1
+            glow_surf = pygame.Surface((int(g['size'] * 2), int(g['size'] * 2)), pygame.SRCALPHA)
+            pygame.draw.circle(glow_surf, (255, 215, 0, int(255 * g['life'] / 20)),
+                               (int(g['size']), int(g['size'])), int(g['size']))
+            screen.blit(glow_surf, (g['pos'][0] - g['size'], g['pos'][1] - g['size']))
+
+    emitter = ParticleEngine().emitter("shield_glow", "disc", 60)
+
+    def soa_particles():
+        emitter.update()
+        emitter.spawn(np.random.uniform(400, 600, 3), np.random.uniform(400, 600, 3), life=20,
+                      size=np.random.uniform(4, 8, 3).astype(int), color=(255, 215, 0))
+        emitter.draw(screen)
+
+    baseline = measure(dict_particles, 500)
+    report("60 glow particles, dicts + new surfaces", baseline)
+    report("60 glow particles, arrays + sprites", measure(soa_particles, 500), baseline)
+
+@benchmark("explosion_draw")
+def bench_explosion_draw():
+    import random
+    import pygame
+    from camera import Camera
+    from constants import INTERNAL_HEIGHT, INTERNAL_WIDTH
+    from explosion import Explosion
+
+    texture_atlas, atlas_items = load_game_atlas()
+    screen = pygame.Surface((INTERNAL_WIDTH, INTERNAL_HEIGHT))
+    camera = Camera()
+    center = (INTERNAL_WIDTH // 2, INTERNAL_HEIGHT // 2)
+
+    def rotate_per_frame():
+        # Previous ExplosionParticle: new objects per detonation, subsurface + rotate per particle per frame
+        particles = [(pygame.Vector2(center) + pygame.Vector2(random.randint(-200, 200), random.randint(-200, 200)),
+                      random.uniform(0, 360)) for _ in range(120)]
+        for frame in range(16):
+            texture = texture_atlas.subsurface(pygame.Rect(atlas_items["particle"][f"explosion_{frame}"]))
+            for pos, rotation in particles:
+                screen.blit(pygame.transform.rotate(texture, rotation), (pos.x, pos.y))
+
+    def pooled_frames():
+        # A Mega TNT shower: three 40-particle explosions animated to the end
+        explosions = [Explosion(center, texture_atlas, atlas_items, particle_count=40) for _ in range(3)]
+        while explosions:
+            for explosion in explosions:
+                explosion.update()
+                explosion.draw(screen, camera)
+            explosions = [e for e in explosions if e.particles]
+
+    baseline = measure(rotate_per_frame, 5)
+    report("120-particle shower, rotate per frame", baseline)
+    report("120-particle shower, pre-rotated + pooled", measure(pooled_frames, 20), baseline)
+
+if __name__ == "__main__":
+    names = sys.argv[1:] or list(benchmarks)
+    for name in names:
+        if name not in benchmarks:
+            print(f"Unknown benchmark: {name} (available: {', '.join(benchmarks)})")
+            sys.exit(1)
+        print(f"{name}:")
+        benchmarks[name]()
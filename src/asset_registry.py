@@ -0,0 +1,67 @@
+from pathlib import Path
+import pygame
+from atlas import load_texture_atlas
+from constants import BLOCK_SCALE_FACTOR
+
+ASSETS_DIR = Path(__file__).parent / "assets"
+ATLAS_CACHE_DIR = Path(__file__).parent.parent / ".cache" / "atlas"
+
+# Size variants served besides "source" (16px textures) and "block" (the block-scale atlas)
+HUD_ICON_SIZE = (64, 64)
+PANEL_ICON_SIZE = (24, 24)
+MEGA_SCALE = 2  # Mega TNT is twice the block size
+GIANT_SCALE = 3  # The enlarged pickaxe is three times the block size
+
+class AssetRegistry:
+    """
+    Loads the texture atlas once per process and serves textures in a few
+    pre-built sizes, so modules share surfaces instead of scaling their own:
+
+    - "source": the original 16px texture
+    - "block": block scale, a subsurface of the scaled atlas
+    - "hud": 64px HUD icon
+    - "panel": 24px right panel icon
+    - "mega": twice the block scale
+    - "giant": three times the block scale
+    """
+
+    def __init__(self, assets_dir=ASSETS_DIR, cache_dir=ATLAS_CACHE_DIR):
+        self.assets_dir = assets_dir
+        self.cache_dir = cache_dir  # Prebaked atlas for fast restarts
+        self.source_atlas = None
+        self.source_items = None
+        self.texture_atlas = None
+        self.atlas_items = None
+        self.variants = {}  # (category, name, variant) -> surface
+
+    def atlas(self):
+        """Return (texture_atlas, atlas_items) at block scale, loading them on first use"""
+        if self.texture_atlas is None:
+            (self.source_atlas, self.source_items,
+             self.texture_atlas, self.atlas_items) = load_texture_atlas(self.assets_dir, BLOCK_SCALE_FACTOR, self.cache_dir)
+        return self.texture_atlas, self.atlas_items
+
+    def texture(self, category, name, variant="block"):
+        """Return a texture in one of the size variants, built on first use and shared afterwards"""
+        key = (category, name, variant)
+        surface = self.variants.get(key)
+        if surface is None:
+            texture_atlas, atlas_items = self.atlas()
+            if variant == "source":
+                surface = self.source_atlas.subsurface(self.source_items[category][name])
+            elif variant == "block":
+                surface = texture_atlas.subsurface(atlas_items[category][name])
+            elif variant == "hud":
+                surface = pygame.transform.scale(self.texture(category, name, "source"), HUD_ICON_SIZE)
+            elif variant == "panel":
+                surface = pygame.transform.scale(self.texture(category, name, "source"), PANEL_ICON_SIZE)
+            elif variant == "mega":
+                surface = pygame.transform.scale_by(self.texture(category, name, "block"), MEGA_SCALE)
+            elif variant == "giant":
+                surface = pygame.transform.scale_by(self.texture(category, name, "block"), GIANT_SCALE)
+            else:
+                raise ValueError(f"Unknown texture variant: {variant}")
+            self.variants[key] = surface
+        return surface
+
+asset_registry = AssetRegistry()
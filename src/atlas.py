@@ -1,48 +1,120 @@
+import hashlib
+import json
 import os
 import pygame
 
-def create_texture_atlas(asset_path):
-    categories = ['block', 'item', 'destroy_stage', 'particle', "pickaxe"]
-    textures = {category: {} for category in categories}
-    images = []
-    positions = {}
-    atlas_width = 512
+ATLAS_CATEGORIES = ['block', 'item', 'destroy_stage', 'particle', "pickaxe"]
+ATLAS_CACHE_VERSION = 1  # Bump when the packing or the cache layout changes
 
-    # Load images and track dimensions
-    x_offset, y_offset, row_height = 0, 0, 0
-    for category in categories:
+def list_textures(asset_path):
+    """(category, texture name, path) of every texture in the atlas folders"""
+    textures = []
+    for category in ATLAS_CATEGORIES:
         folder_path = os.path.join(asset_path, category)
         if not os.path.exists(folder_path):
             print("Folder not found: ", folder_path)
             continue
-        
         for filename in sorted(os.listdir(folder_path)):
             if filename.endswith(".png"):
-                img_path = os.path.join(folder_path, filename)
-                image = pygame.image.load(img_path).convert_alpha()
-                img_width, img_height = image.get_size()
-                
-                # Wrap to new row if necessary
-                if x_offset + img_width > atlas_width:  # Max texture width
-                    x_offset = 0
-                    y_offset += row_height
-                    row_height = 0
-                
-                # Store texture coordinates
-                texture_name = filename.rsplit(".", 1)[0]
-                textures[category][texture_name] = (x_offset, y_offset, img_width, img_height)
-                
-                images.append((image, (x_offset, y_offset)))
-                
-                x_offset += img_width
-                row_height = max(row_height, img_height)
-    
-    # Determine atlas size
-    atlas_height = y_offset + row_height
+                textures.append((category, filename.rsplit(".", 1)[0], os.path.join(folder_path, filename)))
+    return textures
+
+def pack_textures(sizes, atlas_width=512):
+    """
+    Shelf packing: tallest images first, so every row holds images of similar
+    height and little space is wasted under the shorter ones.
+    Returns the position of each size, in input order, and the atlas height.
+    """
+    order = sorted(range(len(sizes)), key=lambda i: (-sizes[i][1], -sizes[i][0]))
+    positions = [None] * len(sizes)
+    x_offset, y_offset, row_height = 0, 0, 0
+    for i in order:
+        img_width, img_height = sizes[i]
+        # Wrap to new row if necessary
+        if x_offset + img_width > atlas_width:  # Max texture width
+            x_offset = 0
+            y_offset += row_height
+            row_height = 0
+        positions[i] = (x_offset, y_offset)
+        x_offset += img_width
+        row_height = max(row_height, img_height)
+    return positions, y_offset + row_height
+
+def create_texture_atlas(asset_path):
+    textures = {category: {} for category in ATLAS_CATEGORIES}
+    atlas_width = 512
+
+    # Load images and track dimensions
+    entries = list_textures(asset_path)
+    images = []
+    for category, texture_name, img_path in entries:
+        image = pygame.image.load(img_path)
+        if pygame.display.get_surface() is not None:  # No display surface with the SDL2 renderer
+            image = image.convert_alpha()
+        images.append(image)
+
+    positions, atlas_height = pack_textures([image.get_size() for image in images], atlas_width)
+
+    # Blit images onto atlas and store texture coordinates
     atlas_surface = pygame.Surface((atlas_width, atlas_height), pygame.SRCALPHA)
-    
-    # Blit images onto atlas
-    for image, pos in images:
+    for (category, texture_name, _), image, pos in zip(entries, images, positions):
+        textures[category][texture_name] = (pos[0], pos[1], image.get_width(), image.get_height())
         atlas_surface.blit(image, pos)
-    
+
     return atlas_surface, textures
+
+def scale_texture_atlas(atlas_surface, textures, factor):
+    """Scale the entire texture atlas and its coordinates by factor"""
+    scaled_surface = pygame.transform.scale(atlas_surface,
+                                            (atlas_surface.get_width() * factor, atlas_surface.get_height() * factor))
+    scaled_textures = {
+        category: {name: tuple(value * factor for value in rect) for name, rect in items.items()}
+        for category, items in textures.items()
+    }
+    return scaled_surface, scaled_textures
+
+def assets_key(asset_path, factor):
+    """Hash of every texture's path, modification time and size, plus the scale"""
+    digest = hashlib.sha1(f"{ATLAS_CACHE_VERSION}:{factor}".encode())
+    for category, texture_name, img_path in list_textures(asset_path):
+        stat = os.stat(img_path)
+        digest.update(f"{category}/{texture_name}:{stat.st_mtime_ns}:{stat.st_size}".encode())
+    return digest.hexdigest()
+
+def load_texture_atlas(asset_path, factor, cache_dir):
+    """
+    Return (atlas, textures, scaled atlas, scaled textures).
+
+    The packed and scaled atlases are stored in cache_dir as BMP files (decoded
+    much faster than PNG) with a JSON index. They are reused while the key from
+    assets_key() matches, and rebuilt otherwise.
+    """
+    key = assets_key(asset_path, factor)
+    index_path = os.path.join(cache_dir, "atlas.json")
+    source_path = os.path.join(cache_dir, "atlas.bmp")
+    scaled_path = os.path.join(cache_dir, "atlas_scaled.bmp")
+
+    try:
+        with open(index_path) as f:
+            index = json.load(f)
+        if index["key"] == key:
+            def rects(items):
+                return {category: {name: tuple(rect) for name, rect in names.items()} for category, names in items.items()}
+            return (pygame.image.load(source_path), rects(index["textures"]),
+                    pygame.image.load(scaled_path), rects(index["scaled_textures"]))
+    except (OSError, ValueError, KeyError, pygame.error):
+        pass  # Missing or unreadable cache, rebuild it
+
+    atlas_surface, textures = create_texture_atlas(asset_path)
+    scaled_surface, scaled_textures = scale_texture_atlas(atlas_surface, textures, factor)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        pygame.image.save(atlas_surface, source_path)
+        pygame.image.save(scaled_surface, scaled_path)
+        # The index is written last, so an interrupted save is never picked up
+        with open(index_path, "w") as f:
+            json.dump({"key": key, "textures": textures, "scaled_textures": scaled_textures}, f)
+        print(f"🧱 Texture atlas cached in {cache_dir}")
+    except (OSError, pygame.error) as e:
+        print(f"Error caching texture atlas: {e}")
+    return atlas_surface, textures, scaled_surface, scaled_textures
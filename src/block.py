@@ -1,152 +1,114 @@
-import pygame
-import pymunk
-from constants import BLOCK_SIZE
-import random 
+import numpy as np
+from constants import BLOCK_SIZE, CHUNK_HEIGHT, CHUNK_WIDTH
+import random
 
-class Block:
-    def __init__(self, space, x, y, name, texture_atlas, atlas_items):
-        if name == "bedrock":
-            self.max_hp = 1000000000
-            self.hp = 1000000000
-        elif name == "stone":
-            self.max_hp = 10
-            self.hp = 10
-        elif name == "andesite":
-            self.hp = 10
-            self.max_hp = 10
-        elif name == "diorite":
-            self.hp = 10
-            self.max_hp = 10
-        elif name == "granite":
-            self.hp = 10
-            self.max_hp = 10
-        elif name == "coal_ore":
-            self.hp = 15
-            self.max_hp = 15
-        elif name == "iron_ore":
-            self.hp = 15
-            self.max_hp = 15
-        elif name == "copper_ore":
-            self.hp = 15
-            self.max_hp = 15
-        elif name == "gold_ore":
-            self.hp = 20
-            self.max_hp = 20
-        elif name == "diamond_ore":
-            self.hp = 20
-            self.max_hp = 20
-        elif name == "emerald_ore":
-            self.hp = 20
-            self.max_hp = 20
-        elif name == "obsidian":
-            self.hp = 100
-            self.max_hp = 100
-        elif name == "redstone_ore":
-            self.hp = 15
-            self.max_hp = 15
-        elif name == "lapis_ore":
-            self.hp = 15
-            self.max_hp = 15
-        elif name == "mossy_cobblestone":
-            self.hp = 12
-            self.max_hp = 12
-        elif name == "cobblestone":
-            self.hp = 22
-            self.max_hp = 22
-        else:
-            self.hp = 1
-            self.max_hp = 1
-
-        self.texture_atlas = texture_atlas
-        self.atlas_items = atlas_items
-
-        rect = atlas_items["block"][name]  
-        self.texture = texture_atlas.subsurface(rect)
-
-        width, height = self.texture.get_size()
-
-        # Create a static physics body (doesn't move)
-        self.body = pymunk.Body(body_type=pymunk.Body.STATIC)
-        self.body.position = (x + BLOCK_SIZE//2, y + BLOCK_SIZE//2)
-
-        # Create a hitbox
-        self.shape = pymunk.Poly.create_box(self.body, (width, height))
-        self.shape.elasticity = 1  # No bounce
-        self.shape.collision_type = 2 # Identifier for collisions
-        self.shape.friction = 1
-        self.shape.block_ref = self  # Reference to the block object
-
-        self.destroyed = False
+class BlockType:
+    """Static data shared by every block of one type"""
+
+    __slots__ = ("id", "name", "max_hp", "drop", "drop_range", "texture")
 
+    def __init__(self, name, max_hp, drop=None, drop_range=(1, 1)):
+        self.id = None  # Index in BLOCK_TYPES, as stored in the chunk arrays
         self.name = name
+        self.max_hp = max_hp
+        self.drop = drop  # HUD item added when the block is destroyed
+        self.drop_range = drop_range  # (min, max) amount of the drop
+        self.texture = None  # Shared subsurface of the texture atlas, set by get_block_textures
+
+# Block types by id (index = id, 0 is an empty cell)
+BLOCK_TYPES = [
+    BlockType("air", 0),
+    BlockType("bedrock", 1000000000),
+    BlockType("grass_block", 1),
+    BlockType("dirt", 1),
+    BlockType("stone", 10),
+    BlockType("andesite", 10),
+    BlockType("diorite", 10),
+    BlockType("granite", 10),
+    BlockType("coal_ore", 15, "coal"),
+    BlockType("iron_ore", 15, "iron_ingot"),
+    BlockType("copper_ore", 15, "copper_ingot"),
+    BlockType("gold_ore", 20, "gold_ingot"),
+    BlockType("diamond_ore", 20, "diamond"),
+    BlockType("emerald_ore", 20, "emerald"),
+    BlockType("obsidian", 100),
+    BlockType("redstone_ore", 15, "redstone", (4, 5)),
+    BlockType("lapis_ore", 15, "lapis_lazuli", (4, 8)),
+    BlockType("mossy_cobblestone", 12),
+    BlockType("cobblestone", 22),
+]
+for block_id, block_type in enumerate(BLOCK_TYPES):
+    block_type.id = block_id
+
+BLOCK_NAMES = [block_type.name for block_type in BLOCK_TYPES]
+BLOCK_IDS = {name: block_id for block_id, name in enumerate(BLOCK_NAMES)}
+AIR = BLOCK_IDS["air"]
+
+HEAL_INTERVAL = 5000  # Heal every 5 seconds (5000 ms)
+
+# Max HP lookup table indexed by block type id
+MAX_HP = np.array([block_type.max_hp for block_type in BLOCK_TYPES], dtype=np.float32)
 
-        self.last_heal_time = None  # Track time of last healing (None initially)
-        self.heal_interval = 5000  # Heal every 5 seconds (5000 ms)
-        self.first_hit_time = None  # Track the time when the block was first hit
-
-        space.add(self.body, self.shape)
-
-    def update(self, space, hud):
-        """Update block state"""
-
-        # Check if the block was hit for the first time
-        if self.first_hit_time is None and self.hp < self.max_hp:
-            self.first_hit_time = pygame.time.get_ticks()
-            self.last_heal_time = self.first_hit_time
-
-        # Check if the block has been hit before and start healing 5 seconds after it was first hit
-        if self.first_hit_time is not None:
-            current_time = pygame.time.get_ticks()
-
-            # Start healing 5 seconds after the block was first hit
-            if current_time - self.first_hit_time >= 5000:
-                # Heal 20% of the max HP every 5 seconds (but not exceeding max_hp)
-                if current_time - self.last_heal_time >= self.heal_interval:
-                    healing_amount = self.max_hp * 0.2
-                    self.hp = min(self.hp + healing_amount, self.max_hp)
-
-                    # Reset the healing timer after each heal
-                    self.last_heal_time = current_time
-        
-        if self.hp <= 0 and not self.destroyed:
-            self.destroyed = True
-            space.remove(self.body, self.shape)  # Remove from physics world
-
-            if self.name == "coal_ore":
-                hud.amounts["coal"] += 1  # Add to HUD amounts
-            elif self.name == "iron_ore":
-                hud.amounts["iron_ingot"] += 1  # Add to HUD amounts
-            elif self.name == "copper_ore":
-                hud.amounts["copper_ingot"] += 1  # Add to HUD amounts
-            elif self.name == "gold_ore":
-                hud.amounts["gold_ingot"] += 1  # Add to HUD amounts
-            elif self.name == "diamond_ore":
-                hud.amounts["diamond"] += 1  # Add to HUD amounts
-            elif self.name == "emerald_ore":
-                hud.amounts["emerald"] += 1  # Add to HUD amounts
-            elif self.name == "redstone_ore":
-                hud.amounts["redstone"] += random.randint(4, 5)  # Add to HUD amounts
-            elif self.name == "lapis_ore":
-                hud.amounts["lapis_lazuli"] += random.randint(4, 8)  # Add to HUD amounts
-
-    def draw(self, screen, camera):
-        """Draw block at its position"""
-
-        if(self.destroyed):
-            return
-
-        block_x = self.body.position.x - camera.offset_x - BLOCK_SIZE // 2
-        block_y = self.body.position.y - camera.offset_y - BLOCK_SIZE // 2
-
-        screen.blit(self.texture, (block_x, block_y))
-
-        # Determine the destroy stage (0-9) based on hp percentage
-        if self.hp < self.max_hp:
-            damage_stage = int((1 - (self.hp / self.max_hp)) * 9)  # Scale hp to 0-9 range
-            damage_stage = min(damage_stage, 9)  # Ensure it doesn't exceed stage_9
-            
-            # Draw the destroy stage overlay
-            destroy_texture = self.texture_atlas.subsurface(
-                self.atlas_items["destroy_stage"][f"destroy_stage_{damage_stage}"]
-            )
-            screen.blit(destroy_texture, (block_x, block_y))
\ No newline at end of file
+class Block:
+    """View of a single cell in a chunk's arrays.
+
+    All block state lives in the owning chunk (type, hp, damage timestamp and
+    destroyed mask), so views are cheap to create and can be thrown away.
+    """
+
+    __slots__ = ("chunk", "x", "y")
+
+    def __init__(self, chunk, x, y):
+        self.chunk = chunk
+        self.x = x
+        self.y = y
+
+    @property
+    def type(self):
+        return BLOCK_TYPES[self.chunk.types[self.y, self.x]]
+
+    @property
+    def name(self):
+        return self.type.name
+
+    @property
+    def hp(self):
+        return float(self.chunk.hp[self.y, self.x])
+
+    @hp.setter
+    def hp(self, value):
+        self.chunk.hp[self.y, self.x] = value
+
+    @property
+    def max_hp(self):
+        return float(self.type.max_hp)
+
+    @property
+    def destroyed(self):
+        return bool(self.chunk.destroyed[self.y, self.x])
+
+    @property
+    def damage_time(self):
+        """Time of the last hit or heal in ms, None if the block was never damaged"""
+        damage_time = int(self.chunk.damage_time[self.y, self.x])
+        return None if damage_time < 0 else damage_time
+
+    @damage_time.setter
+    def damage_time(self, value):
+        self.chunk.damage_time[self.y, self.x] = -1 if value is None else value
+
+    @property
+    def position(self):
+        """World position of the block center"""
+        return (
+            (self.chunk.chunk_x * CHUNK_WIDTH + self.x) * BLOCK_SIZE + BLOCK_SIZE // 2,
+            (self.chunk.chunk_y * CHUNK_HEIGHT + self.y) * BLOCK_SIZE + BLOCK_SIZE // 2,
+        )
+
+    def destroy(self, hud):
+        """Destroy the block and add its drops to the HUD"""
+        self.chunk.destroy(self.x, self.y)  # Removed from the physics world by the collision band
+
+        block_type = self.type
+        if block_type.drop is not None:
+            hud.amounts[block_type.drop] += random.randint(*block_type.drop_range)  # Add to HUD amounts
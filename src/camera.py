@@ -1,6 +1,7 @@
 import pygame
 import random
-from constants import INTERNAL_HEIGHT
+import math
+from constants import BLOCK_SIZE, INTERNAL_HEIGHT
 
 class Camera:
     def __init__(self):
@@ -19,6 +20,10 @@ class Camera:
         """Alias for offset_x to maintain compatibility"""
         return self.offset_x
 
+    def visible_rows(self, height=INTERNAL_HEIGHT):
+        """World block rows (first, last exclusive) that intersect the viewport"""
+        return (math.floor(self.offset_y / BLOCK_SIZE), math.ceil((self.offset_y + height) / BLOCK_SIZE))
+
     def shake(self, duration, intensity, bias_x=0, bias_y=0):
         """Start a camera shake effect with optional directional bias."""
         self.shake_timer = duration
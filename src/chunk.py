@@ -1,150 +1,264 @@
+import numpy as np
 import pygame
-import random
-from block import Block
-from constants import BLOCK_SIZE, CHUNK_HEIGHT, CHUNK_WIDTH, SEED
+from block import AIR, BLOCK_IDS, BLOCK_TYPES, MAX_HP, Block
+from constants import BLOCK_SIZE, CHUNK_HEIGHT, CHUNK_WIDTH, INTERNAL_HEIGHT
+from render_queue import blit_texture
+from sprite_cache import scaled_sprites
+from worldgen import generate_chunk_types
 
-def generate_noise_ranges(block_weights):
+CHUNK_COLORKEY = (255, 0, 255)  # Transparent color of the cached chunk surfaces
+
+# Block and destroy stage textures shared by every chunk, built once per atlas
+_textures = {"atlas": None, "blocks": None, "destroy_stages": None}
+
+def get_block_textures(texture_atlas, atlas_items):
+    """Return (textures by block type id, destroy stage overlays 0-9)"""
+    if _textures["atlas"] is not texture_atlas:
+        for block_type in BLOCK_TYPES:
+            rect = atlas_items["block"].get(block_type.name)
+            block_type.texture = texture_atlas.subsurface(rect) if rect else None
+        _textures["blocks"] = [block_type.texture for block_type in BLOCK_TYPES]
+        _textures["destroy_stages"] = [
+            texture_atlas.subsurface(atlas_items["destroy_stage"][f"destroy_stage_{stage}"])
+            for stage in range(10)
+        ]
+        _textures["atlas"] = texture_atlas
+        scaled_sprites.clear()  # Scaled block textures are named by block type and stage, not by atlas
+    return _textures["blocks"], _textures["destroy_stages"]
+
+def get_border_strip(texture_atlas, atlas_items):
+    """One column of bedrock tiles a block taller than the screen, built once per atlas"""
+    if _textures.get("border_atlas") is not texture_atlas:
+        bedrock = get_block_textures(texture_atlas, atlas_items)[0][BLOCK_IDS["bedrock"]]
+        strip = pygame.Surface((BLOCK_SIZE, INTERNAL_HEIGHT + BLOCK_SIZE))
+        for y in range(0, strip.get_height(), BLOCK_SIZE):
+            strip.blit(bedrock, (0, y))
+        _textures["border"] = strip
+        _textures["border_atlas"] = texture_atlas
+    return _textures["border"]
+
+def draw_bedrock_border(screen, camera, texture_atlas, atlas_items):
+    """Draw the bedrock just outside the world's side walls, seen when the camera shakes sideways"""
+    strip = get_border_strip(texture_atlas, atlas_items)
+    y = -(camera.offset_y % BLOCK_SIZE)  # Scroll the tiles with the world
+    blit_texture(screen, "bedrock_border", strip, (-BLOCK_SIZE - camera.offset_x, y))
+    blit_texture(screen, "bedrock_border", strip, (CHUNK_WIDTH * BLOCK_SIZE - camera.offset_x, y))
+
+class DamagedTextureCache:
     """
-    Generate noise value ranges based on block rarity weights.
-    
-    :param block_weights: Dict of block names and their rarity weights.
-                          Higher values mean more common.
-    :return: List of (block_name, min_value, max_value)
+    Block textures with their destroy stage overlay already composited, by
+    (block type id, stage), so a damaged block is drawn with one blit.
+    Built lazily; counts hits and misses to check it pays off.
     """
-    sorted_blocks = sorted(block_weights.items(), key=lambda x: x[1], reverse=True)  # Sort by weight
-    total_weight = sum(block_weights.values())  # Get total weight
-    min_noise = -1.0  # Start from minimum noise value
-    noise_ranges = []
 
-    for block, weight in sorted_blocks:
-        range_size = (weight / total_weight) * 2.0  # Scale to noise range (-1 to 1)
-        max_noise = min_noise + range_size
-        noise_ranges.append((block, min_noise, max_noise))
-        min_noise = max_noise  # Move to next range
+    def __init__(self):
+        self.atlas = None
+        self.textures = {}
+        self.hits = 0
+        self.misses = 0
 
-    return noise_ranges
+    def get(self, texture_atlas, atlas_items, block_type, stage):
+        if self.atlas is not texture_atlas:
+            self.textures = {}
+            self.atlas = texture_atlas
 
+        texture = self.textures.get((block_type, stage))
+        if texture is not None:
+            self.hits += 1
+            return texture
 
-def get_block_for_noise(noise_value, noise_ranges):
+        self.misses += 1
+        block_textures, destroy_stages = get_block_textures(texture_atlas, atlas_items)
+        texture = block_textures[block_type].copy()
+        texture.blit(destroy_stages[stage], (0, 0))
+        self.textures[(block_type, stage)] = texture
+        return texture
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0,
+            "textures": len(self.textures),
+        }
+
+damaged_textures = DamagedTextureCache()
+
+class Chunk:
     """
-    Get the corresponding block based on a noise value.
-    
-    :param noise_value: The Perlin noise value (-1 to 1)
-    :param noise_ranges: List of (block_name, min_value, max_value)
-    :return: Block name corresponding to the noise value
+    Compact array storage for one CHUNK_WIDTH x CHUNK_HEIGHT chunk.
+
+    Every cell is described by its block type id, HP, damage timestamp and
+    destroyed flag; Block objects are only thin views over these arrays.
     """
-    for block, min_val, max_val in noise_ranges:
-        if min_val <= noise_value < max_val:
-            return block
-    return "stone"  # Default fallback
-
-block_weights = {
-    "stone": 40,  
-    "andesite": 30,
-    "diorite": 10,
-    "granite": 10,
-    "coal_ore": 10,  
-    "iron_ore": 8,
-    "copper_ore": 8,  
-    "gold_ore": 5,  
-    "diamond_ore": 2,  
-    "emerald_ore": 1,  
-    "obsidian": 1,  
-    "redstone_ore": 7,  
-    "lapis_ore": 6,
-    "mossy_cobblestone": 4,
-    "cobblestone": 20
-}
-
-# Generate noise ranges
-noise_ranges = generate_noise_ranges(block_weights)
-
-def generate_first_chunk(texture_atlas, atlas_items, space): 
-    chunk = []
-    for y in range(CHUNK_HEIGHT):
-        row = []
-        for x in range(CHUNK_WIDTH):
-            if(x == 0 or x == CHUNK_WIDTH - 1):
-                block_x = (0 * CHUNK_WIDTH + x) * BLOCK_SIZE
-                block_y = (0 * CHUNK_HEIGHT + y) * BLOCK_SIZE
-                row.append(Block(space, block_x, block_y, "bedrock", texture_atlas, atlas_items))
-                continue
-            elif y == 0:
-                block_x = (0 * CHUNK_WIDTH + x) * BLOCK_SIZE
-                block_y = (0 * CHUNK_HEIGHT + y) * BLOCK_SIZE
-                row.append(Block(space, block_x, block_y, "bedrock", texture_atlas, atlas_items))
-                continue
-            elif y == CHUNK_HEIGHT - 2:
-                block_x = (0 * CHUNK_WIDTH + x) * BLOCK_SIZE
-                block_y = (0 * CHUNK_HEIGHT + y) * BLOCK_SIZE
-                row.append(Block(space, block_x, block_y, "grass_block", texture_atlas, atlas_items))
-                continue
-            elif y == CHUNK_HEIGHT - 1:
-                block_x = (0 * CHUNK_WIDTH + x) * BLOCK_SIZE
-                block_y = (0 * CHUNK_HEIGHT + y) * BLOCK_SIZE
-                row.append(Block(space, block_x, block_y, "dirt", texture_atlas, atlas_items))
-                continue
-            row.append(None)
-        chunk.append(row)
-    return chunk
-
-def generate_side_chunk(chunk_x, chunk_y, texture_atlas, atlas_items, space):
-    chunk = []
-    for y in range(CHUNK_HEIGHT):
-        row = []
-        for x in range(CHUNK_WIDTH):
-            block_x = (chunk_x * CHUNK_WIDTH + x) * BLOCK_SIZE
-            block_y = (chunk_y * CHUNK_HEIGHT + y) * BLOCK_SIZE
-            row.append(Block(space, block_x, block_y, "bedrock", texture_atlas, atlas_items))
-        chunk.append(row)
-    return chunk
-
-# Function to generate chunks using Perlin noise
-def generate_chunk(chunk_x, chunk_y, texture_atlas, atlas_items, space):
-    if(chunk_y <= 0):
-        return generate_first_chunk(texture_atlas, atlas_items, space)
 
-    chunk = []
-    for y in range(CHUNK_HEIGHT):
-        row = []
-        for x in range(CHUNK_WIDTH):
-            block_x = (0 * CHUNK_WIDTH + x) * BLOCK_SIZE
-            block_y = (chunk_y * CHUNK_HEIGHT + y) * BLOCK_SIZE
+    def __init__(self, chunk_x, chunk_y, types, texture_atlas, atlas_items):
+        self.chunk_x = chunk_x
+        self.chunk_y = chunk_y
+        self.types = types  # uint8 block type ids, AIR for empty cells
+        self.hp = MAX_HP[types]  # float32 HP grid
+        self.damage_time = np.full(types.shape, -1, dtype=np.int64)  # Last hit/heal time in ms, -1 if never hit
+        self.destroyed = np.zeros(types.shape, dtype=bool)  # Destroyed bitmask
+
+        self.texture_atlas = texture_atlas
+        self.atlas_items = atlas_items
+
+        self.row_versions = np.zeros(types.shape[0], dtype=np.int64)  # Bumped when a row's solid cells change
+
+        self.state = "loaded"  # Lifecycle state, see ChunkManager
+
+        self.surface = None  # Cached rendering of the chunk, created when it is first drawn
+        self.surface_scale = 1.0  # Render scale the cached surface was drawn at
+        self.drawn_stages = None  # Cell states the cached surface shows, see stages()
+
+    @property
+    def nbytes(self):
+        """Approximate memory used by the chunk's arrays and cached surface"""
+        nbytes = self.types.nbytes + self.hp.nbytes + self.damage_time.nbytes + self.destroyed.nbytes + self.row_versions.nbytes
+        if self.surface is not None:
+            nbytes += self.surface.get_bytesize() * self.surface.get_width() * self.surface.get_height()
+        return nbytes
+
+    def is_solid(self, x, y):
+        return self.types[y, x] != AIR and not self.destroyed[y, x]
+
+    def block(self, x, y):
+        """Return a Block view of the cell, or None for empty and destroyed cells"""
+        if not self.is_solid(x, y):
+            return None
+        return Block(self, x, y)
+
+    def iter_blocks(self):
+        """Yield a Block view for every solid cell"""
+        ys, xs = np.nonzero(self.solid_mask())
+        for y, x in zip(ys.tolist(), xs.tolist()):
+            yield self.block(x, y)
 
-            if(x == 0 or x == CHUNK_WIDTH - 1):
-                row.append(Block(space, block_x, block_y, "bedrock", texture_atlas, atlas_items))
-                continue
+    def solid_mask(self):
+        return (self.types != AIR) & ~self.destroyed
 
-            noise_value = random.uniform(-1, 1)
+    def stages(self, top=0, bottom=CHUNK_HEIGHT):
+        """Drawn state of the cells in rows top..bottom: -2 for empty cells, -1 for undamaged blocks, 0-9 for the destroy stage"""
+        solid = self.solid_mask()[top:bottom]
+        hp = self.hp[top:bottom]
+        ratios = np.divide(hp, MAX_HP[self.types[top:bottom]], out=np.ones(hp.shape, dtype=np.float32), where=solid)
+        # Determine the destroy stage (0-9) based on hp percentage
+        stages = np.where(ratios < 1, np.minimum(((1 - ratios) * 9).astype(np.int8), 9), -1).astype(np.int8)
+        stages[~solid] = -2
+        return stages
 
-            # Block selection based on noise val
-            row.append(Block(space, block_x, block_y, get_block_for_noise(noise_value, noise_ranges), texture_atlas, atlas_items))
+    def render(self, top=0, bottom=CHUNK_HEIGHT, scale=1.0):
+        """
+        Redraw the cells in rows top..bottom of the cached chunk surface whose drawn state changed.
+        Below a render scale of 1 the surface is drawn with block textures scaled to the smaller block size.
+        """
+        block_size = round(BLOCK_SIZE * scale)
+        if self.surface is None or self.surface_scale != scale:
+            self.surface = pygame.Surface((CHUNK_WIDTH * block_size, CHUNK_HEIGHT * block_size))
+            self.surface.set_colorkey(CHUNK_COLORKEY)
+            self.surface_scale = scale
+            self.drawn_stages = np.full(self.types.shape, -3, dtype=np.int8)  # Nothing drawn yet
 
-        chunk.append(row)
-    return chunk
+        stages = self.stages(top, bottom)
+        ys, xs = np.nonzero(stages != self.drawn_stages[top:bottom])
+        if not len(ys):
+            return
+
+        block_textures, _ = get_block_textures(self.texture_atlas, self.atlas_items)
+        for x, y, stage in zip(xs.tolist(), (ys + top).tolist(), stages[ys, xs].tolist()):
+            position = (x * block_size, y * block_size)
+            self.surface.fill(CHUNK_COLORKEY, (position[0], position[1], block_size, block_size))
+            if stage == -2:
+                continue  # Empty cells stay transparent
+            block_type = self.types[y, x]
+            if stage >= 0:
+                texture = damaged_textures.get(self.texture_atlas, self.atlas_items, block_type, stage)
+            else:
+                texture = block_textures[block_type]
+            self.surface.blit(scaled_sprites.get(("block", int(block_type), stage), texture, scale), position)
+        self.drawn_stages[top:bottom] = stages
+
+    def release_surface(self):
+        """Free the cached surface of a chunk that is no longer on screen"""
+        self.surface = None
+        self.drawn_stages = None
+
+    def draw(self, screen, camera):
+        """Draw the rows of the chunk that are on screen from its cached surface"""
+        origin_x = self.chunk_x * CHUNK_WIDTH * BLOCK_SIZE - camera.offset_x
+        # Only the block rows that intersect the viewport are rendered and blitted
+        first_row, last_row = camera.visible_rows()
+        top = max(first_row - self.chunk_y * CHUNK_HEIGHT, 0)
+        bottom = min(last_row - self.chunk_y * CHUNK_HEIGHT, CHUNK_HEIGHT)
+        if top >= bottom or origin_x >= screen.get_width() or origin_x + CHUNK_WIDTH * BLOCK_SIZE <= 0:
+            # Off screen: active chunks just above or below the viewport do not keep a surface either
+            self.release_surface()
+            return
+
+        # Render layers below a render scale of 1 take the surface drawn at their scale as is
+        scale = getattr(screen, "scale", 1)
+        self.render(top, bottom, scale)
+        origin_y = (self.chunk_y * CHUNK_HEIGHT + top) * BLOCK_SIZE - camera.offset_y
+        if scale == 1:
+            screen.blit(self.surface, (origin_x, origin_y), (0, top * BLOCK_SIZE, CHUNK_WIDTH * BLOCK_SIZE, (bottom - top) * BLOCK_SIZE))
+        else:
+            block_size = round(BLOCK_SIZE * scale)
+            screen.blit_scaled(self.surface, (round(origin_x * scale), round(origin_y * scale)),
+                               (0, top * block_size, CHUNK_WIDTH * block_size, (bottom - top) * block_size))
+
+    def destroy(self, x, y):
+        """Mark a cell as destroyed, the collision band rebuilds the row's geometry"""
+        self.destroyed[y, x] = True
+        self.row_versions[y] += 1
+
+
+def generate_first_chunk(texture_atlas, atlas_items):
+    types = np.full((CHUNK_HEIGHT, CHUNK_WIDTH), AIR, dtype=np.uint8)
+    types[0, :] = BLOCK_IDS["bedrock"]
+    types[CHUNK_HEIGHT - 2, :] = BLOCK_IDS["grass_block"]
+    types[CHUNK_HEIGHT - 1, :] = BLOCK_IDS["dirt"]
+    types[:, 0] = BLOCK_IDS["bedrock"]
+    types[:, CHUNK_WIDTH - 1] = BLOCK_IDS["bedrock"]
+
+    return Chunk(0, 0, types, texture_atlas, atlas_items)
+
+# Function to generate chunks using seeded coherent noise
+def generate_chunk(chunk_x, chunk_y, texture_atlas, atlas_items):
+    if(chunk_y <= 0):
+        return generate_first_chunk(texture_atlas, atlas_items)
+
+    types = generate_chunk_types(chunk_y)[0]
+    return Chunk(chunk_x, chunk_y, types, texture_atlas, atlas_items)
 
 # Store generated chunks
 chunks = {}
 
-def get_block(chunk_x, chunk_y, x, y, texture_atlas, atlas_items, space):
+def get_chunk(chunk_x, chunk_y, texture_atlas, atlas_items):
     if chunk_y < 0:
         return None
 
+    if chunk_x != 0:
+        return None  # Only one column of chunks, the sides are static walls (see collision.add_side_walls)
+
     if (chunk_x, chunk_y) not in chunks:
-        if(chunk_x == 0):
-            chunks[(chunk_x, chunk_y)] = generate_chunk(chunk_x, chunk_y, texture_atlas, atlas_items, space)
-        else:
-            chunks[(chunk_x, chunk_y)] = generate_side_chunk(chunk_x, chunk_y, texture_atlas, atlas_items, space)
-            
-    return chunks[(chunk_x, chunk_y)][y][x]
+        chunks[(chunk_x, chunk_y)] = generate_chunk(chunk_x, chunk_y, texture_atlas, atlas_items)
+
+    return chunks[(chunk_x, chunk_y)]
+
+def add_chunk_row(chunk_y, types, texture_atlas, atlas_items):
+    """Store a pre-generated chunk, keeping the chunk if it already exists"""
+    if (0, chunk_y) not in chunks:
+        chunks[(0, chunk_y)] = Chunk(0, chunk_y, types, texture_atlas, atlas_items)
+
+def get_block(chunk_x, chunk_y, x, y, texture_atlas, atlas_items):
+    chunk = get_chunk(chunk_x, chunk_y, texture_atlas, atlas_items)
+    if chunk is None:
+        return None
+    return chunk.block(x, y)
 
 def delete_block(chunk_x, chunk_y, x, y):
     if (chunk_x, chunk_y) in chunks:
-        chunks[(chunk_x, chunk_y)][y][x].hp = 0
-        del chunks[(chunk_x, chunk_y)][y][x]
-        chunks[(chunk_x, chunk_y)][y][x] = None
-
-def clean_chunks(start_chunk_y):
-    for (chunk_x, chunk_y) in list(chunks.keys()):
-        if chunk_y < start_chunk_y:
-            del chunks[(chunk_x, chunk_y)]
\ No newline at end of file
+        chunk = chunks[(chunk_x, chunk_y)]
+        chunk.hp[y, x] = 0
+        chunk.destroy(x, y)
\ No newline at end of file
@@ -0,0 +1,69 @@
+import sys
+from chunk import chunks, get_chunk
+
+# Rough per chunk overhead of the Chunk object, its attribute dict and array headers
+CHUNK_OVERHEAD_BYTES = 1000
+
+class ChunkManager:
+    """
+    Owns the lifecycle of the chunks in the `chunks` dict.
+
+    loaded:   generated (on the spot or by the prefetcher), not on screen yet
+    active:   on screen, updated and drawn every frame
+    inactive: scrolled off the top, kept in memory with its damage state
+    unloaded: removed from `chunks`, its block geometry released in one batch
+
+    Chunks are only unloaded `keep_rows` chunk rows above the screen, so a
+    pickaxe that briefly moves back up finds the same chunks it left.
+    """
+
+    def __init__(self, collision_band, texture_atlas, atlas_items, keep_rows=2):
+        self.collision_band = collision_band
+        self.texture_atlas = texture_atlas
+        self.atlas_items = atlas_items
+        self.keep_rows = keep_rows
+        self.active = []  # Active chunks in draw order
+        self.unloaded_count = 0
+
+    def update(self, start_chunk_y, end_chunk_y):
+        """Activate the chunks in the visible rows, deactivate and unload the rest"""
+        self.active = []
+        for chunk_y in range(start_chunk_y, end_chunk_y):
+            chunk = get_chunk(0, chunk_y, self.texture_atlas, self.atlas_items)
+            if chunk is not None:
+                chunk.state = "active"
+                self.active.append(chunk)
+
+        unload = []
+        for (chunk_x, chunk_y), chunk in chunks.items():
+            if chunk_y < start_chunk_y - self.keep_rows:
+                unload.append((chunk_x, chunk_y))
+            elif chunk.state == "active" and not start_chunk_y <= chunk_y < end_chunk_y:
+                chunk.state = "inactive"
+                chunk.release_surface()
+
+        if unload:
+            self.unload(unload)
+
+    def unload(self, keys):
+        """Drop chunks and release all of their block shapes from the physics space at once"""
+        for key in keys:
+            chunk = chunks.pop(key)
+            chunk.state = "unloaded"
+            chunk.release_surface()
+        self.collision_band.release_chunk_rows({chunk_y for _, chunk_y in keys})
+        self.unloaded_count += len(keys)
+
+    def stats(self):
+        """Counters for live chunks, physics shapes and approximate memory"""
+        states = {"loaded": 0, "active": 0, "inactive": 0}
+        for chunk in chunks.values():
+            states[chunk.state] += 1
+        return {
+            "chunks": len(chunks),
+            **states,
+            "unloaded": self.unloaded_count,
+            "shapes": len(self.collision_band.space.shapes),
+            "block_shapes": self.collision_band.shape_count(),
+            "bytes": sum(chunk.nbytes for chunk in chunks.values()) + len(chunks) * CHUNK_OVERHEAD_BYTES + sys.getsizeof(chunks),
+        }
@@ -0,0 +1,178 @@
+import math
+import numpy as np
+import pymunk
+from chunk import chunks
+from constants import BLOCK_SIZE, CHUNK_HEIGHT, CHUNK_WIDTH
+
+WALL_LENGTH = 10 ** 9  # Side walls reach far beyond any depth the pickaxe can fall to
+
+def find_runs(solid):
+    """Return (start, end) index pairs of the runs of True values in a 1D bool array (end exclusive)"""
+    edges = np.diff(np.concatenate(([False], solid, [False])).astype(np.int8))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    return list(zip(starts.tolist(), ends.tolist()))
+
+def blocks_at_contact(arbiter):
+    """
+    Return the distinct Blocks hit in a collision with a block shape (arbiter.shapes[1]).
+
+    Block shapes cover a whole run of cells, so every contact point is nudged
+    into the shape along the collision normal and mapped back to its own grid
+    cell. A body resting on two blocks of one run hits both of them.
+    """
+    shape = arbiter.shapes[1]
+    contact_set = arbiter.contact_point_set
+    world_y, first_x, last_x = shape.block_cells
+    chunk_y, y = divmod(world_y, CHUNK_HEIGHT)
+
+    blocks = []
+    cells = set()
+    for point in contact_set.points:
+        point_x = point.point_b.x + contact_set.normal.x  # 1px into the block shape
+        world_x = min(max(int(point_x // BLOCK_SIZE), first_x), last_x)
+        if world_x in cells:
+            continue
+        cells.add(world_x)
+        chunk = chunks.get((world_x // CHUNK_WIDTH, chunk_y))
+        if chunk is not None:
+            blocks.append(chunk.block(world_x % CHUNK_WIDTH, y))
+    return blocks
+
+def add_side_walls(space):
+    """
+    Add two static walls along the outer edges of the world. They replace the
+    bedrock side chunks, which were only there to keep bodies inside.
+    """
+    walls = []
+    for x in (0, CHUNK_WIDTH * BLOCK_SIZE):
+        wall = pymunk.Segment(space.static_body, (x, -WALL_LENGTH), (x, WALL_LENGTH), 1)
+        wall.elasticity = 1
+        wall.collision_type = 4  # Identifier for collisions, no block behind it
+        wall.friction = 1
+        walls.append(wall)
+    space.add(*walls)
+    return walls
+
+class BandRow:
+    """Collision geometry of one world row of blocks inside the band"""
+
+    def __init__(self, signature, shapes):
+        self.signature = signature  # (chunk, row version) the shapes were built from
+        self.shapes = shapes
+
+class CollisionBand:
+    """
+    Keeps static block geometry in the physics space only around dynamic bodies.
+
+    Every frame the band collects the rows within `margin` blocks of the
+    pickaxe and live TNT. Each row is greedy-meshed: every run of adjacent
+    solid cells becomes a single box shape, so a row of 7 stone blocks costs
+    one shape. A row is only rebuilt when one of its cells is destroyed, and
+    rows that leave the band are released.
+    """
+
+    def __init__(self, space, margin=2):
+        self.space = space
+        self.margin = margin  # Extra rows/columns of blocks around every body
+        self.rows = {}  # world_y -> BandRow
+
+    def body_cells(self, body):
+        """World cell range (first_x, first_y, last_x, last_y) covered by a body and the margin"""
+        left = top = math.inf
+        right = bottom = -math.inf
+        for shape in body.shapes:
+            bb = shape.cache_bb()
+            left, top = min(left, bb.left), min(top, bb.bottom)
+            right, bottom = max(right, bb.right), max(bottom, bb.top)
+
+        return (
+            int(left // BLOCK_SIZE) - self.margin,
+            int(top // BLOCK_SIZE) - self.margin,
+            int(right // BLOCK_SIZE) + self.margin,
+            int(bottom // BLOCK_SIZE) + self.margin,
+        )
+
+    def row_signature(self, world_y):
+        """The chunk and row version the row's shapes are built from"""
+        chunk_y, y = divmod(world_y, CHUNK_HEIGHT)
+        chunk = chunks.get((0, chunk_y))
+        return (chunk, int(chunk.row_versions[y]) if chunk is not None else None)
+
+    def build_row(self, world_y, first_x, last_x):
+        """Create one box shape per run of solid cells in the row (not yet added to the space)"""
+        chunk_y, y = divmod(world_y, CHUNK_HEIGHT)
+        solid = np.zeros(last_x - first_x + 1, dtype=bool)
+        for chunk_x in range(first_x // CHUNK_WIDTH, last_x // CHUNK_WIDTH + 1):
+            chunk = chunks.get((chunk_x, chunk_y))
+            if chunk is None:
+                continue  # Not generated yet, the signature changes once it is
+            start = max(first_x, chunk_x * CHUNK_WIDTH)
+            end = min(last_x + 1, (chunk_x + 1) * CHUNK_WIDTH)
+            row = chunk.solid_mask()[y]
+            solid[start - first_x:end - first_x] = row[start - chunk_x * CHUNK_WIDTH:end - chunk_x * CHUNK_WIDTH]
+
+        shapes = []
+        top = world_y * BLOCK_SIZE
+        bottom = top + BLOCK_SIZE
+        for start, end in find_runs(solid):
+            left = (first_x + start) * BLOCK_SIZE
+            right = (first_x + end) * BLOCK_SIZE
+            shape = pymunk.Poly(self.space.static_body, [(left, top), (right, top), (right, bottom), (left, bottom)])
+            shape.elasticity = 1  # No bounce
+            shape.collision_type = 2 # Identifier for collisions
+            shape.friction = 1
+            shape.block_cells = (world_y, first_x + start, first_x + end - 1)  # Used to resolve hits to blocks
+            shapes.append(shape)
+        return shapes
+
+    def update(self, bodies):
+        """Rebuild block geometry around the given bodies and release the rest"""
+        wanted = set()
+        for body in bodies:
+            if body.space is not self.space or not body.shapes:
+                continue
+            first_x, first_y, last_x, last_y = self.body_cells(body)
+            wanted.update(range(max(first_y, 0), last_y + 1))
+
+        removed = []
+        added = []
+        for world_y in list(self.rows):
+            if world_y not in wanted:
+                removed.extend(self.rows.pop(world_y).shapes)
+
+        for world_y in wanted:
+            # Rows span the single column of chunks (see chunk.get_chunk), so sideways
+            # movement never changes a row and only destroyed cells rebuild it
+            signature = self.row_signature(world_y)
+            row = self.rows.get(world_y)
+            if row is not None:
+                if row.signature == signature:
+                    continue
+                removed.extend(row.shapes)
+
+            shapes = self.build_row(world_y, 0, CHUNK_WIDTH - 1)
+            self.rows[world_y] = BandRow(signature, shapes)
+            added.extend(shapes)
+
+        if removed:
+            self.space.remove(*removed)
+        if added:
+            self.space.add(*added)
+
+    def release_chunk_rows(self, chunk_ys):
+        """Remove the geometry of every row inside the given chunk rows in one batch"""
+        removed = []
+        for world_y in list(self.rows):
+            if world_y // CHUNK_HEIGHT in chunk_ys:
+                removed.extend(self.rows.pop(world_y).shapes)
+        if removed:
+            self.space.remove(*removed)
+        return len(removed)
+
+    def shape_count(self):
+        return sum(len(row.shapes) for row in self.rows.values())
+
+    def clear(self):
+        """Release every block shape owned by the band"""
+        self.update([])
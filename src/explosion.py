@@ -1,28 +1,56 @@
 import pygame
 import random
 
+# Orientations of the explosion frames: four right-angle rotations, each also mirrored.
+# Right angles keep the sprites lossless and the same size, so every orientation
+# of the 16 frames can be rendered once up front.
+ORIENTATIONS = [(angle, flip) for flip in (False, True) for angle in (0, 90, 180, 270)]
+
+# Pre-rotated frames by texture atlas
+_explosion_frames = {}
+
+def get_explosion_frames(texture_atlas, atlas_items, frame_count=16):
+    """frames[orientation][frame] for the explosion_N textures, built once per atlas"""
+    entry = _explosion_frames.get(id(texture_atlas))
+    if entry is None or len(entry[1][0]) != frame_count:
+        frames = []
+        for angle, flip in ORIENTATIONS:
+            orientation = []
+            for frame in range(frame_count):
+                texture = texture_atlas.subsurface(pygame.Rect(atlas_items["particle"][f"explosion_{frame}"]))
+                if flip:
+                    texture = pygame.transform.flip(texture, True, False)
+                orientation.append(pygame.transform.rotate(texture, angle))
+            frames.append(orientation)
+        entry = (texture_atlas, frames)  # Keeping the atlas alive keeps its id unique
+        _explosion_frames[id(texture_atlas)] = entry
+    return entry[1]
+
 class ExplosionParticle:
-    def __init__(self, pos, texture_atlas, atlas_items, frame_count=16, frame_duration=1):
+    """One animated explosion sprite. Instances are recycled through ExplosionParticlePool."""
+
+    __slots__ = ("x", "y", "frames", "frame_count", "elapsed_time", "frame_duration", "current_frame",
+                 "finished", "color")
+
+    def __init__(self):
+        self.finished = True
+
+    def reset(self, x, y, frames, frame_duration=1):
         """
-        :param pos: Starting position (tuple or pygame.Vector2)
-        :param texture_atlas: The atlas surface containing the explosion frames.
-        :param atlas_items: A dict with keys like "explosion_0", "explosion_1", ... up to frame_count-1.
-        :param frame_count: Total number of explosion frames.
-        :param animation_duration: Total duration of the animation. Interpreted either in ms or frames.
-        :param duration_mode: Either 'ms' for milliseconds or 'frames' for game frames.
+        :param x, y: Starting position.
+        :param frames: The pre-rendered animation frames of one orientation.
+        :param frame_duration: Duration of one frame in ms.
         """
-        self.pos = pygame.Vector2(pos)
-        self.texture_atlas = texture_atlas
-        self.atlas_items = atlas_items
-        self.frame_count = frame_count
-
+        self.x = x
+        self.y = y
+        self.frames = frames
+        self.frame_count = len(frames)
         self.elapsed_time = 0.0
         self.frame_duration = frame_duration
         self.current_frame = 0
         self.finished = False
-
-        # Random rotation between 0 and 360 degrees.
-        self.rotation = random.uniform(0, 360)
+        self.color = None
+        return self
 
     def update(self, dt):
         """Update animation frame based on elapsed time or frame count."""
@@ -38,25 +66,39 @@ class ExplosionParticle:
                 self.finished = True
                 self.current_frame = self.frame_count - 1
 
-
     def draw(self, screen, camera):
         if self.finished:
             return
-        
-        # Get the corresponding rect for the current explosion frame
-        key = f"explosion_{self.current_frame}"
-        # Ensure the atlas_items[key] is a tuple or pygame.Rect
-        rect = pygame.Rect(self.atlas_items["particle"][key])
-        texture = self.texture_atlas.subsurface(rect)
+        # Adjust drawing position by camera offset
+        screen.blit(self.frames[self.current_frame], (self.x - camera.offset_x, self.y - camera.offset_y))
+
+class ExplosionParticlePool:
+    """Free explosion particles, reused so detonations do not allocate new objects"""
+
+    def __init__(self):
+        self.free = []
+        self.created = 0
+
+    def reserve(self, count):
+        """Create particles ahead of time, e.g. at startup"""
+        while len(self.free) < count:
+            self.free.append(ExplosionParticle())
+            self.created += 1
+
+    def acquire(self):
+        if self.free:
+            return self.free.pop()
+        self.created += 1
+        return ExplosionParticle()
 
-        # Rotate the texture
-        texture = pygame.transform.rotate(texture, self.rotation)
+    def release(self, particle):
+        particle.frames = None
+        self.free.append(particle)
 
-        # Scale texture to the desired size
-        # Adjust drawing position by camera offset (if only vertical, subtract camera.offset_y)
-        draw_pos = (self.pos.x - camera.offset_x, self.pos.y - camera.offset_y)
+    def stats(self):
+        return {"free": len(self.free), "created": self.created}
 
-        screen.blit(texture, draw_pos)
+explosion_particle_pool = ExplosionParticlePool()
 
 class Explosion:
     def __init__(self, pos, texture_atlas, atlas_items, particle_count=20):
@@ -67,11 +109,13 @@ class Explosion:
         :param atlas_items: The atlas items dictionary.
         :param particle_count: Number of particles to spawn.
         """
+        frames = get_explosion_frames(texture_atlas, atlas_items)
+        x, y = pos[0], pos[1]
         self.particles = []
         for _ in range(particle_count):
-            # Give each particle a slight random offset around the explosion center
-            offset = pygame.Vector2(random.randint(-200, 200), random.randint(-200, 200))
-            particle = ExplosionParticle(pos + offset, texture_atlas, atlas_items)
+            # Give each particle a slight random offset around the explosion center and a random orientation
+            particle = explosion_particle_pool.acquire().reset(x + random.randint(-200, 200), y + random.randint(-200, 200),
+                                                              random.choice(frames))
             self.particles.append(particle)
 
     def update(self):
@@ -81,8 +125,12 @@ class Explosion:
         for particle in self.particles:
             particle.update(dt)
 
-        # Optionally remove finished particles
-        self.particles = [p for p in self.particles if not p.finished]
+        # Return finished particles to the pool
+        if any(particle.finished for particle in self.particles):
+            for particle in self.particles:
+                if particle.finished:
+                    explosion_particle_pool.release(particle)
+            self.particles = [p for p in self.particles if not p.finished]
 
     def draw(self, screen, camera):
         for particle in self.particles:
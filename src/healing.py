@@ -0,0 +1,57 @@
+import heapq
+import itertools
+from block import HEAL_INTERVAL, MAX_HP
+
+class HealingScheduler:
+    """
+    Heals damaged blocks on a timer instead of checking every block every frame.
+
+    Only damaged cells are kept, in a min-heap keyed by their next heal time.
+    A block that is hit again gets a new entry and its old one is skipped when
+    popped, so the per-frame cost depends on how many blocks are due, not on
+    how many are on screen.
+    """
+
+    def __init__(self):
+        self.heap = []  # (heal time, sequence, chunk, x, y)
+        self.hit = []  # (chunk, x, y) damaged since the last update, destroyed there if out of HP
+        self.sequence = itertools.count()  # Tie breaker so chunks are never compared
+
+    def schedule(self, chunk, x, y, current_time):
+        """(Re)start the healing timer of a cell"""
+        chunk.damage_time[y, x] = current_time
+        heapq.heappush(self.heap, (current_time + HEAL_INTERVAL, next(self.sequence), chunk, x, y))
+
+    def damage(self, chunk, x, y, current_time):
+        """Register a hit on a cell"""
+        self.hit.append((chunk, x, y))
+        self.schedule(chunk, x, y, current_time)
+
+    def damage_cells(self, chunk, ys, xs, current_time):
+        """Register hits on several cells of a chunk (explosions)"""
+        for y, x in zip(ys.tolist(), xs.tolist()):
+            self.damage(chunk, x, y, current_time)
+
+    def update(self, hud, current_time):
+        """Destroy blocks that ran out of HP and heal the ones that are due"""
+        hit, self.hit = self.hit, []
+        for chunk, x, y in hit:
+            if chunk.state != "unloaded" and chunk.is_solid(x, y) and chunk.hp[y, x] <= 0:
+                chunk.block(x, y).destroy(hud)
+
+        while self.heap and self.heap[0][0] <= current_time:
+            heal_time, _, chunk, x, y = heapq.heappop(self.heap)
+            if chunk.state == "unloaded" or not chunk.is_solid(x, y):
+                continue
+            if chunk.damage_time[y, x] + HEAL_INTERVAL != heal_time:
+                continue  # Hit again since, a newer entry is in the heap
+
+            # Heal 20% of the max HP every 5 seconds after the last hit (but not exceeding max_hp)
+            max_hp = MAX_HP[chunk.types[y, x]]
+            chunk.hp[y, x] = min(chunk.hp[y, x] + max_hp * 0.2, max_hp)
+            if chunk.hp[y, x] >= max_hp:
+                chunk.damage_time[y, x] = -1
+            else:
+                self.schedule(chunk, x, y, current_time)
+
+healing_scheduler = HealingScheduler()
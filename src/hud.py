@@ -1,9 +1,18 @@
 import pygame
 from constants import BLOCK_SIZE, CHUNK_HEIGHT
+from text_cache import text_cache
+from render_queue import blit_texture
+from asset_registry import HUD_ICON_SIZE, asset_registry
 
 def render_text_with_outline(text, font, text_color, outline_color, outline_width=2):
+    """Text with an outline (cached, the returned surface is shared)"""
+    return text_cache.get(("outline", text, tuple(text_color), tuple(outline_color), outline_width, font),
+                          lambda: _render_text_with_outline(text, font, text_color, outline_color, outline_width))
+
+def _render_text_with_outline(text, font, text_color, outline_color, outline_width):
     # Render the text in the main color.
     text_surface = font.render(text, True, text_color)
+    outline_text = font.render(text, True, outline_color)
     # Create a new surface larger than the text surface to hold the outline.
     w, h = text_surface.get_size()
     outline_surface = pygame.Surface((w + 2*outline_width, h + 2*outline_width), pygame.SRCALPHA)
@@ -14,7 +23,7 @@ def render_text_with_outline(text, font, text_color, outline_color, outline_widt
             # Only draw outline if offset is non-zero (avoids overdraw, though it's not a big deal)
             if dx != 0 or dy != 0:
                 pos = (dx + outline_width, dy + outline_width)
-                outline_surface.blit(font.render(text, True, outline_color), pos)
+                outline_surface.blit(outline_text, pos)
     
     # Blit the main text in the center.
     outline_surface.blit(text_surface, (outline_width, outline_width))
@@ -48,12 +57,21 @@ class Hud:
         self.combo_multiplier = 1.0
 
         self.position = position
-        self.icon_size = (64, 64)  # Size to draw each icon
+        self.icon_size = HUD_ICON_SIZE  # Size to draw each icon
         self.spacing = 15  # Space between items
 
         # Initialize a font (using the default font and size 24)
         self.font = pygame.font.Font(None, 64)
 
+        # Ore icons pre-scaled to icon_size by the asset registry
+        self.icons = {ore: asset_registry.texture("item", ore, "hud") for ore in self.amounts if ore in atlas_items["item"]}
+
+        # Retained HUD surface and the state it was composed from
+        self.state = None
+        self.surface = None
+        self.surface_position = position
+        self.rebuilds = 0
+
     def update_amounts(self, new_amounts):
         """
         Update the ore amounts.
@@ -76,62 +94,68 @@ class Hud:
     def draw(self, screen, pickaxe_y, fast_slow_active, fast_slow, settings_manager=None):
         """
         Draws the HUD: each ore icon with its amount and other indicators.
+        The HUD is composed into a cached surface that is rebuilt only when what it shows changes.
         """
+        # Update the combo counter
+        self.update_combo()
+        show_combo = settings_manager is None or settings_manager.get_setting("combo_display")
+
+        state = (
+            tuple(self.amounts.values()),
+            -int(pickaxe_y // BLOCK_SIZE),
+            fast_slow if fast_slow_active else "Fast",
+            (self.combo_count, self.combo_multiplier) if self.combo_count > 0 and show_combo else None,
+        )
+        if state != self.state:
+            self.state = state
+            self.surface = self.compose(*state)
+            self.rebuilds += 1
+        blit_texture(screen, ("hud", state), self.surface, self.surface_position)  # The state decides every pixel
+
+    def compose(self, amounts, depth, fast_slow_text, combo):
+        """Render the HUD into one surface and remember where it is drawn."""
         x, y = self.position
+        items = []
 
-        for ore, amount in self.amounts.items():
-            # Retrieve the icon rect from atlas_items["item"][ore]
-            if ore in self.atlas_items["item"]:
-                icon_rect = pygame.Rect(self.atlas_items["item"][ore])
-                icon = self.texture_atlas.subsurface(icon_rect)
-                # Scale the icon to desired icon size
-                icon = pygame.transform.scale(icon, self.icon_size)
-                # Blit the icon
-                screen.blit(icon, (x, y))
-            else:
-                # In case the ore key is missing, skip drawing the icon
+        for ore, amount in zip(self.amounts, amounts):
+            # In case the ore key is missing from the atlas, skip drawing the icon
+            icon = self.icons.get(ore)
+            if icon is None:
                 continue
+            items.append((icon, (x, y)))
 
             # Render the amount text with a black outline.
-            text = str(amount)
-            # You can tweak outline_width, text color, and outline color as needed.
-            text_surface = render_text_with_outline(text, self.font, (255, 255, 255), (0, 0, 0), outline_width=2)
+            text_surface = render_text_with_outline(str(amount), self.font, (255, 255, 255), (0, 0, 0), outline_width=2)
             
             # Position text to the right of the icon
             text_x = x + self.icon_size[0] + self.spacing
             text_y = y + (self.icon_size[1] - text_surface.get_height()) // 2 + 3
-            screen.blit(text_surface, (text_x, text_y))
+            items.append((text_surface, (text_x, text_y)))
 
             # Move to the next line
             y += self.icon_size[1] + self.spacing
 
-        # Draw the pickaxe position indicator with outlined text
-        pickaxe_indicator_text = f"Y: {-int(pickaxe_y // BLOCK_SIZE)}"
-        pickaxe_indicator_surface = render_text_with_outline(pickaxe_indicator_text, self.font, (255, 255, 255), (0, 0, 0), outline_width=2)
-        pickaxe_indicator_x = x + self.spacing
-        pickaxe_indicator_y = y + self.spacing
-        screen.blit(pickaxe_indicator_surface, (pickaxe_indicator_x, pickaxe_indicator_y))
-
-        # Draw the fast/slow indicator with outlined text
-        if fast_slow_active:
-            fast_slow_text = f"{fast_slow}"
-        else:
-            fast_slow_text = "Fast"
+        # Pickaxe position indicator
+        pickaxe_indicator_surface = render_text_with_outline(f"Y: {depth}", self.font, (255, 255, 255), (0, 0, 0), outline_width=2)
+        items.append((pickaxe_indicator_surface, (x + self.spacing, y + self.spacing)))
+
+        # Fast/slow indicator
         fast_slow_surface = render_text_with_outline(fast_slow_text, self.font, (255, 255, 255), (0, 0, 0), outline_width=2)
-        fast_slow_x = x + self.spacing
         fast_slow_y = y + 2 * self.spacing + fast_slow_surface.get_height()
-        screen.blit(fast_slow_surface, (fast_slow_x, fast_slow_y))
-        
-        # Update and draw combo counter
-        self.update_combo()
-        show_combo = settings_manager is None or settings_manager.get_setting("combo_display")
-        if self.combo_count > 0 and show_combo:
-            combo_text = f"COMBO: {self.combo_count}x ({self.combo_multiplier:.1f}x)"
-            combo_color = (255, 255, 0) if self.combo_count >= 10 else (255, 255, 255)
+        items.append((fast_slow_surface, (x + self.spacing, fast_slow_y)))
+
+        # Combo counter
+        if combo is not None:
+            combo_count, combo_multiplier = combo
+            combo_text = f"COMBO: {combo_count}x ({combo_multiplier:.1f}x)"
+            combo_color = (255, 255, 0) if combo_count >= 10 else (255, 255, 255)
             combo_surface = render_text_with_outline(combo_text, self.font, combo_color, (0, 0, 0), outline_width=2)
-            combo_x = x + self.spacing
             combo_y = fast_slow_y + 2 * self.spacing + combo_surface.get_height()
-            screen.blit(combo_surface, (combo_x, combo_y))
-
-            
+            items.append((combo_surface, (x + self.spacing, combo_y)))
 
+        bounds = pygame.Rect(items[0][1], items[0][0].get_size()).unionall(
+            [pygame.Rect(position, surface.get_size()) for surface, position in items])
+        surface = pygame.Surface(bounds.size, pygame.SRCALPHA)
+        surface.blits([(item, (px - bounds.x, py - bounds.y)) for item, (px, py) in items], doreturn=False)
+        self.surface_position = bounds.topleft
+        return surface
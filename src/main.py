@@ -4,14 +4,25 @@ import pymunk
 import pymunk.pygame_util
 from youtube import get_live_stream, get_new_live_chat_messages, get_live_chat_id, get_subscriber_count, validate_live_stream_id, get_live_streams
 from config import config
-from atlas import create_texture_atlas
+from asset_registry import asset_registry
 from pathlib import Path
-from chunk import get_block, clean_chunks, delete_block, chunks
-from constants import BLOCK_SCALE_FACTOR, BLOCK_SIZE, CHUNK_HEIGHT, CHUNK_WIDTH, INTERNAL_HEIGHT, INTERNAL_WIDTH, FRAMERATE
+from chunk import delete_block, chunks, damaged_textures, draw_bedrock_border
+from chunk_manager import ChunkManager
+from collision import CollisionBand, add_side_walls
+from prefetch import ChunkPrefetcher
+from constants import BLOCK_SIZE, CHUNK_HEIGHT, INTERNAL_HEIGHT, INTERNAL_WIDTH, FRAMERATE
 from pickaxe import Pickaxe
 from camera import Camera
 from sound import SoundManager
 from tnt import Tnt, MegaTnt
+from damage import explosion_damage
+from healing import healing_scheduler
+from sprite_cache import rotation_cache, scaled_sprites
+from render_queue import RenderQueue
+from present import create_presenter
+from text_cache import text_cache
+from particles import particle_engine
+from explosion import Explosion, explosion_particle_pool, get_explosion_frames
 import asyncio
 import threading
 import random
@@ -466,20 +477,33 @@ def game():
     space = pymunk.Space()
     space.gravity = (0, 1000)  # (x, y) - down is positive y
 
-    # Create a resizable window
+    # Block shapes only exist near the pickaxe and TNT
+    collision_band = CollisionBand(space)
+    add_side_walls(space)
+
+    # Settings pick the present backend, so they are loaded before the window exists
+    settings_manager = SettingsManager()
+
+    # Create a resizable window, either the display surface or an SDL2 renderer window
     screen_size = (window_width, window_height)
-    screen = pygame.display.set_mode(screen_size, pygame.RESIZABLE)
-    pygame.display.set_caption("Falling Pickaxe")
-    # set icon
+    presenter = create_presenter(settings_manager.get_setting("present_backend"), screen_size,
+                                 (INTERNAL_WIDTH, INTERNAL_HEIGHT), settings_manager.get_setting("present_filter"))
     icon = pygame.image.load(Path(__file__).parent.parent / "src/assets/pickaxe" / "diamond_pickaxe.png")
-    pygame.display.set_icon(icon)
+    if presenter.overlay_on_frame:
+        screen = None  # The renderer owns the window
+        presenter.set_icon(icon)
+    else:
+        screen = pygame.display.set_mode(screen_size, pygame.RESIZABLE)
+        pygame.display.set_caption("Falling Pickaxe")
+        # set icon
+        pygame.display.set_icon(icon)
 
     # Create an internal surface with fixed resolution
     internal_surface = pygame.Surface((INTERNAL_WIDTH, INTERNAL_HEIGHT))
 
-    # Load texture atlas
+    # Load texture atlas (block scale, shared through the asset registry)
     assets_dir = Path(__file__).parent.parent / "src/assets"
-    (texture_atlas, atlas_items) = create_texture_atlas(assets_dir)
+    (texture_atlas, atlas_items) = asset_registry.atlas()
 
     # Load background
     background_image = pygame.image.load(assets_dir / "background.png")
@@ -488,15 +512,18 @@ def game():
     background_height = int(background_image.get_height() * background_scale_factor)
     background_image = pygame.transform.scale(background_image, (background_width, background_height))
 
-    # Scale the entire texture atlas
-    texture_atlas = pygame.transform.scale(texture_atlas,
-                                        (texture_atlas.get_width() * BLOCK_SCALE_FACTOR,
-                                        texture_atlas.get_height() * BLOCK_SCALE_FACTOR))
+    # Rotate the explosion frames and create the explosion particles up front, so detonations don't allocate
+    get_explosion_frames(texture_atlas, atlas_items)
+    explosion_particle_pool.reserve(200)
+
+    # Generate chunk rows ahead of the pickaxe in the background
+    chunk_prefetcher = ChunkPrefetcher(texture_atlas, atlas_items)
 
-    for category in atlas_items:
-        for item in atlas_items[category]:
-            x, y, w, h = atlas_items[category][item]
-            atlas_items[category][item] = (x * BLOCK_SCALE_FACTOR, y * BLOCK_SCALE_FACTOR, w * BLOCK_SCALE_FACTOR, h * BLOCK_SCALE_FACTOR)
+    # Sprites are queued per layer and drawn with one Surface.blits call each
+    render_queue = RenderQueue((INTERNAL_WIDTH, INTERNAL_HEIGHT))
+
+    # Activates visible chunks and unloads the ones far above the screen
+    chunk_manager = ChunkManager(collision_band, texture_atlas, atlas_items)
 
     #sounds
     sound_manager = SoundManager()
@@ -527,7 +554,7 @@ def game():
     camera = Camera()
 
     # Pickaxe
-    pickaxe = Pickaxe(space, INTERNAL_WIDTH // 2, INTERNAL_HEIGHT // 2, texture_atlas.subsurface(atlas_items["pickaxe"]["wooden_pickaxe"]), sound_manager)
+    pickaxe = Pickaxe(space, INTERNAL_WIDTH // 2, INTERNAL_HEIGHT // 2, "wooden_pickaxe", sound_manager)
     pickaxe.camera_ref = camera  # Connect camera for screen shake effects
 
     # TNT
@@ -556,8 +583,7 @@ def game():
     # Explosions
     explosions = []
 
-    # Settings and Weather
-    settings_manager = SettingsManager()
+    # Weather
     weather_system = WeatherSystem()
     
     # Streaming - check if already initialized from OAuth or other auto-setup
@@ -660,6 +686,16 @@ def game():
                     notification_manager.add_like_achievement("LikeUser456")
                 elif event.key == pygame.K_F3:  # Press F3 to test anonymous subscriber
                     notification_manager.add_subscriber_achievement()
+                elif event.key == pygame.K_F4:  # Press F4 to print chunk and physics counters
+                    print(f"📊 Chunks: {chunk_manager.stats()}")
+                    print(f"📊 Damaged block textures: {damaged_textures.stats()}")
+                    print(f"📊 Rotated sprites: {rotation_cache.stats()}")
+                    print(f"📊 Render layers: {render_queue.stats()}")
+                    print(f"📊 Text surfaces: {text_cache.stats()}")
+                    print(f"📊 Particles: {particle_engine.stats()}")
+                    print(f"📊 Explosion particles: {explosion_particle_pool.stats()}")
+                    print(f"📊 Scaled sprites: {scaled_sprites.stats()}")
+                    print(f"📊 Present: scale {render_queue.scale}, {presenter.present_filter}, {presenter.present_time} ms")
             elif settings_manager.handle_input(event):
                 continue  # Settings handled the input
             elif event.type == pygame.VIDEORESIZE:  # Window resize event
@@ -672,7 +708,9 @@ def game():
                     new_height = int(new_width * (16 / 9))
 
                 window_width, window_height = new_width, new_height
-                screen = pygame.display.set_mode((window_width, window_height), pygame.RESIZABLE)
+                if not presenter.overlay_on_frame:
+                    screen = pygame.display.set_mode((window_width, window_height), pygame.RESIZABLE)
+                # The SDL2 renderer letterboxes the frame to any window size itself
 
         # ++++++++++++++++++  UPDATE ++++++++++++++++++
         # Determine which chunks are visible
@@ -684,11 +722,15 @@ def game():
         elif fast_slow_active and fast_slow == "Slow":
             step_speed = 1 / (FRAMERATE * 2)
 
+        collision_band.update([pickaxe.body] + [tnt.body for tnt in tnt_list])
         space.step(step_speed)
 
         start_chunk_y = int(pickaxe.body.position.y // (CHUNK_HEIGHT * BLOCK_SIZE) - 1) - 1
         end_chunk_y = int(pickaxe.body.position.y + INTERNAL_HEIGHT) // (CHUNK_HEIGHT * BLOCK_SIZE)  + 1
 
+        # Commit prefetched chunks and request the next rows
+        chunk_prefetcher.update(pickaxe.body.position.y, pickaxe.body.velocity.y, step_speed, start_chunk_y)
+
         # Update pickaxe
         pickaxe.update()
 
@@ -697,10 +739,17 @@ def game():
 
         # ++++++++++++++++++  DRAWING ++++++++++++++++++
         # Clear the internal surface
-        screen.fill((0, 0, 0))
+        if screen is not None:
+            screen.fill((0, 0, 0))
+
+        # Below a render scale of 1 the frame is drawn smaller and only scaled once, to the window
+        render_scale = settings_manager.get_setting("render_scale")
+        if render_scale != render_queue.scale:
+            render_queue.set_scale(render_scale)
+            internal_surface = pygame.Surface(render_queue.frame_size())
 
         # Fill internal surface with the background
-        internal_surface.blit(background_image, ((INTERNAL_WIDTH - background_width) // 2, (INTERNAL_HEIGHT - background_height) // 2))
+        render_queue["world"].blit_texture("background", background_image, ((INTERNAL_WIDTH - background_width) // 2, (INTERNAL_HEIGHT - background_height) // 2))
 
         # Check if it's time to spawn a new TNT (regular random spawn)
         current_time = pygame.time.get_ticks()
@@ -715,7 +764,7 @@ def game():
 
         # Check if it's time to change the pickaxe (random)
         if settings_manager.get_setting("auto_pickaxe_change") and (not config["CHAT_CONTROL"] or not pickaxe_queue) and current_time - last_random_pickaxe >= random_pickaxe_interval:
-            pickaxe.random_pickaxe(texture_atlas, atlas_items)
+            pickaxe.random_pickaxe(atlas_items)
             last_random_pickaxe = current_time
             # New random interval for the next pickaxe change
             random_pickaxe_interval = 1000 * random.uniform(config["RANDOM_PICKAXE_INTERVAL_SECONDS_MIN"], config["RANDOM_PICKAXE_INTERVAL_SECONDS_MAX"])
@@ -745,6 +794,15 @@ def game():
         for tnt in tnt_list:
             tnt.update(tnt_list, explosions, camera)
 
+        # Damage blocks for every TNT that exploded this frame at once
+        explosion_damage.apply()
+
+        # Cap every particle emitter by the particle budget
+        if settings_manager.get_setting("performance_mode"):
+            particle_engine.set_max_particles(50)
+        else:
+            particle_engine.set_max_particles(settings_manager.get_setting("max_particles"))
+
         # Update weather system
         weather_system.update(settings_manager)
 
@@ -839,7 +897,7 @@ def game():
             if pickaxe_queue:
                 author, pickaxe_type = pickaxe_queue.pop(0)
                 print(f"Changing pickaxe for {author} to {pickaxe_type}")
-                pickaxe.pickaxe(pickaxe_type, texture_atlas, atlas_items)
+                pickaxe.pickaxe(pickaxe_type)
                 last_random_pickaxe = current_time
                 random_pickaxe_interval = 1000 * random.uniform(config["RANDOM_PICKAXE_INTERVAL_SECONDS_MIN"], config["RANDOM_PICKAXE_INTERVAL_SECONDS_MAX"])
                 
@@ -888,11 +946,9 @@ def game():
                 for _ in range(5):
                     x_offset = random.randint(-200, 200)
                     y_offset = random.randint(-150, -50)
-                    from explosion import Explosion
                     rainbow_explosion = Explosion(
-                        pickaxe.body.position.x + x_offset,
-                        pickaxe.body.position.y + y_offset,
-                        75, texture_atlas, atlas_items
+                        (pickaxe.body.position.x + x_offset, pickaxe.body.position.y + y_offset),
+                        texture_atlas, atlas_items
                     )
                     # Make it rainbow colored
                     for particle in rainbow_explosion.particles:
@@ -924,52 +980,57 @@ def game():
                     pickaxe.enlarge(20000)  # 20 seconds of giant pickaxe
 
 
-        # Delete chunks
-        clean_chunks(start_chunk_y)
-
-        # Draw blocks in visible chunks
-        for chunk_x in range(-1, 2):
-            for chunk_y in range(start_chunk_y, end_chunk_y):
-                for y in range(CHUNK_HEIGHT):
-                    for x in range(CHUNK_WIDTH):
-                        block = get_block(chunk_x, chunk_y, x, y, texture_atlas, atlas_items, space)
+        # Activate visible chunks, unload the ones far above
+        chunk_manager.update(start_chunk_y, end_chunk_y)
 
-                        if block == None:
-                            continue
+        # Destroy blocks that ran out of HP and heal the damaged ones that are due
+        healing_scheduler.update(hud, current_time)
 
-                        block.update(space, hud)
-                        block.draw(internal_surface, camera)
+        # Draw blocks in visible chunks
+        world_layer = render_queue["world"]
+        draw_bedrock_border(world_layer, camera, texture_atlas, atlas_items)
+        for chunk in chunk_manager.active:
+            chunk.draw(world_layer, camera)
 
         # Draw pickaxe
-        pickaxe.draw(internal_surface, camera)
+        pickaxe.draw(world_layer, camera)
 
         # Draw TNT
         for tnt in tnt_list:
-            tnt.draw(internal_surface, camera)
+            tnt.draw(world_layer, camera)
+        render_queue.flush("world", internal_surface)
 
         # Draw particles
         for explosion in explosions:
             explosion.update()
-            explosion.draw(internal_surface, camera)
+            explosion.draw(render_queue["effects"], camera)
+
+        # Draw weather effects, above the explosions
+        weather_system.draw(render_queue["effects"], camera, settings_manager)
+        render_queue.flush("effects", internal_surface)
 
         # Optionally, remove explosions that have no particles left:
         explosions = [e for e in explosions if e.particles]
 
-        # Draw weather effects
-        weather_system.draw(internal_surface, camera, settings_manager)
-
         # Draw HUD
-        hud.draw(internal_surface, pickaxe.body.position.y, fast_slow_active, fast_slow, settings_manager)
+        hud.draw(render_queue["hud"], pickaxe.body.position.y, fast_slow_active, fast_slow, settings_manager)
+        render_queue.flush("hud", internal_surface)
 
         # Scale internal surface to fit the resized window
-        scaled_surface = pygame.transform.smoothscale(internal_surface, (window_width, window_height))
-        screen.blit(scaled_surface, (0, 0))
+        presenter.present_filter = settings_manager.get_setting("present_filter")
+        presenter.present(internal_surface, screen, (window_width, window_height))
 
-        # Draw notifications on the scaled screen
-        notification_manager.draw(screen, camera, window_width, window_height)
+        # Draw notifications on the scaled screen, or on the frame the renderer uploads
+        if presenter.overlay_on_frame:
+            overlay_surface, (overlay_width, overlay_height) = internal_surface, internal_surface.get_size()
+        else:
+            overlay_surface, overlay_width, overlay_height = screen, window_width, window_height
+        render_queue["overlay"].size = (overlay_width, overlay_height)
+        notification_manager.draw(render_queue["overlay"], camera, overlay_width, overlay_height)
+        render_queue.flush("overlay", overlay_surface)
 
         # Draw settings panel (on top of scaled surface)
-        settings_manager.draw(screen)
+        settings_manager.draw(overlay_surface)
 
         # Save progress
         if current_time - last_save_progress >= save_progress_interval:
@@ -999,7 +1060,7 @@ def game():
         #     stream_manager.capture_frame(screen)
 
         # Update the display
-        pygame.display.flip()
+        presenter.flip(internal_surface)
         clock.tick(FRAMERATE)  # Cap the frame rate
 
         # Inside the main loop
@@ -1,6 +1,7 @@
 import pygame
 import os
 from pathlib import Path
+from text_cache import text_cache
 
 class MinecraftFont:
     def __init__(self):
@@ -70,7 +71,11 @@ class MinecraftFont:
         self._initialized = True
 
     def render_with_shadow(self, text, color, shadow_color, size="normal"):
-        """Render text with shadow effect"""
+        """Render text with shadow effect (cached, the returned surface is shared)"""
+        return text_cache.get(("shadow", text, tuple(color), tuple(shadow_color), size),
+                              lambda: self._render_with_shadow(text, color, shadow_color, size))
+
+    def _render_with_shadow(self, text, color, shadow_color, size):
         if size == "tiny":
             font_size = 8
         elif size == "small":
@@ -3,6 +3,9 @@ import pygame
 import time
 import random
 from minecraft_font import minecraft_font
+from asset_registry import asset_registry
+
+LEADERBOARD_SIZE = 5  # Top players shown on the right panel
 
 class Achievement:
     def __init__(self, title, description, x=None, y=None, play_sound=True):
@@ -103,7 +106,8 @@ class CommandNotification:
         
         # Create notification surface
         notification_text = f"{self.username}: {self.command}"
-        text_surface = minecraft_font.render_with_shadow(notification_text, (255, 255, 0), (0, 0, 0), "small")
+        # Copy the shared cached text before fading it
+        text_surface = minecraft_font.render_with_shadow(notification_text, (255, 255, 0), (0, 0, 0), "small").copy()
         text_surface.set_alpha(alpha)
         
         # Draw background
@@ -160,6 +164,15 @@ class RightPanel:
         # Cache textures to reduce lag
         self.texture_cache = {}
         self.texture_cache_loaded = False
+
+        # Cached panel background and text, with the state the text was rendered for
+        self.background = None
+        self.background_height = None
+        self.content = None
+        self.content_position = (0, 0)
+        self.content_state = None
+        self.leaderboard_y = 0  # Where the reserved leaderboard and subscriber rows start, set by _render_background
+        self.subscriber_y = None
         
     def update(self):
         self.top_players.update()
@@ -172,59 +185,42 @@ class RightPanel:
         if self.texture_cache_loaded:
             return
         try:
-            from pathlib import Path
-            from atlas import create_texture_atlas
-            from constants import BLOCK_SCALE_FACTOR
-            assets_dir = Path(__file__).parent.parent / "src/assets"
-            (texture_atlas, atlas_items) = create_texture_atlas(assets_dir)
-            texture_atlas = pygame.transform.scale(texture_atlas,
-                                                (texture_atlas.get_width() * BLOCK_SCALE_FACTOR,
-                                                texture_atlas.get_height() * BLOCK_SCALE_FACTOR))
-            for category in atlas_items:
-                for item in atlas_items[category]:
-                    x, y, w, h = atlas_items[category][item]
-                    atlas_items[category][item] = (x * BLOCK_SCALE_FACTOR, y * BLOCK_SCALE_FACTOR, w * BLOCK_SCALE_FACTOR, h * BLOCK_SCALE_FACTOR)
-            
             # Cache the icons we need (2x larger)
-            mega_tnt_rect = pygame.Rect(atlas_items["block"]["mega_tnt"])
-            self.texture_cache["mega_tnt"] = pygame.transform.scale(
-                texture_atlas.subsurface(mega_tnt_rect), (24, 24))
-            
-            tnt_rect = pygame.Rect(atlas_items["block"]["tnt"])
-            self.texture_cache["tnt"] = pygame.transform.scale(
-                texture_atlas.subsurface(tnt_rect), (24, 24))
-                
+            self.texture_cache["mega_tnt"] = asset_registry.texture("block", "mega_tnt", "panel")
+            self.texture_cache["tnt"] = asset_registry.texture("block", "tnt", "panel")
             self.texture_cache_loaded = True
         except:
             self.texture_cache_loaded = True  # Don't keep trying
 
     def draw(self, surface, screen_width, screen_height):
         panel_x = screen_width - self.width
-        
-        # Draw fading panel background
-        fade_start = int(screen_height * 0.33)  # Start fade at 1/3 down
-        fade_end = int(screen_height * 0.45)    # End fade at 45% down
-        
-        # Solid panel for top 1/3
-        if fade_start > 0:
-            panel_surface_top = pygame.Surface((self.width, fade_start))
-            panel_surface_top.fill((64, 64, 64))
-            panel_surface_top.set_alpha(180)
-            surface.blit(panel_surface_top, (panel_x, 0))
-        
-        # Fading section from 33% to 45%
-        if fade_end > fade_start:
-            fade_height = fade_end - fade_start
-            for i in range(fade_height):
-                fade_progress = i / fade_height  # 0.0 to 1.0
-                alpha = int(180 * (1.0 - fade_progress))  # 180 to 0
-                
-                if alpha > 0:
-                    line_surface = pygame.Surface((self.width, 1))
-                    line_surface.fill((64, 64, 64))
-                    line_surface.set_alpha(alpha)
-                    surface.blit(line_surface, (panel_x, fade_start + i))
-        
+
+        # Fading panel background with the fixed labels and icons, rendered once per screen height
+        if self.background is None or self.background_height != screen_height:
+            self._load_texture_cache()
+            self.background = self._render_background(screen_height)
+            self.background_height = screen_height
+        surface.blit(self.background, (panel_x, 0))
+
+        # Leaderboard names and subscriber, rendered again only when the ranking or the shown subscriber changes
+        top_players = tuple(username for username, activity in self.top_players.get_top_players(LEADERBOARD_SIZE))
+        subscriber = None
+        if self.recent_subscriber and pygame.time.get_ticks() < self.subscriber_display_timer:
+            subscriber = self.recent_subscriber[:8]
+        content_state = (top_players, subscriber)
+        if content_state != self.content_state:
+            self.content_state = content_state
+            self.content, self.content_position = self._render_content(top_players, subscriber)
+        if self.content is not None:
+            surface.blit(self.content, (panel_x + self.content_position[0], self.content_position[1]))
+
+    def _render_background(self, screen_height):
+        """
+        Panel background: solid down to 33% of the screen, then fading out until 45%,
+        under the labels and icons that never change. Rows are reserved for the leaderboard
+        and the recent subscriber, see _render_content.
+        """
+        items = []
         y_offset = 8  # Start closer to top
         
         # TOP PLAYERS FIRST (at the top) - countdown disabled
@@ -234,57 +230,45 @@ class RightPanel:
         # players_title = minecraft_font.render_with_shadow(f"TOP ({minutes:02d}:{seconds:02d})", (255, 255, 0), (0, 0, 0), "tiny")
         
         players_title = minecraft_font.render_with_shadow("TOP", (255, 255, 0), (0, 0, 0), "tiny")
-        surface.blit(players_title, (panel_x + 3, y_offset))
+        items.append((players_title, (3, y_offset)))
         y_offset += players_title.get_height() + 3
         
-        # Show top 5 players (no profile pics for performance)
-        top_players = self.top_players.get_top_players(5)
-        for i, (username, activity) in enumerate(top_players):
-            rank_color = self.get_rank_color(i)
-            
-            # Extend username to 10 characters, right justified to expand left
-            display_name = username[:10] + "..." if len(username) > 10 else username
-            player_text = minecraft_font.render_with_shadow(display_name, rank_color, (0, 0, 0), "tiny")
-            
-            # Right justify - position text so it can extend beyond panel to the left
-            text_x = panel_x + self.width - 3 - player_text.get_width()
-            surface.blit(player_text, (text_x, y_offset))
-            y_offset += player_text.get_height() + 1
+        # Room for the top 5 players, drawn by _render_content
+        line_height = players_title.get_height()
+        self.leaderboard_y = y_offset
+        y_offset += LEADERBOARD_SIZE * (line_height + 1)
         
         y_offset += 10  # Space between sections
         
         # REWARDS section (simplified)
-        self._load_texture_cache()
-        
         if "mega_tnt" in self.texture_cache:
-            surface.blit(self.texture_cache["mega_tnt"], (panel_x + 3, y_offset))
+            items.append((self.texture_cache["mega_tnt"], (3, y_offset)))
             sub_text = minecraft_font.render_with_shadow("Sub=MEGA", (255, 100, 100), (0, 0, 0), "tiny")
-            surface.blit(sub_text, (panel_x + 35, y_offset))  # Moved further right for larger icon
+            items.append((sub_text, (35, y_offset)))  # Moved further right for larger icon
             y_offset += 26  # Increased for larger icon
             
-            # Show recent subscriber name if available
-            if self.recent_subscriber and pygame.time.get_ticks() < self.subscriber_display_timer:
-                sub_name = minecraft_font.render_with_shadow(f"{self.recent_subscriber[:8]}", (255, 255, 100), (0, 0, 0), "tiny")
-                surface.blit(sub_name, (panel_x + 3, y_offset))
-                y_offset += sub_name.get_height() + 2
+            # Room for the recent subscriber name
+            self.subscriber_y = y_offset
+            y_offset += line_height + 2
         else:
             sub_text = minecraft_font.render_with_shadow("Sub=MEGA", (255, 100, 100), (0, 0, 0), "tiny")
-            surface.blit(sub_text, (panel_x + 3, y_offset))
+            items.append((sub_text, (3, y_offset)))
             y_offset += sub_text.get_height() + 3
+            self.subscriber_y = None
             
         # Like reward
         like_text = minecraft_font.render_with_shadow("Like", (100, 255, 100), (0, 0, 0), "tiny")
-        surface.blit(like_text, (panel_x + 3, y_offset))
+        items.append((like_text, (3, y_offset)))
         y_offset += like_text.get_height() + 1
         
         if "tnt" in self.texture_cache:
             like_count = minecraft_font.render_with_shadow("10X", (100, 255, 100), (0, 0, 0), "tiny")
-            surface.blit(like_count, (panel_x + 3, y_offset))
-            surface.blit(self.texture_cache["tnt"], (panel_x + 35, y_offset))  # Moved further right
+            items.append((like_count, (3, y_offset)))
+            items.append((self.texture_cache["tnt"], (35, y_offset)))  # Moved further right
             y_offset += 26  # Increased for larger icon
         else:
             like_count = minecraft_font.render_with_shadow("10 TNT", (100, 255, 100), (0, 0, 0), "tiny")
-            surface.blit(like_count, (panel_x + 3, y_offset))
+            items.append((like_count, (3, y_offset)))
             y_offset += like_count.get_height() + 6
         
         # Add gap before COMMANDS section
@@ -292,7 +276,7 @@ class RightPanel:
         
         # COMMANDS section (simplified, single column)
         commands_title = minecraft_font.render_with_shadow("Commands:", (255, 255, 255), (0, 0, 0), "tiny")
-        surface.blit(commands_title, (panel_x + 3, y_offset))
+        items.append((commands_title, (3, y_offset)))
         y_offset += commands_title.get_height() + 3
         
         # Show only most important commands in single column
@@ -300,8 +284,55 @@ class RightPanel:
         for command in important_commands:
             command_color = self.get_command_color(command)
             command_text = minecraft_font.render_with_shadow(f"•{command}", command_color, (0, 0, 0), "tiny")
-            surface.blit(command_text, (panel_x + 3, y_offset))
+            items.append((command_text, (3, y_offset)))
             y_offset += command_text.get_height() + 1
+
+        fade_start = int(screen_height * 0.33)  # Start fade at 1/3 down
+        fade_end = int(screen_height * 0.45)    # End fade at 45% down
+        background = pygame.Surface((self.width, max(1, fade_end, y_offset)), pygame.SRCALPHA)
+
+        # Solid panel for top 1/3
+        background.fill((64, 64, 64, 180), (0, 0, self.width, fade_start))
+
+        # Fading section from 33% to 45%
+        fade_height = fade_end - fade_start
+        for i in range(fade_height):
+            alpha = int(180 * (1.0 - i / fade_height))  # 180 to 0
+            background.fill((64, 64, 64, alpha), (0, fade_start + i, self.width, 1))
+
+        background.blits(items, doreturn=False)
+        return background
+
+    def _render_content(self, top_players, subscriber):
+        """Render the leaderboard names and the recent subscriber into one surface, positioned relative to the panel"""
+        items = []
+        y_offset = self.leaderboard_y
+
+        # Show top 5 players (no profile pics for performance)
+        for i, username in enumerate(top_players):
+            rank_color = self.get_rank_color(i)
+            
+            # Extend username to 10 characters, right justified to expand left
+            display_name = username[:10] + "..." if len(username) > 10 else username
+            player_text = minecraft_font.render_with_shadow(display_name, rank_color, (0, 0, 0), "tiny")
+            
+            # Right justify - position text so it can extend beyond panel to the left
+            text_x = self.width - 3 - player_text.get_width()
+            items.append((player_text, (text_x, y_offset)))
+            y_offset += player_text.get_height() + 1
+
+        # Show recent subscriber name if available, under the Mega TNT reward
+        if subscriber and self.subscriber_y is not None:
+            sub_name = minecraft_font.render_with_shadow(subscriber, (255, 255, 100), (0, 0, 0), "tiny")
+            items.append((sub_name, (3, self.subscriber_y)))
+
+        if not items:
+            return None, (0, 0)
+        bounds = pygame.Rect(items[0][1], items[0][0].get_size()).unionall(
+            [pygame.Rect(position, item.get_size()) for item, position in items])
+        content = pygame.Surface(bounds.size, pygame.SRCALPHA)
+        content.blits([(item, (x - bounds.x, y - bounds.y)) for item, (x, y) in items], doreturn=False)
+        return content, bounds.topleft
             
     def get_command_color(self, command):
         """Get color for different commands"""
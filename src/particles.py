@@ -0,0 +1,193 @@
+from collections import OrderedDict
+import numpy as np
+import pygame
+
+ALPHA_LEVELS = 16  # Fade steps of the pre-rendered sprites
+MAX_SPRITES = 256  # Pre-rendered sprites kept per emitter, least recently used ones are evicted
+
+def render_sprite(shape, size, color, alpha):
+    """One particle sprite, centered in its surface"""
+    if shape == "disc":
+        surface = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+        pygame.draw.circle(surface, (*color, alpha), (size, size), size)
+    elif shape == "square":
+        surface = pygame.Surface((size, size), pygame.SRCALPHA)
+        surface.fill((*color, alpha))
+    elif shape == "raindrop":
+        surface = pygame.Surface((4, size + 2), pygame.SRCALPHA)
+        pygame.draw.line(surface, (*color, alpha), (3, 0), (1, size), 2)
+    elif shape == "snowflake":
+        surface = pygame.Surface((size + 1, size + 1), pygame.SRCALPHA)
+        center = size // 2
+        pygame.draw.circle(surface, (*color, alpha), (center, center), size // 2)
+        # Small cross pattern for the snowflake effect
+        pygame.draw.line(surface, (*color, alpha), (0, center), (size, center), 1)
+        pygame.draw.line(surface, (*color, alpha), (center, 0), (center, size), 1)
+    else:
+        raise ValueError(f"Unknown particle shape: {shape}")
+    return surface
+
+class ParticleEmitter:
+    """
+    Particles of one effect stored as NumPy arrays (struct of arrays).
+
+    Particles move by their velocity and lose one life per update. Dead ones are
+    removed by moving the last live particles into their slots, so the live
+    particles always fill the first `count` entries. Sprites are pre-rendered
+    per shape, size, color and fade level and shared between frames, up to
+    MAX_SPRITES of them.
+    """
+
+    def __init__(self, name, shape, capacity, fade=True, budget=None):
+        self.name = name
+        self.shape = shape
+        self.capacity = capacity  # Size of the arrays, the most particles this emitter ever holds
+        self.limit = capacity  # Current cap, lowered with max_particles
+        self.fade = fade  # Fade sprites out with their remaining life
+        self.count = 0
+        self.x = np.zeros(capacity, np.float32)
+        self.y = np.zeros(capacity, np.float32)
+        self.vx = np.zeros(capacity, np.float32)
+        self.vy = np.zeros(capacity, np.float32)
+        self.life = np.zeros(capacity, np.int32)
+        self.max_life = np.ones(capacity, np.int32)
+        self.size = np.zeros(capacity, np.int32)
+        self.color = np.zeros((capacity, 3), np.uint8)
+        self.budget = budget  # ParticleBudget shared with other emitters, if any
+        self.sprites = OrderedDict()  # (size, color, alpha level) -> surface
+        self.dropped = 0  # Spawns refused by the cap
+
+    def spawn(self, x, y, vx=0, vy=0, life=30, size=4, color=(255, 255, 255)):
+        """Add particles; every argument is a scalar or an array with one value per particle"""
+        n = max(np.size(x), np.size(y))
+        room = max(0, min(self.limit, self.capacity) - self.count)
+        if self.budget is not None:
+            room = min(room, max(0, self.budget.limit - self.budget.count()))
+        if n > room:
+            self.dropped += n - room
+            n = room
+        if n == 0:
+            return
+        s = slice(self.count, self.count + n)
+
+        def values(value):
+            return value[:n] if np.ndim(value) else value
+
+        self.x[s] = values(x)
+        self.y[s] = values(y)
+        self.vx[s] = values(vx)
+        self.vy[s] = values(vy)
+        self.life[s] = values(life)
+        self.max_life[s] = values(life)
+        self.size[s] = values(size)
+        self.color[s] = np.asarray(color, np.uint8)[:n] if np.ndim(color) == 2 else color
+        self.count += n
+
+    def update(self, bounds=None):
+        """Move the particles and remove the dead ones, and those outside bounds (left, top, right, bottom)"""
+        n = self.count
+        if n == 0:
+            return
+        self.x[:n] += self.vx[:n]
+        self.y[:n] += self.vy[:n]
+        self.life[:n] -= 1
+        alive = self.life[:n] > 0
+        if bounds is not None:
+            left, top, right, bottom = bounds
+            alive &= (self.x[:n] >= left) & (self.x[:n] <= right) & (self.y[:n] >= top) & (self.y[:n] <= bottom)
+        self.compact(alive)
+        # Drop the particles over the cap when it was lowered
+        if self.count > self.limit:
+            self.count = max(0, self.limit)
+        if self.budget is not None:
+            self.count = max(0, self.count - max(0, self.budget.count() - self.budget.limit))
+
+    def compact(self, alive):
+        """Swap-remove: move live particles from the tail into the slots of dead ones"""
+        n = self.count
+        new_count = int(np.count_nonzero(alive))
+        if new_count == n:
+            return
+        holes = np.flatnonzero(~alive[:new_count])
+        movers = np.flatnonzero(alive[new_count:]) + new_count
+        for array in (self.x, self.y, self.vx, self.vy, self.life, self.max_life, self.size, self.color):
+            array[holes] = array[movers]
+        self.count = new_count
+
+    def clear(self):
+        self.count = 0
+
+    def sprite(self, size, color, level):
+        key = (size, color, level)
+        sprite = self.sprites.get(key)
+        if sprite is None:
+            sprite = render_sprite(self.shape, size, color, round(255 * level / (ALPHA_LEVELS - 1)))
+            self.sprites[key] = sprite
+            if len(self.sprites) > MAX_SPRITES:
+                self.sprites.popitem(last=False)
+        else:
+            self.sprites.move_to_end(key)
+        return sprite
+
+    def draw(self, screen, offset_x=0, offset_y=0):
+        """Blit every particle centered on its position, minus the camera offset"""
+        n = self.count
+        if n == 0:
+            return
+        if self.fade:
+            levels = np.ceil(self.life[:n] / self.max_life[:n] * (ALPHA_LEVELS - 1)).astype(np.int32)
+        else:
+            levels = np.full(n, ALPHA_LEVELS - 1, np.int32)
+        sizes = self.size[:n].tolist()
+        colors = [tuple(color) for color in self.color[:n].tolist()]
+        xs = (self.x[:n] - offset_x).tolist()
+        ys = (self.y[:n] - offset_y).tolist()
+        blit = screen.blit
+        for x, y, size, color, level in zip(xs, ys, sizes, colors, levels.tolist()):
+            sprite = self.sprite(size, color, level)
+            blit(sprite, (x - sprite.get_width() // 2, y - sprite.get_height() // 2))
+
+class ParticleBudget:
+    """One particle cap shared by several emitters, e.g. rain and snow"""
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.limit = capacity  # Current cap, lowered with max_particles
+        self.emitters = []
+
+    def count(self):
+        return sum(emitter.count for emitter in self.emitters)
+
+class ParticleEngine:
+    """Every particle emitter of the game, capped together by the max_particles setting"""
+
+    def __init__(self):
+        self.emitters = {}
+        self.budgets = {}
+
+    def budget(self, name, capacity):
+        """Create a cap shared by the emitters created with this budget"""
+        budget = ParticleBudget(capacity)
+        self.budgets[name] = budget
+        return budget
+
+    def emitter(self, name, shape, capacity, fade=True, budget=None):
+        """Create an emitter, the cap applied to it never exceeds its capacity"""
+        emitter = ParticleEmitter(name, shape, capacity, fade, budget)
+        if budget is not None:
+            budget.emitters.append(emitter)
+        self.emitters[name] = emitter
+        return emitter
+
+    def set_max_particles(self, max_particles):
+        for emitter in self.emitters.values():
+            emitter.limit = min(emitter.capacity, max_particles)
+        for budget in self.budgets.values():
+            budget.limit = min(budget.capacity, max_particles)
+
+    def stats(self):
+        return {name: {"particles": emitter.count, "limit": emitter.limit, "dropped": emitter.dropped,
+                       "sprites": len(emitter.sprites)}
+                for name, emitter in self.emitters.items()}
+
+particle_engine = ParticleEngine()
@@ -2,9 +2,15 @@ import pygame
 import math
 import pymunk
 import pymunk.autogeometry
-from chunk import chunks
+from collision import blocks_at_contact
+from healing import healing_scheduler
+from sprite_cache import rotation_cache
+from render_queue import blit_texture
+from asset_registry import asset_registry
+from particles import particle_engine
 from constants import BLOCK_SIZE, CHUNK_WIDTH
 import random
+import numpy as np
 
 def rotate_point(x, y, angle):
     """Rotate a point (x, y) by angle (in radians) around the origin (0, 0)."""
@@ -27,9 +33,9 @@ def rotate_vertices(vertices, angle):
         return rotated_vertices
 
 class Pickaxe:
-    def __init__(self, space, x, y, texture, sound_manager, damage=2, velocity=0, rotation=0, mass=100):
-        self.texture = texture
-        self.original_texture = texture.copy()
+    def __init__(self, space, x, y, texture_name, sound_manager, damage=2, velocity=0, rotation=0, mass=100):
+        self.texture_name = texture_name  # Pickaxe texture in the asset registry
+        self.texture = asset_registry.texture("pickaxe", texture_name)
         self.velocity = velocity
         self.rotation = rotation
         self.space = space
@@ -38,10 +44,10 @@ class Pickaxe:
         self.rainbow_mode = False
         self.rainbow_timer = 0
         self.color_hue = 0
-        self.particle_trail = []
+        self.particle_trail = particle_engine.emitter("pickaxe_trail", "square", 30)
         self.shield_active = False
         self.shield_timer = 0
-        self.shield_glow = []
+        self.shield_glow = particle_engine.emitter("shield_glow", "disc", 60)
 
         vertices = rotate_vertices([
                     (0, 0), # A
@@ -92,24 +98,21 @@ class Pickaxe:
         handler.post_solve = self.on_collision
 
     def on_collision(self, arbiter, space, data):
-        """Handles collision with blocks: Reduce HP or destroy the block."""
-        block_shape = arbiter.shapes[1]  # Get the block shape
-        block = block_shape.block_ref  # Get the actual block instance
-
-        block.first_hit_time = pygame.time.get_ticks()  
-        block.last_heal_time = block.first_hit_time
-
-        # Calculate impact force for screen shake
-        impact_force = abs(self.body.velocity.y) / 100
-        
-        block.hp -= self.damage  # Reduce HP when hit
+        """Handles collision with blocks: Reduce HP or destroy every block touched."""
+        blocks = blocks_at_contact(arbiter)  # Get the blocks under the contact points
+        if not blocks:
+            return
+        for block in blocks:
+            self.hit_block(block)
 
-        if (block.name == "grass_block" or block.name == "dirt"):
+        # One sound, shake and nudge per impact, however many blocks it touched
+        if any(block.name == "grass_block" or block.name == "dirt" for block in blocks):
             self.sound_manager.play_sound("grass" + str(random.randint(1, 4)))
         else:
             self.sound_manager.play_sound("stone" + str(random.randint(1, 4)))
             
         # Screen shake based on impact and pickaxe size (reduced by 90%)
+        impact_force = abs(self.body.velocity.y) / 100
         shake_intensity = max(0.2, impact_force * (0.3 if self.is_enlarged else 0.1))
         if hasattr(self, 'camera_ref'):
             self.camera_ref.shake(15, shake_intensity)
@@ -117,42 +120,28 @@ class Pickaxe:
         # Add small random rotation on hit
         self.body.angle += random.choice([0.01, -0.01])
 
-    def random_pickaxe(self, texture_atlas, atlas_items): 
-        """Randomly change the pickaxe's properties."""
+    def hit_block(self, block):
+        healing_scheduler.damage(block.chunk, block.x, block.y, pygame.time.get_ticks())  # Restart the healing timer
+        block.hp -= self.damage  # Reduce HP when hit
 
-        pickaxe_name = random.choice(list(atlas_items["pickaxe"].keys()))
-        self.texture = texture_atlas.subsurface(atlas_items["pickaxe"][pickaxe_name])
-        print("Setting pickaxe to:", pickaxe_name)
+    def texture_variant(self):
+        return "giant" if self.is_enlarged else "block"
 
-        if self.is_enlarged:
-            # Scale up texture
-            new_size = (BLOCK_SIZE * 3, BLOCK_SIZE * 3)
-            self.texture = pygame.transform.scale(self.texture, new_size)
+    def base_texture(self):
+        """The current pickaxe's texture at its current size, shared through the asset registry"""
+        return asset_registry.texture("pickaxe", self.texture_name, self.texture_variant())
 
-        if(pickaxe_name =="wooden_pickaxe"):  
-            self.damage = 2
-        elif(pickaxe_name =="stone_pickaxe"):
-            self.damage = 4
-        elif(pickaxe_name =="iron_pickaxe"):
-            self.damage = 6
-        elif(pickaxe_name =="golden_pickaxe"):
-            self.damage = 8
-        elif(pickaxe_name =="diamond_pickaxe"):
-            self.damage = 10
-        elif(pickaxe_name =="netherite_pickaxe"):
-            self.damage = 12
+    def random_pickaxe(self, atlas_items):
+        """Randomly change the pickaxe's properties."""
+        self.pickaxe(random.choice(list(atlas_items["pickaxe"].keys())))
 
-    def pickaxe(self, name, texture_atlas, atlas_items):
+    def pickaxe(self, name):
         """Set the pickaxe's properties based on its name."""
 
-        self.texture = texture_atlas.subsurface(atlas_items["pickaxe"][name])
+        self.texture_name = name
+        self.texture = self.base_texture()
         print("Setting pickaxe to:", name)
 
-        if self.is_enlarged:
-            # Scale up texture
-            new_size = (BLOCK_SIZE * 3, BLOCK_SIZE * 3)
-            self.texture = pygame.transform.scale(self.texture, new_size)
-
         if(name =="wooden_pickaxe"):  
             self.damage = 2
         elif(name =="stone_pickaxe"):
@@ -211,33 +200,25 @@ class Pickaxe:
 
     def draw(self, screen, camera):
         """Draw the pickaxe at its current position."""
-        # Draw shield glow
-        for glow in self.shield_glow:
-            alpha = int(255 * (glow['life'] / 20))
-            glow_surf = pygame.Surface((int(glow['size'] * 2), int(glow['size'] * 2)), pygame.SRCALPHA)
-            golden_color = (255, 215, 0, alpha)
-            pygame.draw.circle(glow_surf, golden_color, 
-                             (int(glow['size']), int(glow['size'])), int(glow['size']))
-            glow_pos = (glow['pos'][0] - glow['size'] - camera.offset_x, 
-                       glow['pos'][1] - glow['size'] - camera.offset_y)
-            screen.blit(glow_surf, glow_pos)
-        
-        # Draw particle trail
-        for particle in self.particle_trail:
-            alpha = int(255 * (particle['life'] / 30))
-            trail_surf = pygame.Surface((8, 8), pygame.SRCALPHA)
-            color_with_alpha = (*particle['color'][:3], alpha)
-            trail_surf.fill(color_with_alpha)
-            trail_pos = (particle['pos'][0] - 4 - camera.offset_x, 
-                        particle['pos'][1] - 4 - camera.offset_y)
-            screen.blit(trail_surf, trail_pos)
+        # Draw shield glow and particle trail
+        self.shield_glow.draw(screen, camera.offset_x, camera.offset_y)
+        self.particle_trail.draw(screen, camera.offset_x, camera.offset_y)
         
         # Draw pickaxe
-        rotated_image = pygame.transform.rotate(self.texture, -math.degrees(self.body.angle))  # Convert to degrees
+        angle = -math.degrees(self.body.angle)  # Convert to degrees
+        if self.rainbow_mode:
+            # The rainbow texture is rebuilt every frame, caching its rotations would only evict the others
+            rotated_image = pygame.transform.rotate(self.texture, angle)
+        else:
+            name = ("pickaxe", self.texture_name, self.texture_variant())
+            rotated_image = rotation_cache.get(name, self.texture, angle)
         rect = rotated_image.get_rect(center=(self.body.position.x, self.body.position.y))
         rect.y -= camera.offset_y
         rect.x -= camera.offset_x
-        screen.blit(rotated_image, rect)
+        if self.rainbow_mode:
+            screen.blit(rotated_image, rect)
+        else:
+            blit_texture(screen, ("rotated", rotation_cache.key(name, angle)), rotated_image, rect)
 
     def enlarge(self, duration=5000):
         """Temporarily makes the pickaxe 3 times bigger with a larger hitbox."""
@@ -248,14 +229,12 @@ class Pickaxe:
             self.enlarge_end_time += duration
             return
 
-        # Not enlarged yet, so store original texture and shapes
-        self.original_texture = self.texture.copy()
+        # Not enlarged yet, so store original shapes
         self.original_shapes = self.shapes[:]  # Store original hitbox shapes
         self.is_enlarged = True
 
-        # Scale up texture using the original texture.
-        new_size = (BLOCK_SIZE * 3, BLOCK_SIZE * 3)
-        self.texture = pygame.transform.scale(self.original_texture, new_size)
+        # Scale up texture: the registry's "giant" variant, three times the block size
+        self.texture = self.base_texture()
 
         # Scale up hitbox:
         self.space.remove(*self.shapes)  # Remove current shapes
@@ -277,15 +256,15 @@ class Pickaxe:
     def reset_size(self):
         """Restore the pickaxe to its original size."""
         if hasattr(self, "original_shapes"):
-            # Restore texture using the stored original.
+            self.is_enlarged = False
+            # Restore texture at block size.
             if not self.rainbow_mode:
-                self.texture = self.original_texture.copy()
+                self.texture = self.base_texture()
 
             # Reset hitbox: remove enlarged shapes and add back the original shapes.
             self.space.remove(*self.shapes)
             self.shapes = self.original_shapes[:]
             self.space.add(*self.shapes)
-            self.is_enlarged = False
 
             del self.enlarge_end_time  # Remove the enlargement timer
 
@@ -298,6 +277,8 @@ class Pickaxe:
         
     def update_rainbow_effect(self):
         """Update rainbow color cycling and particle trail."""
+        # The trail keeps fading out after rainbow mode ends
+        self.particle_trail.update()
         if not self.rainbow_mode:
             return
             
@@ -305,20 +286,15 @@ class Pickaxe:
         if pygame.time.get_ticks() > self.rainbow_timer:
             self.rainbow_mode = False
             self.damage -= 5  # Remove bonus damage
-            self.texture = self.original_texture.copy()
-            if self.is_enlarged:
-                new_size = (BLOCK_SIZE * 3, BLOCK_SIZE * 3)
-                self.texture = pygame.transform.scale(self.texture, new_size)
+            self.texture = self.base_texture()
             return
             
         # Cycle through rainbow colors
         self.color_hue = (self.color_hue + 3) % 360
         
         # Create rainbow colored texture
-        rainbow_texture = self.original_texture.copy()
-        if self.is_enlarged:
-            rainbow_texture = pygame.transform.scale(rainbow_texture, (BLOCK_SIZE * 3, BLOCK_SIZE * 3))
-            
+        rainbow_texture = self.base_texture().copy()
+
         # Apply rainbow tint
         hue_color = pygame.Color(0)
         hue_color.hsva = (self.color_hue, 100, 100, 100)
@@ -326,16 +302,8 @@ class Pickaxe:
         self.texture = rainbow_texture
         
         # Add particle trail
-        self.particle_trail.append({
-            'pos': (self.body.position.x, self.body.position.y),
-            'color': hue_color,
-            'life': 30
-        })
-        
-        # Update particle trail
-        self.particle_trail = [p for p in self.particle_trail if p['life'] > 0]
-        for particle in self.particle_trail:
-            particle['life'] -= 1
+        self.particle_trail.spawn(self.body.position.x, self.body.position.y, life=30, size=8,
+                                  color=(hue_color.r, hue_color.g, hue_color.b))
             
     def activate_shield(self, duration=10000):
         """Activate shield with golden glow effect."""
@@ -351,23 +319,15 @@ class Pickaxe:
         # Check if shield should end
         if pygame.time.get_ticks() > self.shield_timer:
             self.shield_active = False
-            self.shield_glow = []
+            self.shield_glow.clear()
             return
             
-        # Create golden glow particles around pickaxe
-        for i in range(3):
-            angle = random.uniform(0, 2 * math.pi)
-            distance = random.uniform(80, 120)
-            glow_x = self.body.position.x + math.cos(angle) * distance
-            glow_y = self.body.position.y + math.sin(angle) * distance
-            
-            self.shield_glow.append({
-                'pos': (glow_x, glow_y),
-                'life': 20,
-                'size': random.uniform(4, 8)
-            })
-        
         # Update glow particles
-        self.shield_glow = [g for g in self.shield_glow if g['life'] > 0]
-        for glow in self.shield_glow:
-            glow['life'] -= 1
\ No newline at end of file
+        self.shield_glow.update()
+
+        # Create golden glow particles around pickaxe
+        angles = np.random.uniform(0, 2 * math.pi, 3)
+        distances = np.random.uniform(80, 120, 3)
+        self.shield_glow.spawn(self.body.position.x + np.cos(angles) * distances,
+                               self.body.position.y + np.sin(angles) * distances,
+                               life=20, size=np.random.uniform(4, 8, 3).astype(int), color=(255, 215, 0))
@@ -0,0 +1,81 @@
+import queue
+import threading
+import time
+from chunk import add_chunk_row, chunks
+from constants import BLOCK_SIZE, CHUNK_HEIGHT, FRAMERATE, INTERNAL_HEIGHT, SEED
+from worldgen import generate_chunk_types, get_noise_quantiles
+
+class ChunkPrefetcher:
+    """
+    Generates chunk rows below the screen before the pickaxe reaches them.
+
+    The pickaxe's descent is predicted from its velocity and the missing rows
+    are generated as one batch in a worker thread. Generation only depends on
+    the seed and chunk coordinate, so a prefetched chunk is identical to one
+    get_chunk() would build on the spot. The main thread only wraps the
+    finished arrays in Chunk objects, and stops once the frame budget is used.
+    """
+
+    def __init__(self, texture_atlas, atlas_items, rows_ahead=3, lookahead=1.5, budget_ms=2):
+        self.texture_atlas = texture_atlas
+        self.atlas_items = atlas_items
+        self.rows_ahead = rows_ahead  # Rows always kept ready below the screen
+        self.lookahead = lookahead  # Seconds of predicted falling to prefetch for
+        self.budget = budget_ms / 1000  # Main thread time per frame for committing chunks
+
+        self.requests = queue.Queue()
+        self.results = queue.Queue()
+        self.pending = set()  # Requested rows that are not committed yet
+        self.ready = []  # (chunk_y, types) rows generated and waiting to be committed
+
+        get_noise_quantiles(SEED)  # Build the shared noise table before the worker uses it
+        self.thread = threading.Thread(target=self._worker, daemon=True)
+        self.thread.start()
+
+    def _worker(self):
+        """Worker thread that generates requested batches of chunk rows"""
+        while True:
+            chunk_y, count = self.requests.get()
+            self.results.put((chunk_y, generate_chunk_types(chunk_y, count)))
+
+    def predicted_rows(self, position_y, velocity_y, step_speed):
+        """Chunk rows from the bottom of the screen to where the pickaxe is predicted to fall"""
+        simulated_seconds = self.lookahead * step_speed * FRAMERATE  # Fast mode simulates twice as much per frame
+        fall = max(velocity_y, 0) * simulated_seconds
+        first_row = int(position_y + INTERNAL_HEIGHT) // (CHUNK_HEIGHT * BLOCK_SIZE) + 1
+        last_row = int(position_y + INTERNAL_HEIGHT + fall) // (CHUNK_HEIGHT * BLOCK_SIZE) + self.rows_ahead
+        return range(max(first_row, 1), last_row + 1)
+
+    def request(self, rows):
+        """Queue every missing row, consecutive rows are generated in one batch"""
+        missing = [chunk_y for chunk_y in rows if chunk_y not in self.pending and (0, chunk_y) not in chunks]
+        start = 0
+        for index in range(1, len(missing) + 1):
+            if index == len(missing) or missing[index] != missing[index - 1] + 1:
+                self.requests.put((missing[start], index - start))
+                start = index
+        self.pending.update(missing)
+
+    def commit(self, min_chunk_y):
+        """Store finished rows as chunks until the frame budget is used up"""
+        start_time = time.perf_counter()
+        while True:
+            if not self.ready:
+                try:
+                    chunk_y, types = self.results.get_nowait()
+                except queue.Empty:
+                    return
+                self.ready.extend((chunk_y + index, row.copy()) for index, row in enumerate(types))
+
+            chunk_y, types = self.ready.pop(0)
+            self.pending.discard(chunk_y)
+            if chunk_y >= min_chunk_y:  # Rows the pickaxe already passed are dropped
+                add_chunk_row(chunk_y, types, self.texture_atlas, self.atlas_items)
+
+            if time.perf_counter() - start_time >= self.budget:
+                return
+
+    def update(self, position_y, velocity_y, step_speed, min_chunk_y):
+        """Commit finished rows and request the rows needed next"""
+        self.commit(min_chunk_y)
+        self.request(self.predicted_rows(position_y, velocity_y, step_speed))
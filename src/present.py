@@ -0,0 +1,104 @@
+import os
+import pygame
+
+try:
+    from pygame._sdl2 import video
+except ImportError:  # pygame builds without the SDL2 video module
+    video = None
+
+# Render scales the adaptive quality steps through, lowest first (see RenderQueue.set_scale)
+RENDER_SCALES = (0.5, 0.75, 1.0)
+
+# Filters for the final scale to the window
+PRESENT_FILTERS = {
+    "nearest": pygame.transform.scale,
+    "smoothscale": pygame.transform.smoothscale,
+}
+
+# Backends for getting frames on screen
+PRESENT_BACKENDS = ("surface", "sdl2")
+
+class Presenter:
+    """
+    Presents the frame to the window.
+
+    The frame is drawn at the render scale of the internal resolution (see
+    RenderQueue) and scaled to the window once, with the chosen filter. It is
+    blitted unscaled when the sizes already match, and scaled straight into the
+    screen surface instead of allocating a new one every frame.
+    """
+
+    overlay_on_frame = False  # Notifications and settings are drawn on the window surface
+
+    def __init__(self, present_filter="smoothscale"):
+        self.present_filter = present_filter
+        self.present_time = 0  # Time of the last present in ms
+
+    def present(self, internal_surface, screen, window_size):
+        start = pygame.time.get_ticks()
+        if internal_surface.get_size() == window_size:
+            screen.blit(internal_surface, (0, 0))
+        else:
+            scale = PRESENT_FILTERS.get(self.present_filter, pygame.transform.smoothscale)
+            if screen.get_size() == window_size and screen.get_bitsize() >= 24:
+                scale(internal_surface, window_size, screen)
+            else:
+                screen.blit(scale(internal_surface, window_size), (0, 0))
+        self.present_time = pygame.time.get_ticks() - start
+
+    def flip(self, internal_surface):
+        pygame.display.flip()
+
+class RendererPresenter:
+    """
+    Presents through an SDL2 Renderer instead of the display surface.
+
+    The frame is uploaded as one texture per frame and SDL scales it to the
+    window, letterboxing it to 9:16 through the renderer's logical size. The
+    renderer owns the window, so overlays are drawn on the frame before it is
+    uploaded.
+    """
+
+    overlay_on_frame = True
+
+    def __init__(self, window_size, internal_size, present_filter="smoothscale", software=True, title="Falling Pickaxe"):
+        if video is None:
+            raise RuntimeError("pygame._sdl2.video is not available")
+        self.window = video.Window(title, size=window_size, resizable=True)
+        try:
+            self.renderer = video.Renderer(self.window, accelerated=0 if software else -1)
+        except video.error:
+            self.window.destroy()
+            raise
+        self.renderer.logical_size = internal_size  # Any render scale keeps the 9:16 ratio
+        self.present_filter = present_filter
+        self.present_time = 0  # Time of the last present in ms
+
+    def set_icon(self, icon):
+        self.window.set_icon(icon)
+
+    def present(self, internal_surface, screen, window_size):
+        """Nothing to do before the overlays: the whole frame is uploaded in flip()"""
+
+    def flip(self, internal_surface):
+        start = pygame.time.get_ticks()
+        # Linear filtering unless the nearest filter was chosen; SDL reads the hint when a texture is created
+        quality = "0" if self.present_filter == "nearest" else "1"
+        if os.environ.get("SDL_RENDER_SCALE_QUALITY") != quality:
+            os.environ["SDL_RENDER_SCALE_QUALITY"] = quality
+        # Texture.from_surface is faster than updating a streaming texture with the software renderer
+        texture = video.Texture.from_surface(self.renderer, internal_surface)
+        self.renderer.draw_color = (0, 0, 0, 255)
+        self.renderer.clear()
+        texture.draw()
+        self.renderer.present()
+        self.present_time = pygame.time.get_ticks() - start
+
+def create_presenter(backend, window_size, internal_size, present_filter="smoothscale"):
+    """Return a presenter for the backend, falling back to the display surface"""
+    if backend == "sdl2":
+        try:
+            return RendererPresenter(window_size, internal_size, present_filter)
+        except (RuntimeError, pygame.error) as e:
+            print(f"⚠️ SDL2 renderer unavailable ({e}), using the display surface")
+    return Presenter(present_filter=present_filter)
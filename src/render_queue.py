@@ -0,0 +1,111 @@
+import time
+from sprite_cache import scale_sprite, scaled_sprites
+
+# Layers in drawing order
+LAYERS = ("world", "effects", "hud", "overlay")
+
+# Layers drawn at the render scale; the overlay is drawn at the size of its target
+SCALED_LAYERS = ("world", "effects", "hud")
+
+def blit_texture(target, name, texture, dest, area=None):
+    """Blit a texture that always has the same pixels under name onto a render layer or a plain surface"""
+    if isinstance(target, RenderLayer):
+        target.blit_texture(name, texture, dest, area)
+    else:
+        target.blit(texture, dest, area)
+
+class RenderLayer:
+    """
+    Collects blits for one layer and draws them with a single Surface.blits call.
+
+    A layer can be passed to any draw method in place of the screen surface:
+    blit() culls sprites outside the viewport and queues the rest. Below a
+    render scale of 1, positions keep using the internal resolution and the
+    queued sprites are scaled copies, drawn onto a target that is `scale` times
+    the viewport. blit() scales its source on every call; textures whose pixels
+    never change go through blit_texture() to reuse their scaled copy.
+    """
+
+    def __init__(self, name, size, scale=1.0):
+        self.name = name
+        self.size = size  # Viewport used for culling, in internal resolution pixels
+        self.scale = scale  # Size of the target the layer is flushed to, as a fraction of size
+        self.items = []
+        self.submitted = 0
+        self.culled = 0
+        self.flush_time = 0  # Time of the last flush in ms
+
+    def get_size(self):
+        return self.size
+
+    def get_width(self):
+        return self.size[0]
+
+    def get_height(self):
+        return self.size[1]
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        """Queue a blit, sprites fully outside the viewport are dropped"""
+        self.queue(source, dest, area, special_flags, None)
+
+    def blit_texture(self, name, texture, dest, area=None):
+        """Queue a blit of a texture that always has the same pixels under name, see ScaledSpriteCache"""
+        self.queue(texture, dest, area, 0, name)
+
+    def queue(self, source, dest, area, special_flags, name):
+        self.submitted += 1
+        x, y = dest[0], dest[1]
+        width, height = (area[2], area[3]) if area else source.get_size()
+        if x >= self.size[0] or y >= self.size[1] or x + width <= 0 or y + height <= 0:
+            self.culled += 1
+            return
+        scale = self.scale
+        if scale != 1:
+            source = scale_sprite(source, scale) if name is None else scaled_sprites.get(name, source, scale)
+            dest = (round(x * scale), round(y * scale))
+            if area:
+                area = (round(area[0] * scale), round(area[1] * scale), round(width * scale), round(height * scale))
+        self.items.append((source, dest, area, special_flags))
+
+    def blit_scaled(self, source, dest, area=None):
+        """Queue a blit of a source already drawn at the render scale; dest and area are in target pixels"""
+        self.submitted += 1
+        self.items.append((source, dest, area, 0))
+
+    def flush(self, target):
+        """Draw every queued blit onto the target in submission order"""
+        start_time = time.perf_counter()
+        if self.items:
+            target.blits(self.items, doreturn=False)
+            self.items = []
+        self.flush_time = (time.perf_counter() - start_time) * 1000
+
+class RenderQueue:
+    """Ordered render layers, flushed one after another by the main loop"""
+
+    def __init__(self, size):
+        self.layers = {name: RenderLayer(name, size) for name in LAYERS}
+        self.scale = 1.0  # Render scale of the scaled layers
+
+    def __getitem__(self, name):
+        return self.layers[name]
+
+    def set_scale(self, scale):
+        self.scale = scale
+        for name in SCALED_LAYERS:
+            self.layers[name].scale = scale
+
+    def frame_size(self):
+        """Size of the frame the scaled layers are flushed to"""
+        width, height = self.layers[SCALED_LAYERS[0]].size
+        return (max(1, round(width * self.scale)), max(1, round(height * self.scale)))
+
+    def flush(self, name, target):
+        self.layers[name].flush(target)
+
+    def stats(self):
+        """Blits submitted and culled since the start, and the last flush time of every layer"""
+        return {
+            name: {"submitted": layer.submitted, "culled": layer.culled, "flush_ms": round(layer.flush_time, 3)}
+            for name, layer in self.layers.items()
+        }
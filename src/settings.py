@@ -3,6 +3,7 @@ import pygame
 import json
 import os
 from pathlib import Path
+from present import RENDER_SCALES, PRESENT_FILTERS, PRESENT_BACKENDS
 
 class SettingsManager:
     def __init__(self):
@@ -42,6 +43,9 @@ class SettingsManager:
             "auto_difficulty_scaling": True,
             "dynamic_music": False,
             "adaptive_ui_scale": True,
+            "render_scale": 1.0,  # Fraction of the internal resolution the frame is rendered at
+            "present_filter": "smoothscale",
+            "present_backend": "surface",  # "sdl2" presents through an SDL2 renderer, applied on restart
             "streaming_enabled": False,
             "stream_quality": "720p",
             "stream_fps": 30,
@@ -54,6 +58,12 @@ class SettingsManager:
         self.selected_option = 0
         self.scroll_offset = 0
         self.performance_monitor = PerformanceMonitor()
+        self.setting_options = {
+            "render_scale": RENDER_SCALES,
+            "present_filter": tuple(PRESENT_FILTERS),
+            "present_backend": PRESENT_BACKENDS,
+        }
+        self.last_scale_change = 0  # Ticks of the last adaptive render scale change
         
     def load_settings(self):
         if self.settings_file.exists():
@@ -79,6 +89,13 @@ class SettingsManager:
         if key in self.settings and isinstance(self.settings[key], bool):
             self.settings[key] = not self.settings[key]
             self.save_settings()
+        elif key in self.setting_options:
+            # Cycle through the allowed values
+            options = self.setting_options[key]
+            current = self.settings[key]
+            index = options.index(current) if current in options else -1
+            self.settings[key] = options[(index + 1) % len(options)]
+            self.save_settings()
     
     def get_setting(self, key):
         return self.settings.get(key, self.default_settings.get(key, False))
@@ -194,10 +211,10 @@ class SettingsManager:
             
             # Setting value
             value = "ON" if self.settings[key] else "OFF"
-            if isinstance(self.settings[key], (int, float)):
+            if isinstance(self.settings[key], (int, float, str)):
                 value = str(self.settings[key])
             value_color = (0, 255, 0) if self.settings[key] else (255, 0, 0)
-            if isinstance(self.settings[key], (int, float)):
+            if isinstance(self.settings[key], (int, float, str)):
                 value_color = (255, 255, 255)
             value_text = scaled_font.render(value, True, value_color)
             
@@ -240,6 +257,23 @@ class SettingsManager:
                 self.settings["max_particles"] = 100
                 print("Auto quality: Full effects restored")
 
+        # Adaptive render scale: step the rendered resolution down or up one level at a time
+        if self.get_setting("adaptive_ui_scale") and len(self.performance_monitor.fps_history) >= 30:
+            current_time = pygame.time.get_ticks()
+            if current_time - self.last_scale_change >= 3000:
+                avg_fps = self.performance_monitor.get_average_fps()
+                render_scale = self.get_setting("render_scale")
+                lower = [scale for scale in RENDER_SCALES if scale < render_scale]
+                higher = [scale for scale in RENDER_SCALES if scale > render_scale]
+                if avg_fps < 30 and lower:
+                    self.settings["render_scale"] = lower[-1]
+                    self.last_scale_change = current_time
+                    print(f"Auto quality: Render scale lowered to {lower[-1]}")
+                elif avg_fps > 50 and higher:
+                    self.settings["render_scale"] = higher[0]
+                    self.last_scale_change = current_time
+                    print(f"Auto quality: Render scale raised to {higher[0]}")
+
 class PerformanceMonitor:
     def __init__(self):
         self.fps_history = []
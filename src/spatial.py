@@ -0,0 +1,58 @@
+import numpy as np
+from chunk import chunks
+from constants import BLOCK_SIZE, CHUNK_HEIGHT, CHUNK_WIDTH
+
+def world_to_cell(world_x, world_y):
+    """Map a world position in pixels to (chunk_x, chunk_y, x, y)"""
+    cell_x = int(world_x // BLOCK_SIZE)
+    cell_y = int(world_y // BLOCK_SIZE)
+    return (cell_x // CHUNK_WIDTH, cell_y // CHUNK_HEIGHT, cell_x % CHUNK_WIDTH, cell_y % CHUNK_HEIGHT)
+
+def block_at(world_x, world_y):
+    """Return the Block at a world position, or None for air, destroyed cells and unloaded chunks"""
+    chunk_x, chunk_y, x, y = world_to_cell(world_x, world_y)
+    chunk = chunks.get((chunk_x, chunk_y))
+    if chunk is None:
+        return None
+    return chunk.block(x, y)
+
+def query_range(left, top, right, bottom):
+    """
+    Yield (chunk, ys, xs) for every solid cell whose square overlaps the
+    world rectangle. Only the loaded chunks that overlap it are touched.
+    """
+    first_x, last_x = int(left // BLOCK_SIZE), int(right // BLOCK_SIZE)
+    first_y, last_y = int(top // BLOCK_SIZE), int(bottom // BLOCK_SIZE)
+
+    for chunk_y in range(first_y // CHUNK_HEIGHT, last_y // CHUNK_HEIGHT + 1):
+        for chunk_x in range(first_x // CHUNK_WIDTH, last_x // CHUNK_WIDTH + 1):
+            chunk = chunks.get((chunk_x, chunk_y))
+            if chunk is None:
+                continue
+
+            # Window of the rectangle inside this chunk, in local cell coordinates
+            x0 = max(first_x - chunk_x * CHUNK_WIDTH, 0)
+            x1 = min(last_x - chunk_x * CHUNK_WIDTH + 1, CHUNK_WIDTH)
+            y0 = max(first_y - chunk_y * CHUNK_HEIGHT, 0)
+            y1 = min(last_y - chunk_y * CHUNK_HEIGHT + 1, CHUNK_HEIGHT)
+
+            ys, xs = np.nonzero(chunk.solid_mask()[y0:y1, x0:x1])
+            if len(ys):
+                yield chunk, ys + y0, xs + x0
+
+def query_radius(center_x, center_y, radius):
+    """Yield (chunk, ys, xs, distances) for the solid cells whose center is within radius of the point"""
+    for chunk, ys, xs in query_range(center_x - radius, center_y - radius, center_x + radius, center_y + radius):
+        block_x = (chunk.chunk_x * CHUNK_WIDTH + xs) * BLOCK_SIZE + BLOCK_SIZE // 2
+        block_y = (chunk.chunk_y * CHUNK_HEIGHT + ys) * BLOCK_SIZE + BLOCK_SIZE // 2
+        distances = np.hypot(block_x - center_x, block_y - center_y)
+
+        inside = distances <= radius
+        if inside.any():
+            yield chunk, ys[inside], xs[inside], distances[inside]
+
+def blocks_in_radius(center_x, center_y, radius):
+    """Yield (Block, distance) for every solid block whose center is within radius of the point"""
+    for chunk, ys, xs, distances in query_radius(center_x, center_y, radius):
+        for y, x, distance in zip(ys.tolist(), xs.tolist(), distances.tolist()):
+            yield chunk.block(x, y), distance
@@ -0,0 +1,154 @@
+from collections import OrderedDict
+import pygame
+
+class RotationCache:
+    """
+    Rotated copies of sprites, keyed by a stable texture name and angle rounded
+    to `step` degrees. Least recently used sprites are evicted so the cache never
+    holds more than `max_bytes` of pixels; a sprite larger than that is not cached.
+    """
+
+    def __init__(self, step=2, max_bytes=64 * 1024 * 1024):
+        self.step = step
+        self.max_bytes = max_bytes
+        self.sprites = OrderedDict()  # (name, angle) -> (rotated sprite, bytes)
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, name, texture, angle):
+        """
+        Return the texture rotated by angle degrees (counter-clockwise, like pygame.transform.rotate).
+        name identifies the texture's pixels, e.g. ("pickaxe", "diamond_pickaxe", "block"), so a
+        texture rebuilt from the same asset hits the rotations cached for it before.
+        """
+        key = self.key(name, angle)
+        entry = self.sprites.get(key)
+        if entry is not None:
+            self.hits += 1
+            self.sprites.move_to_end(key)
+            return entry[0]
+
+        self.misses += 1
+        rotated = pygame.transform.rotate(texture, key[1])
+        size = rotated.get_pitch() * rotated.get_height()
+        if size > self.max_bytes:
+            return rotated
+        while self.bytes + size > self.max_bytes:
+            _, (_, evicted_size) = self.sprites.popitem(last=False)
+            self.bytes -= evicted_size
+        self.sprites[key] = (rotated, size)
+        self.bytes += size
+        return rotated
+
+    def key(self, name, angle):
+        """(name, angle rounded to the cache's step), also a stable name for the rotated sprite"""
+        return (name, round(angle / self.step) * self.step % 360)
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0,
+            "sprites": len(self.sprites),
+            "bytes": self.bytes,
+        }
+
+rotation_cache = RotationCache()
+
+def scale_sprite(surface, scale):
+    """Return a nearest-neighbour copy of surface scaled by scale, keeping its surface alpha"""
+    width, height = surface.get_size()
+    scaled = pygame.transform.scale(surface, (max(1, round(width * scale)), max(1, round(height * scale))))
+    alpha = surface.get_alpha()
+    if alpha is not None and scaled.get_alpha() != alpha:
+        scaled.set_alpha(alpha)
+    return scaled
+
+class ScaledSpriteCache:
+    """
+    Copies of textures at the render scale, keyed like RotationCache by a stable
+    texture name, so a frame rendered below the internal resolution blits small
+    textures instead of scaling the whole frame. A name must always stand for the
+    same pixels; only the texture's surface alpha is carried over on a hit.
+    Copies are dropped when the scale changes, and least recently used ones once
+    they hold more than `max_bytes` of pixels.
+    """
+
+    def __init__(self, max_bytes=64 * 1024 * 1024):
+        self.scale = 1.0
+        self.max_bytes = max_bytes
+        self.sprites = OrderedDict()  # name -> (scaled copy at self.scale, bytes)
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, name, texture, scale):
+        """Return texture scaled by scale with a nearest-neighbour scale, or texture itself at scale 1"""
+        if scale == 1:
+            return texture
+        if scale != self.scale:
+            self.clear()
+            self.scale = scale
+
+        entry = self.sprites.get(name)
+        if entry is not None:
+            self.hits += 1
+            self.sprites.move_to_end(name)
+            scaled = entry[0]
+            alpha = texture.get_alpha()
+            if alpha != scaled.get_alpha():  # E.g. a fading overlay
+                scaled.set_alpha(alpha)
+            return scaled
+
+        self.misses += 1
+        scaled = scale_sprite(texture, scale)
+        size = scaled.get_pitch() * scaled.get_height()
+        if size > self.max_bytes:
+            return scaled
+        while self.bytes + size > self.max_bytes:
+            _, (_, evicted_size) = self.sprites.popitem(last=False)
+            self.bytes -= evicted_size
+        self.sprites[name] = (scaled, size)
+        self.bytes += size
+        return scaled
+
+    def clear(self):
+        self.sprites = OrderedDict()
+        self.bytes = 0
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "scale": self.scale,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0,
+            "sprites": len(self.sprites),
+            "bytes": self.bytes,
+        }
+
+scaled_sprites = ScaledSpriteCache()
+
+BLINK_LEVELS = 8  # Brightness steps of the TNT blink
+
+# Pre-tinted blink frames by TNT name
+_blink_frames = {}
+
+def get_blink_frames(name, texture, max_alpha=192):
+    """
+    Copies of a TNT texture with a white overlay from 0 to max_alpha opacity,
+    shared by every TNT with the same name so rotations are cached once.
+    """
+    frames = _blink_frames.get(name)
+    if frames is None or frames[0].get_size() != texture.get_size():
+        frames = []
+        for level in range(BLINK_LEVELS):
+            frame = texture.copy()
+            white_overlay = pygame.Surface(texture.get_size(), pygame.SRCALPHA)
+            white_overlay.fill((255, 255, 255, round(level / (BLINK_LEVELS - 1) * max_alpha)))
+            frame.blit(white_overlay, (0, 0))
+            frames.append(frame)
+        _blink_frames[name] = frames
+    return frames
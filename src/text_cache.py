@@ -0,0 +1,45 @@
+from collections import OrderedDict
+
+class TextCache:
+    """
+    Rendered text surfaces keyed by (text, color, shadow or outline, size).
+    Least recently used surfaces are evicted once the cache holds more than
+    `max_entries` strings. Returned surfaces are shared: copy them before
+    changing their alpha or pixels.
+    """
+
+    def __init__(self, max_entries=512):
+        self.max_entries = max_entries
+        self.surfaces = OrderedDict()  # key -> rendered surface
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, render):
+        """Return the cached surface for key, calling render() to create it on a miss"""
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = render()
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_entries:
+            self.surfaces.popitem(last=False)
+        return surface
+
+    def clear(self):
+        self.surfaces.clear()
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0,
+            "surfaces": len(self.surfaces),
+        }
+
+# Shared by MinecraftFont and the HUD
+text_cache = TextCache()
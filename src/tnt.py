@@ -3,8 +3,12 @@ import pymunk
 import math
 import random
 from constants import BLOCK_SIZE
-from chunk import chunks
+from damage import explosion_damage
 from explosion import Explosion
+from asset_registry import asset_registry
+from sprite_cache import BLINK_LEVELS, get_blink_frames, rotation_cache
+from text_cache import text_cache
+from render_queue import blit_texture
 
 class Tnt:
     def __init__(self, space, x, y, texture_atlas, atlas_items, sound_manager, owner_name=None, velocity=0, rotation=0, mass=70):
@@ -64,19 +68,8 @@ class Tnt:
         explosion_radius = 3 * BLOCK_SIZE  # Explosion radius in pixels
         self.detonated = True
 
-        for chunk in chunks:
-            for row in chunks[chunk]:
-                for block in row:
-                    if block is None or getattr(block, "destroyed", False):
-                        continue
-
-                    dx = block.body.position.x - self.body.position.x
-                    dy = block.body.position.y - self.body.position.y
-                    distance = math.hypot(dx, dy)
-
-                    if distance <= explosion_radius:
-                        damage = int(100 * (1 - (distance / explosion_radius)))
-                        block.hp -= damage
+        # Damage falls off from 100 at the center to 0 at the radius, applied once per frame for all explosions
+        explosion_damage.add(self.body.position.x, self.body.position.y, explosion_radius, 100)
 
         explosion = Explosion(self.body.position, self.texture_atlas, self.atlas_items, particle_count=20)
         explosions.append(explosion)
@@ -101,27 +94,20 @@ class Tnt:
         if self.detonated:
             return
 
-        # Draw TNT texture with rotation
-        rotated_image = pygame.transform.rotate(self.texture, -math.degrees(self.body.angle))
-        rect = rotated_image.get_rect(center=(self.body.position.x, self.body.position.y))
-        rect.y -= camera.offset_y
-        rect.x -= camera.offset_x
-        screen.blit(rotated_image, rect)
-
-        # Blinking effect: pulsating white overlay
+        # Blinking effect: pulsating white overlay (maximum 75% opacity), from pre-tinted frames
         blink_period = 500  # 1 second cycle
         current_time = pygame.time.get_ticks() % blink_period
         brightness = (math.sin(current_time / blink_period * 2 * math.pi) + 1) / 2  # range 0-1
-        alpha = int(brightness * 192)  # maximum 75% opacity
-
-        white_overlay = pygame.Surface(self.texture.get_size(), pygame.SRCALPHA)
-        white_overlay.fill((255, 255, 255, alpha))
+        level = round(brightness * (BLINK_LEVELS - 1))
+        frame = get_blink_frames(self.name, self.texture)[level]
 
-        rotated_overlay = pygame.transform.rotate(white_overlay, -math.degrees(self.body.angle))
-        overlay_rect = rotated_overlay.get_rect(center=(self.body.position.x, self.body.position.y))
-        overlay_rect.y -= camera.offset_y
-        overlay_rect.x -= camera.offset_x
-        screen.blit(rotated_overlay, overlay_rect)
+        # Draw TNT texture with rotation
+        angle = -math.degrees(self.body.angle)
+        rotated_image = rotation_cache.get(("blink", self.name, level), frame, angle)
+        rect = rotated_image.get_rect(center=(self.body.position.x, self.body.position.y))
+        rect.y -= camera.offset_y
+        rect.x -= camera.offset_x
+        blit_texture(screen, ("rotated", rotation_cache.key(("blink", self.name, level), angle)), rotated_image, rect)
 
         # Draw owner name and profile picture above TNT
         if self.owner_name:
@@ -155,8 +141,7 @@ class MegaTnt(Tnt):
         self.name = "mega_tnt"
         self.scale_multiplier = 2
 
-        rect = atlas_items["block"]["mega_tnt"]
-        self.texture = pygame.transform.scale_by(texture_atlas.subsurface(rect), self.scale_multiplier)
+        self.texture = asset_registry.texture("block", "mega_tnt", "mega")  # Scaled once, shared by every Mega TNT
 
         width, height = self.texture.get_size()
         self.shape.unsafe_set_vertices(pymunk.Poly.create_box(self.body, (width, height)).get_vertices())
@@ -165,19 +150,7 @@ class MegaTnt(Tnt):
         explosion_radius = 3 * BLOCK_SIZE * self.scale_multiplier
         self.detonated = True
 
-        for chunk in chunks:
-            for row in chunks[chunk]:
-                for block in row:
-                    if block is None or getattr(block, "destroyed", False):
-                        continue
-
-                    dx = block.body.position.x - self.body.position.x
-                    dy = block.body.position.y - self.body.position.y
-                    distance = math.hypot(dx, dy)
-
-                    if distance <= explosion_radius:
-                        damage = int(100 * self.scale_multiplier * (1 - (distance / explosion_radius)))
-                        block.hp -= damage
+        explosion_damage.add(self.body.position.x, self.body.position.y, explosion_radius, 100 * self.scale_multiplier)
 
         explosion = Explosion(self.body.position, self.texture_atlas, self.atlas_items, particle_count=40)
         explosions.append(explosion)
@@ -202,32 +175,33 @@ class MegaTnt(Tnt):
         if self.detonated:
             return
 
-        rotated_image = pygame.transform.rotate(self.texture, -math.degrees(self.body.angle))
-        rect = rotated_image.get_rect(center=(self.body.position.x, self.body.position.y))
-        rect.y -= camera.offset_y
-        rect.x -= camera.offset_x
-        screen.blit(rotated_image, rect)
-
-        # Blinking effect: pulsating white overlay
+        # Blinking effect: pulsating white overlay, from pre-tinted frames
         blink_period = 500
         current_time = pygame.time.get_ticks() % blink_period
         brightness = (math.sin(current_time / blink_period * 2 * math.pi) + 1) / 2
-        alpha = int(brightness * 192)
-
-        white_overlay = pygame.Surface(self.texture.get_size(), pygame.SRCALPHA)
-        white_overlay.fill((255, 255, 255, alpha))
+        level = round(brightness * (BLINK_LEVELS - 1))
+        frame = get_blink_frames(self.name, self.texture)[level]
 
-        rotated_overlay = pygame.transform.rotate(white_overlay, -math.degrees(self.body.angle))
-        overlay_rect = rotated_overlay.get_rect(center=(self.body.position.x, self.body.position.y))
-        overlay_rect.y -= camera.offset_y
-        overlay_rect.x -= camera.offset_x
-        screen.blit(rotated_overlay, overlay_rect)
+        angle = -math.degrees(self.body.angle)
+        rotated_image = rotation_cache.get(("blink", self.name, level), frame, angle)
+        rect = rotated_image.get_rect(center=(self.body.position.x, self.body.position.y))
+        rect.y -= camera.offset_y
+        rect.x -= camera.offset_x
+        blit_texture(screen, ("rotated", rotation_cache.key(("blink", self.name, level), angle)), rotated_image, rect)
 
         # Draw owner name above MegaTNT
         if self.owner_name:
-            text_surface = self.font.render(self.owner_name, True, (255, 255, 255))
-            text_rect = text_surface.get_rect(center=(self.body.position.x - camera.offset_x, self.body.position.y - 55 - camera.offset_y))
-            shadow = self.font.render(self.owner_name, True, (0, 0, 0))
-            shadow_rect = shadow.get_rect(center=(self.body.position.x + 1 - camera.offset_x, self.body.position.y - 54 - camera.offset_y))
-            screen.blit(shadow, shadow_rect)
-            screen.blit(text_surface, text_rect)
+            name_tag = text_cache.get(("mega_tnt_tag", self.owner_name), self.render_name_tag)
+            # Center the text, the shadow hangs one pixel below and to the right of it
+            width, height = name_tag.get_width() - 1, name_tag.get_height() - 1
+            screen.blit(name_tag, (self.body.position.x - camera.offset_x - width // 2,
+                                   self.body.position.y - 55 - camera.offset_y - height // 2))
+
+    def render_name_tag(self):
+        """White owner name over a black shadow offset by one pixel"""
+        text_surface = self.font.render(self.owner_name, True, (255, 255, 255))
+        shadow = self.font.render(self.owner_name, True, (0, 0, 0))
+        name_tag = pygame.Surface((text_surface.get_width() + 1, text_surface.get_height() + 1), pygame.SRCALPHA)
+        name_tag.blit(shadow, (1, 1))
+        name_tag.blit(text_surface, (0, 0))
+        return name_tag
@@ -2,25 +2,41 @@
 import pygame
 import random
 import math
+import numpy as np
 from constants import INTERNAL_WIDTH, INTERNAL_HEIGHT
+from particles import particle_engine
+from render_queue import blit_texture
+
+# Particles are removed once they leave this area of the screen
+WEATHER_BOUNDS = (-50, -float("inf"), INTERNAL_WIDTH + 50, INTERNAL_HEIGHT + 50)
 
 class WeatherSystem:
     def __init__(self):
         self.active_weather = None
-        self.particles = []
+        # Rain and snow share one cap, like the single particle list they replace
+        budget = particle_engine.budget("weather", 80)
+        self.emitters = {
+            "rain": particle_engine.emitter("rain", "raindrop", 80, fade=False, budget=budget),
+            "snow": particle_engine.emitter("snow", "snowflake", 60, fade=False, budget=budget),
+        }
         self.lightning_flash = 0
+        self.flash_surface = None  # Full screen lightning flash, its alpha is set every frame
         self.weather_timer = 0
         self.next_weather_change = random.randint(30000, 120000)  # 30s to 2min
         
     def start_weather(self, weather_type):
         self.active_weather = weather_type
-        self.particles = []
+        self.clear_particles()
         print(f"Weather started: {weather_type}")
         
     def stop_weather(self):
         self.active_weather = None
-        self.particles = []
+        self.clear_particles()
         self.lightning_flash = 0
+
+    def clear_particles(self):
+        for emitter in self.emitters.values():
+            emitter.clear()
         
     def update(self, settings_manager):
         if not settings_manager.get_setting("weather_effects"):
@@ -60,53 +76,38 @@ class WeatherSystem:
         elif self.active_weather == "lightning":
             self.update_lightning(settings_manager)
             
-        # Update particles
-        performance_mode = settings_manager.get_setting("performance_mode")
-        max_particles = 50 if performance_mode else settings_manager.get_setting("max_particles")
-        
-        for particle in self.particles[:]:
-            particle['y'] += particle['speed']
-            particle['x'] += particle.get('wind', 0)
-            particle['life'] -= 1
-            
-            # Remove particles that are off screen or dead
-            if (particle['y'] > INTERNAL_HEIGHT + 50 or 
-                particle['x'] < -50 or particle['x'] > INTERNAL_WIDTH + 50 or
-                particle['life'] <= 0):
-                self.particles.remove(particle)
-        
-        # Limit particle count for performance
-        if len(self.particles) > max_particles:
-            self.particles = self.particles[-max_particles:]
+        # Update particles, removing those that are off screen or dead
+        # (the cap comes from max_particles through the particle engine)
+        for emitter in self.emitters.values():
+            emitter.update(WEATHER_BOUNDS)
     
     def update_rain(self, settings_manager):
         # Spawn rain particles
-        if len(self.particles) < 80:
-            for _ in range(3):
-                self.particles.append({
-                    'x': random.randint(-50, INTERNAL_WIDTH + 50),
-                    'y': random.randint(-100, -50),
-                    'speed': random.randint(8, 15),
-                    'wind': random.uniform(-1, 1),
-                    'type': 'rain',
-                    'life': 300,
-                    'size': random.randint(2, 4)
-                })
+        rain = self.emitters["rain"]
+        if rain.count < 80:
+            rain.spawn(
+                np.random.randint(-50, INTERNAL_WIDTH + 51, 3),
+                np.random.randint(-100, -49, 3),
+                vx=np.random.uniform(-1, 1, 3),  # Wind
+                vy=np.random.randint(8, 16, 3),  # Speed
+                life=300,
+                size=np.random.randint(2, 5, 3),
+                color=(100, 150, 255),
+            )
     
     def update_snow(self, settings_manager):
         # Spawn snow particles
-        if len(self.particles) < 60:
-            for _ in range(2):
-                self.particles.append({
-                    'x': random.randint(-50, INTERNAL_WIDTH + 50),
-                    'y': random.randint(-100, -50),
-                    'speed': random.randint(2, 5),
-                    'wind': random.uniform(-2, 2),
-                    'type': 'snow',
-                    'life': 400,
-                    'size': random.randint(3, 8),
-                    'rotation': random.uniform(0, 360)
-                })
+        snow = self.emitters["snow"]
+        if snow.count < 60:
+            snow.spawn(
+                np.random.randint(-50, INTERNAL_WIDTH + 51, 2),
+                np.random.randint(-100, -49, 2),
+                vx=np.random.uniform(-2, 2, 2),  # Wind
+                vy=np.random.randint(2, 6, 2),  # Speed
+                life=400,
+                size=np.random.randint(3, 9, 2),
+                color=(255, 255, 255),
+            )
     
     def update_lightning(self, settings_manager):
         # Lightning flashes
@@ -120,32 +121,15 @@ class WeatherSystem:
         if not settings_manager.get_setting("weather_effects") or not self.active_weather:
             return
             
-        # Draw weather particles
-        for particle in self.particles:
-            screen_x = particle['x']
-            screen_y = particle['y'] - camera.y
-            
-            if particle['type'] == 'rain':
-                color = (100, 150, 255)
-                pygame.draw.line(screen, color, 
-                               (screen_x, screen_y), 
-                               (screen_x - 2, screen_y + particle['size']), 2)
-            elif particle['type'] == 'snow':
-                color = (255, 255, 255)
-                size = particle['size']
-                pygame.draw.circle(screen, color, (int(screen_x), int(screen_y)), size // 2)
-                # Draw small cross pattern for snowflake effect
-                pygame.draw.line(screen, color, 
-                               (screen_x - size//2, screen_y), 
-                               (screen_x + size//2, screen_y), 1)
-                pygame.draw.line(screen, color, 
-                               (screen_x, screen_y - size//2), 
-                               (screen_x, screen_y + size//2), 1)
+        # Draw weather particles, they live in screen space
+        emitter = self.emitters.get(self.active_weather)
+        if emitter is not None:
+            emitter.draw(screen)
         
         # Draw lightning flash
         if self.lightning_flash > 0:
-            alpha = (self.lightning_flash / 30) * 100
-            flash_surface = pygame.Surface((INTERNAL_WIDTH, INTERNAL_HEIGHT))
-            flash_surface.set_alpha(alpha)
-            flash_surface.fill((200, 200, 255))
-            screen.blit(flash_surface, (0, 0))
+            if self.flash_surface is None:
+                self.flash_surface = pygame.Surface((INTERNAL_WIDTH, INTERNAL_HEIGHT))
+                self.flash_surface.fill((200, 200, 255))
+            self.flash_surface.set_alpha((self.lightning_flash / 30) * 100)
+            blit_texture(screen, "lightning_flash", self.flash_surface, (0, 0))  # Only its alpha ever changes
@@ -0,0 +1,129 @@
+import numpy as np
+from block import BLOCK_IDS
+from constants import CHUNK_HEIGHT, CHUNK_WIDTH, SEED
+
+def generate_noise_ranges(block_weights):
+    """
+    Generate noise value ranges based on block rarity weights.
+
+    :param block_weights: Dict of block names and their rarity weights.
+                          Higher values mean more common.
+    :return: List of (block_name, min_value, max_value)
+    """
+    sorted_blocks = sorted(block_weights.items(), key=lambda x: x[1], reverse=True)  # Sort by weight
+    total_weight = sum(block_weights.values())  # Get total weight
+    min_noise = -1.0  # Start from minimum noise value
+    noise_ranges = []
+
+    for block, weight in sorted_blocks:
+        range_size = (weight / total_weight) * 2.0  # Scale to noise range (-1 to 1)
+        max_noise = min_noise + range_size
+        noise_ranges.append((block, min_noise, max_noise))
+        min_noise = max_noise  # Move to next range
+
+    return noise_ranges
+
+block_weights = {
+    "stone": 40,
+    "andesite": 30,
+    "diorite": 10,
+    "granite": 10,
+    "coal_ore": 10,
+    "iron_ore": 8,
+    "copper_ore": 8,
+    "gold_ore": 5,
+    "diamond_ore": 2,
+    "emerald_ore": 1,
+    "obsidian": 1,
+    "redstone_ore": 7,
+    "lapis_ore": 6,
+    "mossy_cobblestone": 4,
+    "cobblestone": 20
+}
+
+# Generate noise ranges
+noise_ranges = generate_noise_ranges(block_weights)
+
+# searchsorted lookup table: upper bound of every range and the block id it maps to
+noise_thresholds = np.array([max_noise for _, _, max_noise in noise_ranges])
+noise_block_ids = np.array([BLOCK_IDS[block] for block, _, _ in noise_ranges], dtype=np.uint8)
+
+def noise_to_block_ids(noise):
+    """Map noise values (-1 to 1) to block type ids, same ranges as noise_ranges"""
+    index = np.searchsorted(noise_thresholds, noise, side="right")
+    return noise_block_ids[np.minimum(index, len(noise_block_ids) - 1)]
+
+def hash_noise(ix, iy, seed):
+    """Deterministic white noise (-1 to 1) for integer lattice coordinates"""
+    h = (ix * 374761393 + iy * 668265263 + np.int64(seed) * 2147483647) & 0xFFFFFFFF
+    h = ((h ^ (h >> 13)) * 1274126177) & 0xFFFFFFFF
+    h ^= h >> 16
+    return h / 0xFFFFFFFF * 2.0 - 1.0
+
+def value_noise(x, y, seed):
+    """Smoothly interpolated lattice noise (-1 to 1) at float coordinates"""
+    x0 = np.floor(x)
+    y0 = np.floor(y)
+    fx = x - x0
+    fy = y - y0
+    fx = fx * fx * (3 - 2 * fx)  # Smoothstep
+    fy = fy * fy * (3 - 2 * fy)
+
+    ix = x0.astype(np.int64)
+    iy = y0.astype(np.int64)
+    top = hash_noise(ix, iy, seed) * (1 - fx) + hash_noise(ix + 1, iy, seed) * fx
+    bottom = hash_noise(ix, iy + 1, seed) * (1 - fx) + hash_noise(ix + 1, iy + 1, seed) * fx
+    return top * (1 - fy) + bottom * fy
+
+# Coherent noise layers as (x frequency, y frequency, weight): three octaves of
+# round blobs for ore veins and one horizontally stretched layer for strata
+noise_layers = np.array([
+    (1 / 3, 1 / 3, 0.55 * 4 / 7),
+    (2 / 3, 2 / 3, 0.55 * 2 / 7),
+    (4 / 3, 4 / 3, 0.55 * 1 / 7),
+    (1 / 12, 1 / 2.5, 0.25),
+])
+grain_weight = 0.2  # Per-block white noise that keeps vein edges from looking smooth
+
+def noise_field(world_x, world_y, seed):
+    """Raw coherent noise for block coordinates, all layers evaluated in one pass"""
+    x_frequency, y_frequency, weights = noise_layers[:, :, None, None].transpose(1, 0, 2, 3)
+    layer_seeds = seed + np.arange(len(noise_layers)).reshape(-1, 1, 1)
+    layers = value_noise(world_x * x_frequency, world_y * y_frequency, layer_seeds)
+    grain = hash_noise(world_x, world_y, seed + len(noise_layers))
+    return (layers * weights).sum(axis=0) + grain_weight * grain
+
+# Sorted noise samples per seed, used to flatten the field to a uniform distribution
+_noise_quantiles = {}
+
+def get_noise_quantiles(seed):
+    """
+    Coherent noise clusters around 0, so its values are remapped through the
+    empirical distribution of a large sample. That keeps every block at the
+    frequency given by block_weights.
+    """
+    if seed not in _noise_quantiles:
+        world_y, world_x = np.mgrid[0:4096, 1:CHUNK_WIDTH - 1]
+        _noise_quantiles[seed] = np.sort(noise_field(world_x, world_y, seed).ravel())
+    return _noise_quantiles[seed]
+
+def generate_chunk_types(chunk_y, count=1, seed=SEED):
+    """
+    Generate the block type ids of `count` consecutive chunks starting at chunk_y.
+
+    The result only depends on the seed and chunk coordinate, so a chunk
+    always looks the same whether it is generated alone or in a batch.
+
+    :return: uint8 array of shape (count, CHUNK_HEIGHT, CHUNK_WIDTH)
+    """
+    world_y, world_x = np.mgrid[chunk_y * CHUNK_HEIGHT:(chunk_y + count) * CHUNK_HEIGHT, 0:CHUNK_WIDTH]
+
+    quantiles = get_noise_quantiles(seed)
+    uniform = np.searchsorted(quantiles, noise_field(world_x, world_y, seed)) / len(quantiles)
+    types = noise_to_block_ids(uniform * 2.0 - 1.0)
+
+    # Bedrock walls on both sides
+    types[:, 0] = BLOCK_IDS["bedrock"]
+    types[:, CHUNK_WIDTH - 1] = BLOCK_IDS["bedrock"]
+
+    return types.reshape(count, CHUNK_HEIGHT, CHUNK_WIDTH)
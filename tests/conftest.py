@@ -0,0 +1,18 @@
+"""
+Shared test fixtures
+"""
+
+import pytest
+
+
+class FakeHud:
+    """Stands in for the HUD where only the ore counters are used"""
+
+    def __init__(self):
+        self.amounts = {name: 0 for name in ["coal", "iron_ingot", "copper_ingot", "gold_ingot",
+                                             "redstone", "lapis_lazuli", "diamond", "emerald"]}
+
+
+@pytest.fixture
+def hud():
+    return FakeHud()
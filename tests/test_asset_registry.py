@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared asset registry
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import pygame
+
+from asset_registry import ASSETS_DIR, HUD_ICON_SIZE, PANEL_ICON_SIZE, AssetRegistry
+from atlas import create_texture_atlas, load_texture_atlas
+from constants import BLOCK_SIZE, BLOCK_TEXTURE_SIZE
+
+
+def test_variants_are_built_once_in_their_sizes(tmp_path):
+    assets = AssetRegistry(cache_dir=tmp_path)
+    texture_atlas, atlas_items = assets.atlas()
+    assert assets.atlas()[0] is texture_atlas
+
+    assert assets.texture("block", "tnt", "source").get_size() == (BLOCK_TEXTURE_SIZE, BLOCK_TEXTURE_SIZE)
+    assert assets.texture("block", "tnt").get_size() == (BLOCK_SIZE, BLOCK_SIZE)
+    assert assets.texture("item", "diamond", "hud").get_size() == HUD_ICON_SIZE
+    assert assets.texture("block", "tnt", "panel").get_size() == PANEL_ICON_SIZE
+    mega = assets.texture("block", "mega_tnt", "mega")
+    assert mega.get_size() == (2 * BLOCK_SIZE, 2 * BLOCK_SIZE)
+    assert assets.texture("block", "mega_tnt", "mega") is mega
+    assert assets.texture("pickaxe", "diamond_pickaxe", "giant").get_size() == (3 * BLOCK_SIZE, 3 * BLOCK_SIZE)
+
+
+def test_cached_atlas_matches_a_fresh_build(tmp_path):
+    cold = load_texture_atlas(ASSETS_DIR, 2, tmp_path)
+    warm = load_texture_atlas(ASSETS_DIR, 2, tmp_path)
+    assert warm[1] == cold[1] and warm[3] == cold[3]
+    assert pygame.image.tobytes(warm[2], "RGBA") == pygame.image.tobytes(cold[2], "RGBA")
+
+    # The packing leaves no gap: the atlas is only as tall as the rows of textures need
+    atlas_surface, textures = create_texture_atlas(ASSETS_DIR)
+    texture_area = sum(w * h for items in textures.values() for _, _, w, h in items.values())
+    assert atlas_surface.get_width() * (atlas_surface.get_height() - 16) < texture_area
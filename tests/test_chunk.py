@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Tests for the array-backed chunk storage
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import numpy as np
+import pygame
+
+import chunk as world
+from camera import Camera
+from block import BLOCK_IDS, BLOCK_TYPES, MAX_HP
+from constants import BLOCK_SIZE, CHUNK_HEIGHT, CHUNK_WIDTH
+from render_queue import RenderQueue
+
+
+def setup_function():
+    world.chunks.clear()
+
+
+def test_chunk_arrays():
+    chunk = world.get_chunk(0, 2, None, None)
+
+    assert chunk.types.shape == (CHUNK_HEIGHT, CHUNK_WIDTH)
+    assert chunk.types.dtype == np.uint8
+    assert (chunk.types[:, 0] == BLOCK_IDS["bedrock"]).all()
+    assert (chunk.types[:, CHUNK_WIDTH - 1] == BLOCK_IDS["bedrock"]).all()
+    assert (chunk.hp == MAX_HP[chunk.types]).all()
+    assert not chunk.destroyed.any()
+
+
+def test_first_chunk_has_air():
+    assert world.get_block(0, 0, 4, 4, None, None) is None
+    assert world.get_block(0, 0, 4, 0, None, None).name == "bedrock"
+    assert world.get_block(0, 0, 4, CHUNK_HEIGHT - 2, None, None).name == "grass_block"
+    assert world.get_chunk(0, -1, None, None) is None
+
+
+def test_block_view_writes_through():
+    block = world.get_block(0, 1, 3, 5, None, None)
+    block.hp -= 4
+
+    chunk = world.chunks[(0, 1)]
+    assert chunk.hp[5, 3] == block.max_hp - 4
+    assert block.position == ((3 * BLOCK_SIZE) + BLOCK_SIZE // 2, (CHUNK_HEIGHT + 5) * BLOCK_SIZE + BLOCK_SIZE // 2)
+
+
+def test_delete_block_marks_row_dirty():
+    chunk = world.get_chunk(0, 1, None, None)
+
+    world.delete_block(0, 1, 3, 5)
+
+    assert chunk.destroyed[5, 3]
+    assert world.get_block(0, 1, 3, 5, None, None) is None
+    assert chunk.row_versions[5] == 1
+    assert not chunk.row_versions[:5].any()
+
+
+def test_drops_follow_block_type_registry(hud):
+    chunk = world.get_chunk(0, 2, None, None)
+    chunk.types[3, 3] = BLOCK_IDS["lapis_ore"]
+    chunk.types[3, 4] = BLOCK_IDS["stone"]
+
+    world.Block(chunk, 3, 3).destroy(hud)
+    world.Block(chunk, 4, 3).destroy(hud)
+
+    assert BLOCK_TYPES[BLOCK_IDS["lapis_ore"]].drop_range == (4, 8)
+    assert 4 <= hud.amounts["lapis_lazuli"] <= 8
+    assert sum(hud.amounts.values()) == hud.amounts["lapis_lazuli"]
+    assert not hasattr(world.Block(chunk, 5, 3), "__dict__")
+
+
+def make_atlas():
+    # One flat color square per block type and destroy stage
+    names = [name for name in BLOCK_IDS if name != "air"]
+    atlas = pygame.Surface((BLOCK_SIZE * (len(names) + 10), BLOCK_SIZE), pygame.SRCALPHA)
+    items = {"block": {}, "destroy_stage": {}}
+    for index, name in enumerate(names):
+        items["block"][name] = (index * BLOCK_SIZE, 0, BLOCK_SIZE, BLOCK_SIZE)
+        atlas.fill((index * 13 % 256, 100, 200), items["block"][name])
+    for stage in range(10):
+        rect = ((len(names) + stage) * BLOCK_SIZE, 0, BLOCK_SIZE, BLOCK_SIZE)
+        items["destroy_stage"][f"destroy_stage_{stage}"] = rect
+        atlas.fill((0, 0, 0, 20 * stage + 10), rect)
+    return atlas, items
+
+
+def draw_per_block(chunk, screen, camera):
+    # Reference: one blit per block and one per overlay
+    block_textures, destroy_stages = world.get_block_textures(chunk.texture_atlas, chunk.atlas_items)
+    stages = chunk.stages()
+    for y, x in zip(*np.nonzero(stages > -2)):
+        position = ((chunk.chunk_x * CHUNK_WIDTH + x) * BLOCK_SIZE - camera.offset_x,
+                    (chunk.chunk_y * CHUNK_HEIGHT + y) * BLOCK_SIZE - camera.offset_y)
+        screen.blit(block_textures[chunk.types[y, x]], position)
+        if stages[y, x] >= 0:
+            screen.blit(destroy_stages[stages[y, x]], position)
+
+
+def test_cached_surface_matches_per_block_drawing():
+    atlas, items = make_atlas()
+    chunk = world.get_chunk(0, 0, atlas, items)
+    chunk.hp[CHUNK_HEIGHT - 2, 3] = 0.1  # Grass at almost no HP
+    camera = Camera()
+    camera.offset_y = 300
+
+    def compare():
+        expected = pygame.Surface((CHUNK_WIDTH * BLOCK_SIZE, 1000))
+        expected.fill((10, 20, 30))
+        draw_per_block(chunk, expected, camera)
+        cached = pygame.Surface((CHUNK_WIDTH * BLOCK_SIZE, 1000))
+        cached.fill((10, 20, 30))
+        chunk.draw(cached, camera)
+        assert (pygame.surfarray.array3d(cached) == pygame.surfarray.array3d(expected)).all()
+
+    compare()
+    chunk.hp[CHUNK_HEIGHT - 1, 5] *= 0.5
+    world.delete_block(0, 0, 4, CHUNK_HEIGHT - 2)
+    camera.offset_y = 1200
+    compare()
+    first_row, last_row = camera.visible_rows()
+    assert (chunk.drawn_stages[first_row:] == chunk.stages(first_row, last_row)).all()
+    assert (chunk.drawn_stages[:first_row] != chunk.stages(0, first_row)).any()  # Rows above the screen were not redrawn
+
+    chunk.release_surface()
+    assert chunk.surface is None
+
+
+def test_surface_is_released_when_the_chunk_leaves_the_screen():
+    atlas, items = make_atlas()
+    chunk = world.get_chunk(0, 1, atlas, items)
+    screen = pygame.Surface((CHUNK_WIDTH * BLOCK_SIZE, 1000))
+    camera = Camera()
+
+    camera.offset_y = CHUNK_HEIGHT * BLOCK_SIZE - 500
+    chunk.draw(screen, camera)
+    assert chunk.surface is not None
+
+    camera.offset_y = 2 * CHUNK_HEIGHT * BLOCK_SIZE
+    chunk.draw(screen, camera)
+    assert chunk.surface is None
+    assert chunk.drawn_stages is None
+
+
+def test_damaged_textures_are_composited_once():
+    atlas, items = make_atlas()
+    cache = world.DamagedTextureCache()
+    stone = BLOCK_IDS["stone"]
+
+    first = cache.get(atlas, items, stone, 4)
+    assert cache.get(atlas, items, stone, 4) is first
+    cache.get(atlas, items, stone, 5)
+    assert cache.stats() == {"hits": 1, "misses": 2, "hit_rate": 1 / 3, "textures": 2}
+
+    expected = world.get_block_textures(atlas, items)[0][stone].copy()
+    expected.blit(world.get_block_textures(atlas, items)[1][4], (0, 0))
+    assert (pygame.surfarray.array3d(first) == pygame.surfarray.array3d(expected)).all()
+
+
+def test_scaled_layer_draws_the_chunk_at_the_render_scale():
+    atlas, items = make_atlas()
+    chunk = world.get_chunk(0, 0, atlas, items)
+    chunk.hp[CHUNK_HEIGHT - 2, 3] = 0.1
+    camera = Camera()
+    camera.offset_y = 600
+
+    full = pygame.Surface((CHUNK_WIDTH * BLOCK_SIZE, 1000))
+    chunk.draw(full, camera)
+
+    queue = RenderQueue((CHUNK_WIDTH * BLOCK_SIZE, 1000))
+    queue.set_scale(0.5)
+    frame = pygame.Surface(queue.frame_size())
+    chunk.draw(queue["world"], camera)
+    queue.flush("world", frame)
+
+    assert chunk.surface.get_size() == (CHUNK_WIDTH * BLOCK_SIZE // 2, CHUNK_HEIGHT * BLOCK_SIZE // 2)
+    expected = pygame.transform.scale(full, frame.get_size())
+    assert (pygame.surfarray.array3d(frame) == pygame.surfarray.array3d(expected)).all()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Tests for the chunk lifecycle manager
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import pymunk
+
+import chunk as world
+from chunk_manager import ChunkManager
+from collision import CollisionBand
+from constants import BLOCK_SIZE, CHUNK_HEIGHT
+
+
+def setup_function():
+    world.chunks.clear()
+
+
+def make_manager(keep_rows=2):
+    space = pymunk.Space()
+    band = CollisionBand(space)
+    return ChunkManager(band, None, None, keep_rows=keep_rows), band, space
+
+
+def test_visible_rows_are_active_and_passed_rows_inactive():
+    manager, band, space = make_manager()
+    manager.update(0, 3)
+    assert len(manager.active) == 3
+    assert all(chunk.state == "active" for chunk in manager.active)
+
+    manager.update(1, 4)
+    assert world.chunks[(0, 0)].state == "inactive"
+    assert world.chunks[(0, 3)].state == "active"
+
+
+def test_hysteresis_keeps_damage_when_moving_back_up():
+    manager, band, space = make_manager(keep_rows=2)
+    manager.update(3, 5)
+    world.delete_block(0, 3, 4, 5)
+
+    manager.update(5, 7)  # Two rows down, still retained
+    manager.update(3, 5)
+    assert world.chunks[(0, 3)].destroyed[5, 4]
+
+    manager.update(6, 8)  # Three rows down, unloaded
+    assert (0, 3) not in world.chunks
+    assert manager.stats()["unloaded"] == 1
+
+
+def test_unload_releases_block_shapes():
+    manager, band, space = make_manager(keep_rows=0)
+    manager.update(1, 3)
+    body = pymunk.Body(10, 10)
+    body.position = (4.5 * BLOCK_SIZE, 1.5 * CHUNK_HEIGHT * BLOCK_SIZE)
+    space.add(body, pymunk.Circle(body, BLOCK_SIZE / 4))
+    band.update([body])
+    assert manager.stats()["block_shapes"] > 0
+
+    manager.update(3, 5)
+    stats = manager.stats()
+    assert stats["block_shapes"] == 0
+    assert stats["shapes"] == 1  # Only the body's own shape is left
+    assert stats["chunks"] == 2
+    assert stats["bytes"] >= 2 * world.chunks[(0, 3)].nbytes
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Tests for the collision band that builds block geometry near dynamic bodies
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import numpy as np
+import pymunk
+
+import chunk as world
+from collision import CollisionBand, add_side_walls, blocks_at_contact, find_runs
+from constants import BLOCK_SIZE, CHUNK_HEIGHT, CHUNK_WIDTH
+
+
+def setup_function():
+    world.chunks.clear()
+
+
+def make_body(space, x, y):
+    body = pymunk.Body(10, pymunk.moment_for_box(10, (BLOCK_SIZE / 2, BLOCK_SIZE / 2)))
+    body.position = (x, y)
+    space.add(body, pymunk.Poly.create_box(body, (BLOCK_SIZE / 2, BLOCK_SIZE / 2)))
+    return body
+
+
+def load_chunks(chunk_ys):
+    for chunk_y in chunk_ys:
+        world.get_chunk(0, chunk_y, None, None)
+
+
+def block_shapes(space):
+    return [shape for shape in space.shapes if shape.collision_type == 2]
+
+
+def test_find_runs():
+    solid = np.array([True, True, False, True, False, False, True, True, True])
+    assert find_runs(solid) == [(0, 2), (3, 4), (6, 9)]
+    assert find_runs(np.zeros(4, dtype=bool)) == []
+
+
+def test_solid_rows_become_single_shapes():
+    space = pymunk.Space()
+    load_chunks(range(0, 4))
+    body = make_body(space, 4.5 * BLOCK_SIZE, 2 * CHUNK_HEIGHT * BLOCK_SIZE + 0.5 * BLOCK_SIZE)
+
+    band = CollisionBand(space, margin=2)
+    band.update([body])
+
+    # Rows below the first chunk are fully solid, so every band row is one box
+    shapes = block_shapes(space)
+    assert len(shapes) == 5
+    for shape in shapes:
+        world_y, first_x, last_x = shape.block_cells
+        assert abs((world_y + 0.5) * BLOCK_SIZE - body.position.y) <= 2.5 * BLOCK_SIZE
+        assert (first_x, last_x) == (0, CHUNK_WIDTH - 1)
+
+
+def test_destroyed_block_splits_only_its_row():
+    space = pymunk.Space()
+    load_chunks(range(0, 4))
+    body = make_body(space, 4.5 * BLOCK_SIZE, 2 * CHUNK_HEIGHT * BLOCK_SIZE + 0.5 * BLOCK_SIZE)
+    band = CollisionBand(space, margin=2)
+    band.update([body])
+    before = set(block_shapes(space))
+
+    world.delete_block(0, 2, 4, 1)
+    band.update([body])
+    after = set(block_shapes(space))
+
+    assert len(before - after) == 1
+    assert len(after - before) == 2
+    assert sorted(shape.block_cells for shape in after - before) == [
+        (2 * CHUNK_HEIGHT + 1, 0, 3),
+        (2 * CHUNK_HEIGHT + 1, 5, CHUNK_WIDTH - 1),
+    ]
+
+
+def test_sideways_movement_keeps_the_rows():
+    space = pymunk.Space()
+    load_chunks(range(0, 4))
+    body = make_body(space, 2.5 * BLOCK_SIZE, 2 * CHUNK_HEIGHT * BLOCK_SIZE + 0.5 * BLOCK_SIZE)
+    band = CollisionBand(space, margin=2)
+    band.update([body])
+    before = set(block_shapes(space))
+
+    body.position = (6.5 * BLOCK_SIZE, body.position.y)
+    band.update([body])
+    assert set(block_shapes(space)) == before
+
+
+def test_shapes_are_released_when_bodies_move():
+    space = pymunk.Space()
+    load_chunks(range(0, 4))
+    body = make_body(space, 4.5 * BLOCK_SIZE, CHUNK_HEIGHT * BLOCK_SIZE + 0.5 * BLOCK_SIZE)
+
+    band = CollisionBand(space, margin=1)
+    band.update([body])
+    first = set(block_shapes(space))
+
+    body.position = (4.5 * BLOCK_SIZE, 3 * CHUNK_HEIGHT * BLOCK_SIZE + 0.5 * BLOCK_SIZE)
+    band.update([body])
+    second = set(block_shapes(space))
+
+    assert first and second
+    assert not first & second
+
+    band.clear()
+    assert not block_shapes(space)
+
+
+def test_contact_resolves_to_block_under_body():
+    space = pymunk.Space()
+    space.gravity = (0, 1000)
+    load_chunks(range(0, 2))
+    # Falls onto the grass row of the first chunk, in column 6
+    body = make_body(space, 6.5 * BLOCK_SIZE, (CHUNK_HEIGHT - 3) * BLOCK_SIZE + 0.5 * BLOCK_SIZE)
+    band = CollisionBand(space)
+
+    hits = []
+    handler = space.add_collision_handler(0, 2)
+    handler.post_solve = lambda arbiter, space, data: hits.extend(blocks_at_contact(arbiter))
+
+    for _ in range(30):
+        band.update([body])
+        space.step(1 / 60)
+
+    assert hits
+    assert {(block.x, block.y, block.name) for block in hits} == {(6, CHUNK_HEIGHT - 2, "grass_block")}
+    assert hits[0].chunk is world.chunks[(0, 0)]
+
+
+def test_contact_resolves_to_every_block_touched():
+    space = pymunk.Space()
+    space.gravity = (0, 1000)
+    load_chunks(range(0, 2))
+    # A body 1.5 blocks wide straddling columns 3 and 4 lands on one merged grass run
+    body = pymunk.Body(10, pymunk.moment_for_box(10, (1.5 * BLOCK_SIZE, BLOCK_SIZE / 2)))
+    body.position = (4 * BLOCK_SIZE, (CHUNK_HEIGHT - 3) * BLOCK_SIZE + 0.5 * BLOCK_SIZE)
+    space.add(body, pymunk.Poly.create_box(body, (1.5 * BLOCK_SIZE, BLOCK_SIZE / 2)))
+    band = CollisionBand(space)
+
+    hits = []
+    handler = space.add_collision_handler(0, 2)
+    handler.post_solve = lambda arbiter, space, data: hits.append(blocks_at_contact(arbiter))
+
+    for _ in range(30):
+        band.update([body])
+        space.step(1 / 60)
+
+    assert hits
+    assert any(len(blocks) == 2 for blocks in hits)  # Both cells in the same step
+    assert all(len(blocks) == len({(block.x, block.y) for block in blocks}) for blocks in hits)
+    assert {(block.x, block.y) for blocks in hits for block in blocks} == {(3, CHUNK_HEIGHT - 2), (4, CHUNK_HEIGHT - 2)}
+
+
+def test_side_walls_keep_bodies_inside():
+    space = pymunk.Space()
+    walls = add_side_walls(space)
+    body = make_body(space, BLOCK_SIZE, BLOCK_SIZE)
+    body.velocity = (-2000, 0)
+
+    for _ in range(60):
+        space.step(1 / 60)
+
+    assert len(walls) == 2
+    assert body.position.x > 0
+    assert not block_shapes(space)  # No block geometry for the sides
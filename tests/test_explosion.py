@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Tests for pre-rotated explosion frames and the explosion particle pool
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import pygame
+
+from explosion import ORIENTATIONS, Explosion, explosion_particle_pool, get_explosion_frames
+
+
+def make_atlas(frame_count=16):
+    atlas = pygame.Surface((8 * frame_count, 4), pygame.SRCALPHA)
+    atlas_items = {"particle": {f"explosion_{frame}": (8 * frame, 0, 8, 4) for frame in range(frame_count)}}
+    return atlas, atlas_items
+
+
+def test_frames_are_rotated_once_per_atlas():
+    atlas, atlas_items = make_atlas()
+    frames = get_explosion_frames(atlas, atlas_items)
+    assert get_explosion_frames(atlas, atlas_items) is frames
+    assert len(frames) == len(ORIENTATIONS) and all(len(orientation) == 16 for orientation in frames)
+    assert {frames[i][0].get_size() for i in range(len(ORIENTATIONS))} == {(8, 4), (4, 8)}
+
+
+def test_finished_particles_return_to_the_pool():
+    pygame.init()
+    atlas, atlas_items = make_atlas()
+    explosion_particle_pool.reserve(10)
+    free = set(map(id, explosion_particle_pool.free))
+
+    explosion = Explosion((100, 100), atlas, atlas_items, particle_count=10)
+    assert {id(particle) for particle in explosion.particles} <= free
+    pygame.time.wait(2)  # Explosion.update advances by the ticks since pygame.init
+    for _ in range(16):
+        explosion.update()
+    assert not explosion.particles
+    assert len(explosion_particle_pool.free) >= 10
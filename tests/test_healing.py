@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Tests for the block healing scheduler
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import chunk as world
+from block import BLOCK_IDS, HEAL_INTERVAL
+from healing import HealingScheduler
+
+
+def setup_function():
+    world.chunks.clear()
+
+
+def make_stone_chunk():
+    chunk = world.get_chunk(0, 1, None, None)
+    chunk.types[2, 2] = BLOCK_IDS["stone"]
+    chunk.hp[2, 2] = 10
+    return chunk
+
+
+def test_hit_destroys_block_out_of_hp_and_drops(hud):
+    chunk = world.get_chunk(0, 1, None, None)
+    chunk.types[2, 2] = BLOCK_IDS["coal_ore"]
+    chunk.hp[2, 2] = 0
+    scheduler = HealingScheduler()
+    scheduler.damage(chunk, 2, 2, 100)
+
+    scheduler.update(hud, 100)
+
+    assert chunk.destroyed[2, 2]
+    assert hud.amounts["coal"] == 1
+    assert chunk.row_versions[2] == 1
+
+
+def test_heals_twenty_percent_per_interval_until_full(hud):
+    chunk = make_stone_chunk()
+    chunk.hp[2, 2] = 5
+    scheduler = HealingScheduler()
+    scheduler.damage(chunk, 2, 2, 0)
+
+    scheduler.update(hud, HEAL_INTERVAL - 1)
+    assert chunk.hp[2, 2] == 5
+    for step, expected in enumerate([7, 9, 10], start=1):
+        scheduler.update(hud, step * HEAL_INTERVAL)
+        assert chunk.hp[2, 2] == expected
+    assert chunk.damage_time[2, 2] == -1
+    assert not scheduler.heap
+
+
+def test_new_hit_restarts_the_timer(hud):
+    chunk = make_stone_chunk()
+    chunk.hp[2, 2] = 5
+    scheduler = HealingScheduler()
+    scheduler.damage(chunk, 2, 2, 0)
+    scheduler.damage(chunk, 2, 2, 3000)
+
+    scheduler.update(hud, HEAL_INTERVAL)
+    assert chunk.hp[2, 2] == 5  # The first entry is stale
+    scheduler.update(hud, 3000 + HEAL_INTERVAL)
+    assert chunk.hp[2, 2] == 7
+
+
+def test_unloaded_and_destroyed_cells_are_dropped(hud):
+    chunk = make_stone_chunk()
+    chunk.hp[2, 2] = 5
+    chunk.hp[3, 3] = 1
+    scheduler = HealingScheduler()
+    scheduler.damage(chunk, 2, 2, 0)
+    scheduler.damage(chunk, 3, 3, 0)
+    world.delete_block(0, 1, 3, 3)
+    chunk.state = "unloaded"
+
+    scheduler.update(hud, HEAL_INTERVAL)
+    assert chunk.hp[2, 2] == 5
+    assert not scheduler.heap
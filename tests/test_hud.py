@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+Tests for the retained HUD surface
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import pygame
+
+from constants import BLOCK_SIZE
+from hud import Hud
+
+
+def make_hud():
+    pygame.font.init()
+    atlas = pygame.Surface((16 * 8, 16), pygame.SRCALPHA)
+    ores = ["coal", "iron_ingot", "copper_ingot", "gold_ingot", "redstone", "lapis_lazuli", "diamond", "emerald"]
+    atlas_items = {"item": {ore: (16 * i, 0, 16, 16) for i, ore in enumerate(ores)}}
+    return Hud(atlas, atlas_items)
+
+
+def test_hud_is_rebuilt_only_when_its_state_changes():
+    hud = make_hud()
+    screen = pygame.Surface((1080, 1920))
+    assert hud.icons["coal"].get_size() == hud.icon_size
+
+    hud.draw(screen, 0, False, "Fast")
+    first = hud.surface
+    hud.draw(screen, BLOCK_SIZE // 2, False, "Fast")  # Same depth bucket
+    assert hud.surface is first and hud.rebuilds == 1
+
+    hud.amounts["diamond"] += 3
+    hud.draw(screen, BLOCK_SIZE // 2, False, "Fast")
+    hud.draw(screen, -2 * BLOCK_SIZE, False, "Fast")
+    hud.draw(screen, -2 * BLOCK_SIZE, True, "Slow")
+    assert hud.rebuilds == 4
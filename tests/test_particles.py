@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Tests for the struct-of-arrays particle engine
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import numpy as np
+import pygame
+
+from particles import ALPHA_LEVELS, MAX_SPRITES, ParticleEngine
+
+
+def test_dead_particles_are_swap_removed():
+    emitter = ParticleEngine().emitter("test", "square", 10)
+    emitter.spawn(np.arange(5), 0, vy=1, life=np.array([1, 3, 1, 3, 3]))
+    emitter.update()
+    assert emitter.count == 3
+    assert sorted(emitter.x[:emitter.count].tolist()) == [1, 3, 4]
+    assert (emitter.y[:emitter.count] == 1).all()
+    assert (emitter.life[:emitter.count] == 2).all()
+
+
+def test_spawns_are_capped_by_max_particles():
+    engine = ParticleEngine()
+    emitter = engine.emitter("test", "disc", 60)
+    engine.set_max_particles(50)
+    emitter.spawn(np.zeros(70), np.zeros(70))
+    assert (emitter.count, emitter.dropped) == (50, 20)
+
+    engine.set_max_particles(10)
+    emitter.update()
+    assert emitter.count == 10
+
+
+def test_sprites_are_shared_between_particles():
+    emitter = ParticleEngine().emitter("test", "disc", 10)
+    emitter.spawn(np.array([100, 200]), 50, life=20, size=6, color=(255, 215, 0))
+    screen = pygame.Surface((300, 100), pygame.SRCALPHA)
+    emitter.draw(screen, offset_y=0)
+    assert len(emitter.sprites) == 1
+    assert screen.get_at((100, 50))[:3] == (255, 215, 0)
+
+
+def test_emitters_share_a_budget():
+    engine = ParticleEngine()
+    budget = engine.budget("weather", 80)
+    rain = engine.emitter("rain", "raindrop", 80, budget=budget)
+    snow = engine.emitter("snow", "snowflake", 60, budget=budget)
+    engine.set_max_particles(50)
+
+    rain.spawn(np.zeros(30), np.zeros(30))
+    snow.spawn(np.zeros(30), np.zeros(30))
+    assert (rain.count, snow.count, snow.dropped) == (30, 20, 10)
+
+    engine.set_max_particles(40)
+    snow.update()
+    assert rain.count + snow.count == 40
+
+
+def test_sprite_cache_is_bounded():
+    emitter = ParticleEngine().emitter("test", "square", 10)
+    for hue in range(MAX_SPRITES + 50):
+        emitter.sprite(4, (hue % 256, hue // 256, 0), ALPHA_LEVELS - 1)
+    assert len(emitter.sprites) == MAX_SPRITES
+    assert (4, (0, 0, 0), ALPHA_LEVELS - 1) not in emitter.sprites
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Tests for the background chunk prefetcher
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import chunk as world
+from constants import FRAMERATE
+from prefetch import ChunkPrefetcher
+
+
+def setup_function():
+    world.chunks.clear()
+
+
+def wait_for_rows(prefetcher, rows, min_chunk_y=0):
+    deadline = time.time() + 10
+    while prefetcher.pending or not all((0, chunk_y) in world.chunks for chunk_y in rows):
+        assert time.time() < deadline
+        prefetcher.commit(min_chunk_y)
+        time.sleep(0.01)
+
+
+def test_prefetched_chunks_match_generated_ones():
+    prefetcher = ChunkPrefetcher(None, None, budget_ms=100)
+    prefetcher.request(range(3, 7))
+    wait_for_rows(prefetcher, range(3, 7))
+
+    for chunk_y in range(3, 7):
+        prefetched = world.chunks.pop((0, chunk_y)).types
+        assert (world.get_chunk(0, chunk_y, None, None).types == prefetched).all()
+    assert not prefetcher.pending
+
+
+def test_faster_descent_predicts_more_rows():
+    prefetcher = ChunkPrefetcher(None, None)
+    resting = prefetcher.predicted_rows(0, 0, 1 / FRAMERATE)
+    falling = prefetcher.predicted_rows(0, 2000, 1 / FRAMERATE)
+    fast = prefetcher.predicted_rows(0, 2000, 1 / (FRAMERATE / 2))
+
+    assert len(resting) == prefetcher.rows_ahead
+    assert len(resting) < len(falling) < len(fast)
+    assert resting[0] == falling[0] == fast[0]
+
+
+def test_existing_and_passed_rows_are_kept():
+    existing = world.get_chunk(0, 4, None, None)
+    prefetcher = ChunkPrefetcher(None, None, budget_ms=100)
+    prefetcher.request(range(2, 6))
+    wait_for_rows(prefetcher, range(4, 6), min_chunk_y=4)
+
+    assert world.chunks[(0, 4)] is existing
+    assert (0, 5) in world.chunks
+    assert (0, 2) not in world.chunks and (0, 3) not in world.chunks
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Tests for presenting the internal surface at a reduced render scale
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import pygame
+
+from present import Presenter, create_presenter
+
+def make_internal():
+    internal_surface = pygame.Surface((360, 640))
+    internal_surface.fill((200, 30, 30))
+    return internal_surface
+
+def test_matching_sizes_are_blitted_unscaled():
+    internal_surface = make_internal()
+    screen = pygame.Surface((360, 640))
+    presenter = Presenter("smoothscale")
+    presenter.present(internal_surface, screen, (360, 640))
+    assert screen.get_at((100, 100))[:3] == (200, 30, 30)
+
+def test_frame_is_scaled_once_with_the_chosen_filter():
+    internal_surface = make_internal()
+    internal_surface.fill((30, 30, 200), (0, 0, 180, 640))
+    for present_filter in ("nearest", "smoothscale"):
+        screen = pygame.Surface((720, 1280))
+        presenter = Presenter(present_filter)
+        presenter.present(internal_surface, screen, (720, 1280))
+        assert screen.get_at((100, 600))[:3] == (30, 30, 200)
+        assert screen.get_at((600, 600))[:3] == (200, 30, 30)
+    edge = screen.get_at((360, 600))[:3]
+    assert edge not in ((30, 30, 200), (200, 30, 30))  # Blended by smoothscale
+
+def test_renderer_letterboxes_to_the_internal_ratio():
+    pygame.display.init()
+    presenter = create_presenter("sdl2", (180, 320), (360, 640))
+    assert presenter.overlay_on_frame
+    presenter.window.size = (400, 320)
+    presenter.flip(make_internal())
+    viewport = presenter.renderer.get_viewport()
+    assert viewport.size == (360, 640)
+    assert viewport.x > 0  # Bars at the sides of the wide window
+    presenter.window.destroy()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Tests for the layered render queue
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import pygame
+
+from render_queue import LAYERS, RenderQueue
+
+
+def make_sprite(color, size=(20, 20)):
+    sprite = pygame.Surface(size, pygame.SRCALPHA)
+    sprite.fill(color)
+    return sprite
+
+
+def test_layer_output_matches_direct_blits():
+    sprites = [(make_sprite((255, 0, 0, 255)), (10, 10)),
+               (make_sprite((0, 255, 0, 128)), pygame.Rect(15, 15, 20, 20)),
+               (make_sprite((0, 0, 255, 255), (40, 40)), (90.6, 30.2), (10, 10, 20, 20))]
+
+    expected = pygame.Surface((100, 80))
+    for sprite in sprites:
+        expected.blit(*sprite)
+
+    queue = RenderQueue((100, 80))
+    for sprite in sprites:
+        queue["world"].blit(*sprite)
+    result = pygame.Surface((100, 80))
+    queue.flush("world", result)
+
+    assert (pygame.surfarray.array3d(result) == pygame.surfarray.array3d(expected)).all()
+    assert not queue["world"].items
+
+
+def test_sprites_outside_viewport_are_culled():
+    queue = RenderQueue((100, 80))
+    layer = queue["effects"]
+    sprite = make_sprite((255, 255, 255, 255))
+
+    layer.blit(sprite, (-20, 0))
+    layer.blit(sprite, (100, 10))
+    layer.blit(sprite, (10, 80))
+    layer.blit(sprite, (-19, -19))  # One pixel visible
+    layer.blit(sprite, (50, 50), (0, 0, 5, 5))
+
+    assert len(layer.items) == 2
+    assert queue.stats()["effects"]["submitted"] == 5
+    assert queue.stats()["effects"]["culled"] == 3
+    assert list(queue.stats()) == list(LAYERS)
+
+
+def test_scaled_layer_draws_scaled_sprites_at_scaled_positions():
+    sprite = make_sprite((255, 0, 0, 255), (40, 40))
+    queue = RenderQueue((200, 100))
+    queue.set_scale(0.5)
+    assert queue.frame_size() == (100, 50)
+    assert queue["overlay"].scale == 1  # Drawn at the size of its own target
+
+    queue["world"].blit(sprite, (60, 20))
+    queue["world"].blit(sprite, (300, 20))  # Culled in internal resolution coordinates
+    frame = pygame.Surface(queue.frame_size())
+    queue.flush("world", frame)
+
+    assert queue["world"].culled == 1
+    assert frame.get_at((30, 10))[:3] == (255, 0, 0)
+    assert frame.get_at((49, 29))[:3] == (255, 0, 0)
+    assert frame.get_at((50, 30))[:3] == (0, 0, 0)
+    assert frame.get_at((29, 10))[:3] == (0, 0, 0)
+
+
+def test_scaled_layer_never_shows_stale_pixels():
+    sprite = make_sprite((255, 0, 0, 255), (40, 40))
+    queue = RenderQueue((200, 100))
+    queue.set_scale(0.5)
+    frame = pygame.Surface(queue.frame_size())
+
+    queue["world"].blit(sprite, (0, 0))
+    queue.flush("world", frame)
+    sprite.fill((0, 255, 0, 255))  # Changed in place, plain blits are scaled again
+    queue["world"].blit(sprite, (0, 0))
+    queue.flush("world", frame)
+    assert frame.get_at((10, 10))[:3] == (0, 255, 0)
+
+    # Named textures reuse the scaled copy made for their name
+    queue["world"].blit_texture("test_texture", sprite, (0, 0))
+    queue["world"].blit_texture("test_texture", make_sprite((0, 0, 255, 255), (40, 40)), (0, 0))
+    queue.flush("world", frame)
+    assert frame.get_at((10, 10))[:3] == (0, 255, 0)
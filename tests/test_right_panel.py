@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Tests for the cached right panel
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import pygame
+
+from notifications import RightPanel
+
+
+def test_panel_text_is_rendered_again_only_when_the_ranking_changes():
+    pygame.init()
+    panel = RightPanel()
+    panel.texture_cache_loaded = True  # Draw without the reward icons
+    screen = pygame.Surface((540, 960))
+
+    panel.add_player_activity("alice")
+    panel.draw(screen, 540, 960)
+    background, content = panel.background, panel.content
+    panel.add_player_activity("alice")  # Same ranking
+    panel.draw(screen, 540, 960)
+    assert panel.background is background and panel.content is content
+
+    panel.add_player_activity("bob")
+    panel.draw(screen, 540, 960)
+    assert panel.background is background and panel.content is not content
+
+    panel.draw(screen, 540, 1000)
+    assert panel.background is not background
+
+
+def test_fixed_labels_stay_in_the_background_when_a_subscriber_shows_up():
+    pygame.init()
+    panel = RightPanel()
+    screen = pygame.Surface((540, 960))
+
+    panel.draw(screen, 540, 960)
+    background = panel.background
+    assert panel.content is None  # No players or subscriber yet
+
+    panel.recent_subscriber = "alice"
+    panel.subscriber_display_timer = pygame.time.get_ticks() + 15000
+    panel.draw(screen, 540, 960)
+    assert panel.background is background
+    assert panel.content is not None
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Tests for world-coordinate block queries
+"""
+
+import math
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import chunk as world
+from constants import BLOCK_SIZE, CHUNK_HEIGHT, CHUNK_WIDTH
+from spatial import block_at, blocks_in_radius, query_range, world_to_cell
+
+
+def setup_function():
+    world.chunks.clear()
+    for chunk_y in range(0, 4):
+        world.get_chunk(0, chunk_y, None, None)
+
+
+def test_world_to_cell():
+    assert world_to_cell(0, 0) == (0, 0, 0, 0)
+    assert world_to_cell(BLOCK_SIZE * 10 + 5, BLOCK_SIZE * 17 + 5) == (1, 1, 1, 1)
+    assert world_to_cell(-1, BLOCK_SIZE * CHUNK_HEIGHT - 1) == (-1, 0, CHUNK_WIDTH - 1, CHUNK_HEIGHT - 1)
+
+
+def test_block_at():
+    block = block_at(6.5 * BLOCK_SIZE, (CHUNK_HEIGHT - 2) * BLOCK_SIZE + 1)
+    assert (block.x, block.y, block.name) == (6, CHUNK_HEIGHT - 2, "grass_block")
+    assert block_at(4.5 * BLOCK_SIZE, 5.5 * BLOCK_SIZE) is None  # Air in the first chunk
+
+
+def test_range_only_returns_overlapping_cells():
+    left, top = 7.5 * BLOCK_SIZE, 30.5 * BLOCK_SIZE
+    right, bottom = 10.2 * BLOCK_SIZE, 33.9 * BLOCK_SIZE
+    cells = set()
+    for chunk, ys, xs in query_range(left, top, right, bottom):
+        cells.update((chunk.chunk_x * CHUNK_WIDTH + x, chunk.chunk_y * CHUNK_HEIGHT + y) for x, y in zip(xs, ys))
+    assert cells == {(x, y) for x in range(7, 9) for y in range(30, 34)}  # Nothing beyond the side wall
+
+
+def test_radius_matches_full_scan():
+    center = (2.2 * BLOCK_SIZE, 31.7 * BLOCK_SIZE)
+    radius = 3 * BLOCK_SIZE
+    expected = set()
+    for chunk in world.chunks.values():
+        for block in chunk.iter_blocks():
+            distance = math.hypot(block.position[0] - center[0], block.position[1] - center[1])
+            if distance <= radius:
+                expected.add((chunk.chunk_x, chunk.chunk_y, block.x, block.y, round(distance, 6)))
+
+    found = {(block.chunk.chunk_x, block.chunk.chunk_y, block.x, block.y, round(distance, 6))
+             for block, distance in blocks_in_radius(center[0], center[1], radius)}
+    assert found == expected
+    assert {chunk_y for _, chunk_y, *_ in found} == {1, 2}  # Crosses a chunk boundary
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Tests for the rotation sprite cache and TNT blink frames
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import pygame
+
+from sprite_cache import BLINK_LEVELS, RotationCache, get_blink_frames
+
+
+def make_texture(size=16):
+    texture = pygame.Surface((size, size), pygame.SRCALPHA)
+    texture.fill((200, 30, 30, 255))
+    return texture
+
+
+def test_angles_are_quantized():
+    cache = RotationCache(step=2)
+    texture = make_texture()
+
+    first = cache.get("red", texture, 10.4)
+    assert cache.get("red", texture, 9.6) is first
+    assert cache.get("red", texture, 370.2) is first
+    assert cache.get("red", texture, 12) is not first
+    assert cache.get("red", make_texture(), 10) is first  # Keyed by name, not by surface
+    assert cache.get("other", texture, 10) is not first
+    assert (cache.hits, cache.misses) == (3, 3)
+
+
+def test_least_recently_used_sprites_are_evicted():
+    texture = make_texture()
+    sprite_bytes = 4 * 16 * 16
+    cache = RotationCache(step=90, max_bytes=2 * sprite_bytes)
+
+    upright = cache.get("red", texture, 0)
+    cache.get("red", texture, 180)
+    cache.get("red", texture, 0)  # Now the most recently used
+    cache.get("red", texture, 360 - 90)
+
+    assert len(cache.sprites) == 2
+    assert cache.bytes == 2 * sprite_bytes
+    assert cache.get("red", texture, 0) is upright
+    assert cache.stats()["misses"] == 3
+
+
+def test_budget_is_never_exceeded():
+    cache = RotationCache(step=1, max_bytes=5000)
+    texture = make_texture()
+    for angle in range(0, 90, 5):
+        cache.get("red", texture, angle)  # Rotated sprites grow up to 23x23 pixels
+        assert cache.bytes <= cache.max_bytes
+    assert cache.bytes == sum(size for _, size in cache.sprites.values())
+
+    cache.get("big", make_texture(64), 0)  # Larger than the whole budget: returned but not cached
+    assert ("big", 0) not in cache.sprites
+    assert cache.bytes <= cache.max_bytes
+
+
+def test_blink_frames_are_shared_and_tinted():
+    texture = make_texture()
+    frames = get_blink_frames("test_tnt", texture)
+
+    assert len(frames) == BLINK_LEVELS
+    assert get_blink_frames("test_tnt", make_texture()) is frames
+    assert frames[0].get_at((0, 0))[:3] == (200, 30, 30)
+    brightest = frames[-1].get_at((0, 0))
+    assert brightest[0] > 200 and brightest[1] > 150 and brightest[2] > 150
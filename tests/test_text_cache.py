@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared text surface cache
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import pygame
+
+from hud import render_text_with_outline
+from text_cache import TextCache, text_cache
+
+
+def test_cached_surfaces_are_reused_and_evicted():
+    cache = TextCache(max_entries=2)
+
+    def render(text):
+        surface = pygame.Surface((len(text), 1))
+        return lambda: surface
+
+    first = cache.get("a", render("a"))
+    assert cache.get("a", render("a")) is first
+    cache.get("b", render("b"))
+    cache.get("a", render("a"))  # "a" is now the most recently used
+    cache.get("c", render("c"))  # Evicts "b"
+    assert list(cache.surfaces) == ["a", "c"]
+    assert (cache.hits, cache.misses) == (2, 3)
+
+
+def test_outline_text_is_keyed_by_color_and_font():
+    pygame.font.init()
+    font = pygame.font.Font(None, 24)
+    white = render_text_with_outline("42", font, (255, 255, 255), (0, 0, 0))
+    assert render_text_with_outline("42", font, (255, 255, 255), (0, 0, 0)) is white
+    assert render_text_with_outline("42", font, (255, 0, 0), (0, 0, 0)) is not white
+    assert render_text_with_outline("42", pygame.font.Font(None, 30), (255, 255, 255), (0, 0, 0)) is not white
+    text_cache.clear()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Tests for seeded, vectorized world generation
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import numpy as np
+
+import chunk as world
+from block import BLOCK_IDS, BLOCK_NAMES
+from constants import CHUNK_HEIGHT, CHUNK_WIDTH
+from worldgen import block_weights, generate_chunk_types, noise_ranges, noise_to_block_ids
+
+
+def test_same_seed_and_coordinate_give_same_chunk():
+    assert (generate_chunk_types(7) == generate_chunk_types(7)).all()
+    assert not (generate_chunk_types(7) == generate_chunk_types(8)).all()
+    assert not (generate_chunk_types(7, seed=1) == generate_chunk_types(7, seed=2)).all()
+
+
+def test_batch_matches_single_chunks():
+    batch = generate_chunk_types(3, count=4)
+    assert batch.shape == (4, CHUNK_HEIGHT, CHUNK_WIDTH)
+    for index in range(4):
+        assert (batch[index] == generate_chunk_types(3 + index)[0]).all()
+
+
+def test_regenerated_chunk_is_identical():
+    world.chunks.clear()
+    first = world.get_chunk(0, 5, None, None).types.copy()
+    del world.chunks[(0, 5)]
+    assert (world.get_chunk(0, 5, None, None).types == first).all()
+
+
+def test_bedrock_walls():
+    types = generate_chunk_types(1, count=8)
+    assert (types[:, :, 0] == BLOCK_IDS["bedrock"]).all()
+    assert (types[:, :, CHUNK_WIDTH - 1] == BLOCK_IDS["bedrock"]).all()
+
+
+def test_lookup_table_matches_noise_ranges():
+    values = np.linspace(-1, 1, 2001, endpoint=False)
+    for value, block_id in zip(values, noise_to_block_ids(values)):
+        expected = next(block for block, min_val, max_val in noise_ranges if min_val <= value < max_val)
+        assert BLOCK_NAMES[block_id] == expected
+
+
+def test_block_frequencies_follow_weights():
+    types = generate_chunk_types(1, count=400)[:, :, 1:CHUNK_WIDTH - 1]
+    total_weight = sum(block_weights.values())
+    for block, weight in block_weights.items():
+        frequency = (types == BLOCK_IDS[block]).mean()
+        assert abs(frequency - weight / total_weight) < 0.01, block